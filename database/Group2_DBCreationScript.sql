@@ -114,7 +114,7 @@ CREATE TABLE pets (
     weight_kg DECIMAL(6,2) NOT NULL,
     muzzle_required TINYINT(1) NOT NULL,
     notes TEXT,
-    CONSTRAINT fk_pet_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id),
+    CONSTRAINT fk_pet_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id) ON DELETE CASCADE,
     CONSTRAINT fk_pet_size FOREIGN KEY (actual_size_id) REFERENCES size_category(size_id)
 );
 
@@ -149,7 +149,7 @@ CREATE TABLE pet_breed_junction (
     pet_id INT NOT NULL,
     breed_id INT NOT NULL,
     CONSTRAINT pk_pet_breed PRIMARY KEY (pet_id, breed_id),
-    CONSTRAINT fk_pbj_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id),
+    CONSTRAINT fk_pbj_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
     CONSTRAINT fk_pbj_breed FOREIGN KEY (breed_id) REFERENCES breeds(breed_id)
 );
 
@@ -191,9 +191,9 @@ CREATE TABLE event_registration (
     status VARCHAR(20) NOT NULL,
     transfer_destination INT NULL,
     cancellation_date DATE NULL,
-    CONSTRAINT fk_reg_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id),
+    CONSTRAINT fk_reg_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id) ON DELETE CASCADE,
     CONSTRAINT fk_reg_event FOREIGN KEY (event_id) REFERENCES events(event_id),
-    CONSTRAINT fk_reg_transfer FOREIGN KEY (transfer_destination) REFERENCES event_registration(registration_id)
+    CONSTRAINT fk_reg_transfer FOREIGN KEY (transfer_destination) REFERENCES event_registration(registration_id) ON DELETE SET NULL
 );
 
 INSERT INTO event_registration (registration_id, owner_id, event_id, registration_date, total_amount_paid, payment_date, payment_time, status, transfer_destination, cancellation_date) VALUES
@@ -232,8 +232,8 @@ CREATE TABLE pet_event_entry (
     event_id INT NOT NULL,
     attendance_status VARCHAR(20) NOT NULL,
     pet_result DECIMAL(4,2) NULL,
-    CONSTRAINT fk_entry_reg FOREIGN KEY (registration_id) REFERENCES event_registration(registration_id),
-    CONSTRAINT fk_entry_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id),
+    CONSTRAINT fk_entry_reg FOREIGN KEY (registration_id) REFERENCES event_registration(registration_id) ON DELETE CASCADE,
+    CONSTRAINT fk_entry_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
     CONSTRAINT fk_entry_event FOREIGN KEY (event_id) REFERENCES events(event_id),
     CONSTRAINT unique_pet_event UNIQUE (pet_id, event_id)
 );
@@ -269,7 +269,7 @@ CREATE TABLE awards (
     description TEXT,
     date DATE NOT NULL,
     event_id INT NOT NULL,
-    CONSTRAINT fk_award_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id),
+    CONSTRAINT fk_award_pet FOREIGN KEY (pet_id) REFERENCES pets(pet_id) ON DELETE CASCADE,
     CONSTRAINT fk_award_event FOREIGN KEY (event_id) REFERENCES events(event_id)
 );
 
@@ -302,7 +302,7 @@ CREATE TABLE participation_log (
     reason TEXT,
     refund_amount DECIMAL(8,2),
     top_up_amount DECIMAL(8,2),
-    CONSTRAINT fk_log_reg FOREIGN KEY (registration_id) REFERENCES event_registration(registration_id),
+    CONSTRAINT fk_log_reg FOREIGN KEY (registration_id) REFERENCES event_registration(registration_id) ON DELETE CASCADE,
     CONSTRAINT fk_log_orig_event FOREIGN KEY (original_event_id) REFERENCES events(event_id),
     CONSTRAINT fk_log_new_event FOREIGN KEY (new_event_id) REFERENCES events(event_id)
 );
@@ -363,7 +363,7 @@ CREATE TABLE owner_log (
     last_name VARCHAR(50) NOT NULL,
     email TEXT,
     contact_number TEXT,
-    CONSTRAINT fk_ownerlog_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id)
+    CONSTRAINT fk_ownerlog_owner FOREIGN KEY (owner_id) REFERENCES owners(owner_id) ON DELETE CASCADE
 );
 
 INSERT INTO owner_log (owner_id, username, password, first_name, last_name, email, contact_number) VALUES
@@ -384,6 +384,118 @@ INSERT INTO owner_log (owner_id, username, password, first_name, last_name, emai
 (15, 'paulserrano', 'paul', 'Paul', 'Serrano', 'paul.serrano@example.com', '09311234567'),
 (16, 'raphaelgonda', 'raphael', 'Raphael', 'Gonda', 'raphael.gonda@example.com', '09967676767');
 
+-- Hi-lo key allocator state: the app reserves blocks of ids from here instead of MAX(id) + 1
+CREATE TABLE id_sequences (
+    sequence_name VARCHAR(64) NOT NULL PRIMARY KEY,
+    next_id INT NOT NULL
+);
+
+INSERT INTO id_sequences (sequence_name, next_id)
+SELECT 'owners', COALESCE(MAX(owner_id), 0) + 1 FROM owners
+UNION ALL SELECT 'admin_log', COALESCE(MAX(admin_id), 0) + 1 FROM admin_log
+UNION ALL SELECT 'pets', COALESCE(MAX(pet_id), 0) + 1 FROM pets
+UNION ALL SELECT 'breeds', COALESCE(MAX(breed_id), 0) + 1 FROM breeds
+UNION ALL SELECT 'event_registration', COALESCE(MAX(registration_id), 0) + 1 FROM event_registration
+UNION ALL SELECT 'pet_event_entry', COALESCE(MAX(entry_id), 0) + 1 FROM pet_event_entry
+UNION ALL SELECT 'participation_log', COALESCE(MAX(log_id), 0) + 1 FROM participation_log
+UNION ALL SELECT 'awards', COALESCE(MAX(award_id), 0) + 1 FROM awards;
+
+-- Versioned migrations applied by main.py (run_migrations); this script already includes versions 1-6
+CREATE TABLE schema_version (
+    version INT NOT NULL PRIMARY KEY,
+    description VARCHAR(255) NOT NULL,
+    applied_at DATETIME NOT NULL
+);
+
+CREATE INDEX idx_reg_owner_event_status ON event_registration (owner_id, event_id, status);
+CREATE INDEX idx_entry_registration ON pet_event_entry (registration_id);
+CREATE INDEX idx_entry_event_attendance ON pet_event_entry (event_id, attendance_status);
+CREATE INDEX idx_log_date_action ON participation_log (action_date, action_type);
+CREATE INDEX idx_awards_event_special ON awards (event_id, is_special);
+CREATE INDEX idx_awards_date ON awards (date);
+CREATE INDEX idx_log_keyset ON participation_log (action_date, action_time, log_id);
+
+-- Per-event participant counters; enroll/transfer/withdraw update them under a row lock
+CREATE TABLE event_capacity (
+    event_id INT NOT NULL PRIMARY KEY,
+    max_participants INT NOT NULL,
+    participants INT NOT NULL DEFAULT 0
+);
+
+INSERT INTO event_capacity (event_id, max_participants, participants)
+SELECT e.event_id, e.max_participants,
+       (SELECT COUNT(DISTINCT pee.pet_id)
+        FROM event_registration er
+        JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+        WHERE er.event_id = e.event_id AND er.status = 'Paid')
+FROM events e;
+
+-- Refund tiers per event, per event type, or the default (event_id and event_type both NULL)
+CREATE TABLE refund_policy_tier (
+    tier_id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    event_id INT NULL,
+    event_type VARCHAR(100) NULL,
+    min_days_before INT NOT NULL,
+    refund_percent DECIMAL(5,2) NOT NULL,
+    INDEX idx_refund_tier_event (event_id),
+    CONSTRAINT fk_refund_tier_event FOREIGN KEY (event_id) REFERENCES events(event_id) ON DELETE CASCADE
+);
+
+INSERT INTO refund_policy_tier (event_id, event_type, min_days_before, refund_percent) VALUES
+(NULL, NULL, 14, 100.00),
+(NULL, NULL, 4, 50.00);
+
+-- Finance totals per event and day; enroll/transfer/withdraw post deltas, --reconcile-finance checks them
+CREATE TABLE finance_rollup (
+    event_id INT NOT NULL,
+    day DATE NOT NULL,
+    registrations INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    top_ups DECIMAL(12,2) NOT NULL DEFAULT 0,
+    refunds DECIMAL(12,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (event_id, day),
+    INDEX idx_finance_day (day)
+);
+
+INSERT INTO finance_rollup (event_id, day, registrations, revenue, top_ups, refunds)
+SELECT event_id, day, SUM(registrations), SUM(revenue), SUM(top_ups), SUM(refunds)
+FROM (
+    SELECT er.event_id, CAST(COALESCE(er.payment_date, er.registration_date) AS DATE) AS day,
+           COUNT(*) AS registrations, COALESCE(SUM(er.total_amount_paid), 0) AS revenue,
+           0 AS top_ups, 0 AS refunds
+    FROM event_registration er
+    GROUP BY er.event_id, CAST(COALESCE(er.payment_date, er.registration_date) AS DATE)
+    UNION ALL
+    SELECT pl.new_event_id, CAST(pl.action_date AS DATE), 0, 0, SUM(pl.top_up_amount), 0
+    FROM participation_log pl
+    WHERE pl.action_type = 'Transferred' AND pl.top_up_amount > 0
+    GROUP BY pl.new_event_id, CAST(pl.action_date AS DATE)
+    UNION ALL
+    SELECT pl.original_event_id, CAST(pl.action_date AS DATE), 0, 0, 0, SUM(pl.refund_amount)
+    FROM participation_log pl
+    WHERE pl.action_type = 'Cancelled' AND pl.refund_amount > 0
+    GROUP BY pl.original_event_id, CAST(pl.action_date AS DATE)
+) AS ledger
+WHERE event_id IS NOT NULL AND day IS NOT NULL
+GROUP BY event_id, day;
+
+INSERT INTO schema_version (version, description, applied_at) VALUES
+(1, 'Secondary indexes for hot queries', NOW()),
+(2, 'Participation log keyset index', NOW()),
+(3, 'Per-event capacity counters', NOW()),
+(4, 'Cascade owner removal through foreign keys', NOW()),
+(5, 'Table-driven refund policy', NOW()),
+(6, 'Finance rollups', NOW());
+
+-- Lets main.py skip its bootstrap on launch when the seed data is already current
+CREATE TABLE app_state (
+    state_key VARCHAR(50) NOT NULL PRIMARY KEY,
+    state_value VARCHAR(100) NOT NULL
+);
+
+INSERT INTO app_state (state_key, state_value) VALUES
+('seed_version', '1');
+
 USE pet_show;
 
 SELECT *
@@ -1,9 +1,20 @@
+import os
+import re
 import sys
-from datetime import datetime, date
+import csv
+import bisect
+import hashlib
+import importlib.util
+import io
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
 import mysql.connector
 from mysql.connector import Error
-from PyQt6.uic import loadUi
-from PyQt6 import QtWidgets, QtCore
+from mysql.connector.errors import PoolError
+from PyQt6.uic import loadUi, compileUi
+from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtWidgets import QDialog, QApplication, QWidget, QStackedWidget
 
 DB_CONFIG = {
@@ -13,6 +24,17 @@ DB_CONFIG = {
     'database': 'pet_show'
 }
 
+# Bump whenever the seed rows in bootstrap_database() change
+SEED_VERSION = 1
+
+# Connection pool knobs used by get_db_connection()
+DB_POOL_CONFIG = {
+    'pool_size': 5,           # max open connections
+    'checkout_timeout': 10.0, # seconds to wait for a free connection before giving up
+    'ping_interval': 30.0,    # idle seconds before a connection is pinged on checkout
+    'reset_session': True     # clear session state/transactions when a connection comes back
+}
+
 _OWNER_CONTEXT_TEMPLATE = {
     'owner_id': None,
     'username': None,
@@ -64,18 +86,337 @@ def update_active_owner_details(**kwargs):
         if key in ACTIVE_OWNER and value is not None:
             ACTIVE_OWNER[key] = value
             
-def get_db_connection():
-    """Open a MySQL connection using the config above."""
-    try:
-        conn = mysql.connector.connect(**DB_CONFIG)
+class PooledConnection:
+    """Wraps a pooled MySQL connection so close() hands it back instead of hanging up."""
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get('_raw')
+        if raw is None:
+            raise PoolError("Connection was already returned to the pool.")
+        return getattr(raw, name)
+
+    def close(self):
+        """Return the connection to the pool (safe to call more than once)."""
+        raw = self._raw
+        if raw is None:
+            return
+        self._raw = None
+        self._pool.release(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections that get_db_connection() checks out from."""
+
+    def __init__(self, config, pool_size=5, checkout_timeout=10.0, ping_interval=30.0, reset_session=True):
+        self.config = dict(config)
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.ping_interval = ping_interval
+        self.reset_session = reset_session
+        self._idle = []  # (raw connection, last time it was handed back)
+        self._open = 0   # idle + checked out
+        self._cond = threading.Condition()
+        self._stats = {
+            'checkouts': 0,
+            'created': 0,
+            'reconnects': 0,
+            'discarded': 0,
+            'timeouts': 0,
+            'waits': 0,
+            'total_wait_ms': 0.0,
+            'peak_in_use': 0,
+        }
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self.config)
         if conn.is_connected():
             conn.autocommit = False
         return conn
+
+    def _is_healthy(self, raw, last_used):
+        """Ping connections that sat idle for a while; trust recently used ones."""
+        if time.monotonic() - last_used < self.ping_interval:
+            return True
+        try:
+            raw.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def _discard(self, raw):
+        try:
+            raw.close()
+        except Error:
+            pass
+        with self._cond:
+            self._open -= 1
+            self._stats['discarded'] += 1
+            self._cond.notify()
+
+    def acquire(self):
+        """Check out a connection, waiting up to checkout_timeout when the pool is exhausted."""
+        started = time.monotonic()
+        deadline = started + self.checkout_timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._idle:
+                    raw, last_used = self._idle.pop()
+                    break
+                if self._open < self.pool_size:
+                    self._open += 1
+                    raw, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolError(
+                        f"No free database connection after {self.checkout_timeout:.0f}s "
+                        f"(pool size {self.pool_size})."
+                    )
+                if not waited:
+                    self._stats['waits'] += 1
+                    waited = True
+                self._cond.wait(remaining)
+
+        if raw is not None and not self._is_healthy(raw, last_used):
+            self._discard(raw)
+            with self._cond:
+                self._open += 1
+                self._stats['reconnects'] += 1
+            raw = None
+
+        if raw is None:
+            try:
+                raw = self._connect()
+            except Error:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._stats['created'] += 1
+
+        with self._cond:
+            self._stats['checkouts'] += 1
+            self._stats['total_wait_ms'] += (time.monotonic() - started) * 1000.0
+            in_use = self._open - len(self._idle)
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], in_use)
+        return PooledConnection(self, raw)
+
+    def release(self, raw):
+        """Take a connection back, wiping any leftover transaction/session state first."""
+        try:
+            if self.reset_session:
+                raw.cmd_reset_connection()
+                raw.autocommit = False
+            else:
+                raw.rollback()
+        except Error as err:
+            print(f"Dropping pooled connection that failed to reset: {err}")
+            self._discard(raw)
+            return
+        with self._cond:
+            self._idle.append((raw, time.monotonic()))
+            self._cond.notify()
+
+    def close_all(self):
+        """Hang up every idle connection (used on shutdown)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for raw, _ in idle:
+            try:
+                raw.close()
+            except Error:
+                pass
+
+    def stats(self):
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot.update({
+                'pool_size': self.pool_size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._open - len(self._idle),
+            })
+        checkouts = snapshot['checkouts'] or 1
+        snapshot['avg_wait_ms'] = snapshot['total_wait_ms'] / checkouts
+        return snapshot
+
+
+_DB_POOL = None
+_DB_POOL_LOCK = threading.Lock()
+
+
+def get_db_pool():
+    """Create the shared connection pool on first use."""
+    global _DB_POOL
+    with _DB_POOL_LOCK:
+        if _DB_POOL is None:
+            _DB_POOL = ConnectionPool(DB_CONFIG, **DB_POOL_CONFIG)
+        return _DB_POOL
+
+
+def get_pool_stats():
+    """Snapshot of pool counters (checkouts, waits, timeouts, reconnects, ...)."""
+    return get_db_pool().stats()
+
+
+def close_db_pool():
+    """Close idle pooled connections, e.g. when the app exits."""
+    if _DB_POOL is not None:
+        _DB_POOL.close_all()
+
+
+def get_db_connection():
+    """Check out a pooled MySQL connection; conn.close() hands it back to the pool."""
+    try:
+        return get_db_pool().acquire()
+    except Error as err:
+        print(f"MySQL Connection Error: {err}")
+        return None
+
+
+def get_streaming_connection():
+    """A connection of its own, outside the pool, for long unbuffered reads (report exports).
+
+    It never goes back to the pool, so a long export doesn't hold a pool slot and a read
+    abandoned halfway can't leave a pooled connection mid-result. Close it when done.
+    """
+    try:
+        return mysql.connector.connect(**DB_CONFIG)
     except Error as err:
         print(f"MySQL Connection Error: {err}")
         return None
 
 
+def stop_running_query(conn):
+    """Ask the server (over a pooled connection) to stop whatever `conn` is running."""
+    killer = get_db_connection()
+    if not killer:
+        return
+    try:
+        killer.cursor().execute("KILL QUERY %s", (conn.connection_id,))
+    except Error as err:
+        print(f"Error stopping query: {err}")
+    finally:
+        killer.close()
+
+
+# Primary-key sequences handed out by the ID allocator: name -> (table, id column)
+ID_SEQUENCES = {
+    'owners': ('owners', 'owner_id'),
+    'admin_log': ('admin_log', 'admin_id'),
+    'pets': ('pets', 'pet_id'),
+    'breeds': ('breeds', 'breed_id'),
+    'event_registration': ('event_registration', 'registration_id'),
+    'pet_event_entry': ('pet_event_entry', 'entry_id'),
+    'participation_log': ('participation_log', 'log_id'),
+    'awards': ('awards', 'award_id')
+}
+ID_BLOCK_SIZE = 20
+
+
+class IdAllocator:
+    """Hi-lo key allocator: reserves blocks of ids from id_sequences and hands them out locally.
+
+    Reserving a block is one atomic UPDATE on its own short transaction, so two kiosks
+    can never receive the same id and most inserts need no extra round trip at all.
+
+    A refill checks out a pooled connection of its own, so take ids before checking out the
+    connection that inserts them. Refilling from inside a write transaction would hold its row
+    locks (and its connection) while waiting on the pool.
+    """
+
+    def __init__(self, block_size=ID_BLOCK_SIZE):
+        self.block_size = block_size
+        self._blocks = {}  # sequence name -> (next id, end of block)
+        self._lock = threading.Lock()
+
+    def next_id(self, name):
+        return self.next_ids(name, 1)[0]
+
+    def next_ids(self, name, count):
+        """Return `count` fresh ids for the given sequence."""
+        if name not in ID_SEQUENCES:
+            raise ValueError(f"Unknown id sequence: {name}")
+        ids = []
+        with self._lock:
+            while len(ids) < count:
+                start, end = self._blocks.get(name, (0, 0))
+                if start >= end:
+                    start, end = self._reserve(name, max(self.block_size, count - len(ids)))
+                take = min(end - start, count - len(ids))
+                ids.extend(range(start, start + take))
+                self._blocks[name] = (start + take, end)
+        return ids
+
+    def _reserve(self, name, size):
+        """Bump the shared counter by `size` and return the reserved [start, end) range."""
+        conn = get_db_connection()
+        if not conn:
+            raise Error("Database connection failed while reserving ids.")
+        try:
+            cursor = conn.cursor()
+            for _ in range(2):
+                cursor.execute("""
+                    UPDATE id_sequences
+                    SET next_id = LAST_INSERT_ID(next_id + %s)
+                    WHERE sequence_name = %s
+                """, (size, name))
+                if cursor.rowcount:
+                    end = cursor.lastrowid
+                    conn.commit()
+                    return end - size, end
+                # Sequence row missing (older database) - seed it from the table itself
+                table, column = ID_SEQUENCES[name]
+                cursor.execute(f"""
+                    INSERT IGNORE INTO id_sequences (sequence_name, next_id)
+                    SELECT %s, COALESCE(MAX({column}), 0) + 1 FROM {table}
+                """, (name,))
+                conn.commit()
+            raise Error(f"Could not reserve ids for sequence '{name}'.")
+        except Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+ID_ALLOCATOR = IdAllocator()
+
+
+def allocate_id(name):
+    """Next primary key for one of the ID_SEQUENCES tables."""
+    return ID_ALLOCATOR.next_id(name)
+
+
+def allocate_ids(name, count):
+    """Several primary keys at once (e.g. one per pet in a transfer)."""
+    return ID_ALLOCATOR.next_ids(name, count)
+
+
+def sync_id_sequences(cursor):
+    """Make sure every sequence row exists and is ahead of the rows already in its table."""
+    for name, (table, column) in ID_SEQUENCES.items():
+        cursor.execute(f"""
+            INSERT INTO id_sequences (sequence_name, next_id)
+            SELECT %s, COALESCE(MAX({column}), 0) + 1 FROM {table}
+            ON DUPLICATE KEY UPDATE next_id = GREATEST(next_id, VALUES(next_id))
+        """, (name,))
+
+
 def to_python_date(value):
     """Try to turn whatever this is into a plain date."""
     if value is None:
@@ -100,8 +441,8 @@ def format_date_string(value):
         return parsed.strftime("%Y-%m-%d")
     return str(value) if value not in (None, '') else ''
 
-def setup_database():
-   
+def bootstrap_database():
+    """Full provisioning: create every table, send the seed rows and run migrations."""
     conn = get_db_connection()
     if conn:
         try:
@@ -286,6 +627,22 @@ def setup_database():
             )
             """)
            
+            # app_state (what this database was provisioned with)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS app_state (
+                state_key VARCHAR(50) NOT NULL PRIMARY KEY,
+                state_value VARCHAR(100) NOT NULL
+            )
+            """)
+
+            # id_sequences (hi-lo key allocator state)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS id_sequences (
+                sequence_name VARCHAR(64) NOT NULL PRIMARY KEY,
+                next_id INT NOT NULL
+            )
+            """)
+           
             # size_category
             cursor.executemany("INSERT IGNORE INTO size_category (size_id, size_name) VALUES (%s, %s)", [
                 (1, 'Small'), (2, 'Medium'), (3, 'Large')
@@ -421,8 +778,28 @@ def setup_database():
                 (15, 15, 'Paid', '2025-11-13', '17:05:00', 9, None, '', 0.00, 0.00)
             ])
 
+            # Keep the id allocator ahead of the seeded rows
+            sync_id_sequences(cursor)
+
             conn.commit()
             print("Database setup complete with 10 tables and initial data.")
+
+            # Bring the schema up to the latest migration
+            ran = run_migrations(conn)
+
+            # Reseeding may have added entries the counters haven't seen. On a fresh database
+            # migrations 3 (event_capacity) and 6 (finance_rollup) just filled them from these rows
+            if 3 not in ran:
+                resync_event_capacity(cursor)
+            if 6 not in ran:
+                rebuild_finance_rollups(cursor)
+
+            # Record the seed version so the next launch can skip all of this
+            cursor.execute("""
+                INSERT INTO app_state (state_key, state_value) VALUES ('seed_version', %s)
+                ON DUPLICATE KEY UPDATE state_value = VALUES(state_value)
+            """, (str(SEED_VERSION),))
+            conn.commit()
         except Error as e:
             print(f"Database setup error: {e}")
         finally:
@@ -430,179 +807,1712 @@ def setup_database():
                 conn.close()
 
 # --------------------------------------------------------------------------------------------------------------------
+# Schema migrations
+
+# Prefix length used when an indexed column is TEXT (older setup_database() schemas)
+TEXT_INDEX_PREFIX = 32
+_TEXT_TYPES = ('tinytext', 'text', 'mediumtext', 'longtext', 'blob')
+
+
+def _ensure_index(cursor, table, index_name, columns):
+    """Create an index unless an equivalent one (same leading columns) already exists."""
+    cursor.execute("""
+        SELECT INDEX_NAME, GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX)
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        GROUP BY INDEX_NAME
+    """, (table,))
+    for existing_name, existing_cols in cursor.fetchall():
+        existing = existing_cols.split(',') if existing_cols else []
+        if existing_name == index_name or existing[:len(columns)] == list(columns):
+            return False
 
-class RegisterScreen(QDialog):
-    def __init__(self):
-        super(RegisterScreen, self).__init__()
-        loadUi('./gui/registerscreen.ui', self) 
-        clear_active_owner()
-        self.loginbutt.clicked.connect(self.gotologin)
-        self.exitbutt.clicked.connect(self.quit_application)
+    cursor.execute("""
+        SELECT COLUMN_NAME, DATA_TYPE
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    types = {name: data_type.lower() for name, data_type in cursor.fetchall()}
+    parts = []
+    for column in columns:
+        if types.get(column) in _TEXT_TYPES:
+            parts.append(f"{column}({TEXT_INDEX_PREFIX})")
+        else:
+            parts.append(column)
+    cursor.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(parts)})")
+    return True
+
+
+def _migration_001_hot_query_indexes(cursor):
+    """Secondary indexes for the filters the screens hit on every load."""
+    _ensure_index(cursor, 'event_registration', 'idx_reg_owner_event_status', ['owner_id', 'event_id', 'status'])
+    _ensure_index(cursor, 'pet_event_entry', 'idx_entry_registration', ['registration_id'])
+    _ensure_index(cursor, 'pet_event_entry', 'idx_entry_event_attendance', ['event_id', 'attendance_status'])
+    _ensure_index(cursor, 'participation_log', 'idx_log_date_action', ['action_date', 'action_type'])
+    _ensure_index(cursor, 'awards', 'idx_awards_event_special', ['event_id', 'is_special'])
+    _ensure_index(cursor, 'awards', 'idx_awards_date', ['date'])
+
+
+def _migration_002_log_keyset_index(cursor):
+    """Index matching the participation log's keyset page order."""
+    _ensure_index(cursor, 'participation_log', 'idx_log_keyset', ['action_date', 'action_time', 'log_id'])
+
+
+def _migration_003_event_capacity(cursor):
+    """Per-event participant counters, kept up to date by the enrollment transactions."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS event_capacity (
+        event_id INT NOT NULL PRIMARY KEY,
+        max_participants INT NOT NULL,
+        participants INT NOT NULL DEFAULT 0
+    )
+    """)
+    resync_event_capacity(cursor)
+
+
+# Foreign keys that carry an owner's removal down to everything they own:
+# (table, column, referenced table, referenced column, ON DELETE rule)
+OWNER_CASCADE_RULES = [
+    ('pets', 'owner_id', 'owners', 'owner_id', 'CASCADE'),
+    ('event_registration', 'owner_id', 'owners', 'owner_id', 'CASCADE'),
+    ('owner_log', 'owner_id', 'owners', 'owner_id', 'CASCADE'),
+    ('pet_breed_junction', 'pet_id', 'pets', 'pet_id', 'CASCADE'),
+    ('awards', 'pet_id', 'pets', 'pet_id', 'CASCADE'),
+    ('pet_event_entry', 'pet_id', 'pets', 'pet_id', 'CASCADE'),
+    ('pet_event_entry', 'registration_id', 'event_registration', 'registration_id', 'CASCADE'),
+    ('participation_log', 'registration_id', 'event_registration', 'registration_id', 'CASCADE'),
+    ('event_registration', 'transfer_destination', 'event_registration', 'registration_id', 'SET NULL'),
+]
+
+
+def _set_foreign_key_rule(cursor, table, column, ref_table, ref_column, on_delete):
+    """Re-create the foreign key on table.column with the given ON DELETE rule, whatever it was named before."""
+    cursor.execute("""
+        SELECT kcu.CONSTRAINT_NAME, rc.DELETE_RULE
+        FROM information_schema.KEY_COLUMN_USAGE kcu
+        JOIN information_schema.REFERENTIAL_CONSTRAINTS rc
+          ON rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA AND rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+        WHERE kcu.TABLE_SCHEMA = DATABASE() AND kcu.TABLE_NAME = %s
+          AND kcu.COLUMN_NAME = %s AND kcu.REFERENCED_TABLE_NAME = %s
+    """, (table, column, ref_table))
+    existing = cursor.fetchall()
+    if existing and all(rule == on_delete for _, rule in existing):
+        return False
+    for constraint_name, _ in existing:
+        cursor.execute(f"ALTER TABLE {table} DROP FOREIGN KEY {constraint_name}")
+    cursor.execute(f"""
+        ALTER TABLE {table} ADD CONSTRAINT fk_{table}_{column}
+        FOREIGN KEY ({column}) REFERENCES {ref_table}({ref_column}) ON DELETE {on_delete}
+    """)
+    return True
+
+
+def _migration_004_owner_cascade(cursor):
+    """ON DELETE rules so removing an owner is one DELETE instead of a hand-written cascade."""
+    for rule in OWNER_CASCADE_RULES:
+        _set_foreign_key_rule(cursor, *rule)
+
+
+# The policy in effect when nothing else is configured: (min_days_before, refund_percent)
+DEFAULT_REFUND_TIERS = [(14, 100.00), (4, 50.00)]
+
+
+def _migration_005_refund_policy(cursor):
+    """Refund tiers per event, per event type, or the default (both NULL), seeded with the old hard-coded tiers."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS refund_policy_tier (
+        tier_id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        event_id INT NULL,
+        event_type VARCHAR(100) NULL,
+        min_days_before INT NOT NULL,
+        refund_percent DECIMAL(5,2) NOT NULL,
+        INDEX idx_refund_tier_event (event_id),
+        CONSTRAINT fk_refund_tier_event FOREIGN KEY (event_id) REFERENCES events(event_id) ON DELETE CASCADE
+    )
+    """)
+    cursor.execute("SELECT COUNT(*) FROM refund_policy_tier WHERE event_id IS NULL AND event_type IS NULL")
+    if not cursor.fetchone()[0]:
+        cursor.executemany("""
+            INSERT INTO refund_policy_tier (event_id, event_type, min_days_before, refund_percent)
+            VALUES (NULL, NULL, %s, %s)
+        """, DEFAULT_REFUND_TIERS)
+
+
+def _migration_006_finance_rollup(cursor):
+    """Per-event, per-day money totals, kept up to date by the write paths (see post_finance)."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS finance_rollup (
+        event_id INT NOT NULL,
+        day DATE NOT NULL,
+        registrations INT NOT NULL DEFAULT 0,
+        revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+        top_ups DECIMAL(12,2) NOT NULL DEFAULT 0,
+        refunds DECIMAL(12,2) NOT NULL DEFAULT 0,
+        PRIMARY KEY (event_id, day),
+        INDEX idx_finance_day (day)
+    )
+    """)
+    rebuild_finance_rollups(cursor)
+
+
+def _migration_007_log_date_time_types(cursor):
+    """participation_log.action_date/action_time as DATE/TIME, so idx_log_keyset is a full index.
+
+    On bootstrap_database()'s TEXT columns the keyset index only held 32-character prefixes,
+    which MySQL can't read in order, so every log page was a filesort.
+    """
+    cursor.execute("""
+        SELECT COLUMN_NAME, DATA_TYPE
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'participation_log'
+          AND COLUMN_NAME IN ('action_date', 'action_time')
+    """)
+    if not any(data_type.lower() in _TEXT_TYPES for _, data_type in cursor.fetchall()):
+        return
+    # Prefix indexes can't survive the type change; drop them and build them again afterwards
+    cursor.execute("""
+        SELECT DISTINCT INDEX_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'participation_log'
+          AND COLUMN_NAME IN ('action_date', 'action_time')
+    """)
+    changes = [f"DROP INDEX {index_name}" for (index_name,) in cursor.fetchall()]
+    changes += ["MODIFY action_date DATE NOT NULL", "MODIFY action_time TIME NOT NULL"]
+    cursor.execute(f"ALTER TABLE participation_log {', '.join(changes)}")
+    _ensure_index(cursor, 'participation_log', 'idx_log_date_action', ['action_date', 'action_type'])
+    _ensure_index(cursor, 'participation_log', 'idx_log_keyset', ['action_date', 'action_time', 'log_id'])
+
+
+# Ordered list of (version, description, function). Append only; never renumber.
+MIGRATIONS = [
+    (1, 'Secondary indexes for hot queries', _migration_001_hot_query_indexes),
+    (2, 'Participation log keyset index', _migration_002_log_keyset_index),
+    (3, 'Per-event capacity counters', _migration_003_event_capacity),
+    (4, 'Cascade owner removal through foreign keys', _migration_004_owner_cascade),
+    (5, 'Table-driven refund policy', _migration_005_refund_policy),
+    (6, 'Finance rollups', _migration_006_finance_rollup),
+    (7, 'Participation log DATE/TIME columns', _migration_007_log_date_time_types),
+]
+
+
+def run_migrations(conn):
+    """Apply every migration newer than what schema_version says is installed; returns the versions applied."""
+    cursor = conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT NOT NULL PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at DATETIME NOT NULL
+    )
+    """)
+    # Two kiosks starting at once shouldn't both run the same migration
+    cursor.execute("SELECT GET_LOCK('pet_show_migrations', 30)")
+    cursor.fetchone()
+    try:
+        cursor.execute("SELECT version FROM schema_version")
+        applied = {row[0] for row in cursor.fetchall()}
+        ran = []
+        for version, description, migrate in sorted(MIGRATIONS, key=lambda m: m[0]):
+            if version in applied:
+                continue
+            migrate(cursor)
+            cursor.execute("""
+                INSERT INTO schema_version (version, description, applied_at)
+                VALUES (%s, %s, NOW())
+            """, (version, description))
+            conn.commit()
+            ran.append(version)
+            print(f"Applied migration {version}: {description}")
+        return ran
+    finally:
+        cursor.execute("SELECT RELEASE_LOCK('pet_show_migrations')")
+        cursor.fetchone()
 
-    def gotologin(self):
-        log = login()
-        widget.addWidget(log)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
 
-    def quit_application(self):
-        app.quit()
+LATEST_SCHEMA_VERSION = max(version for version, _, _ in MIGRATIONS)
+
+
+def database_is_current():
+    """One round trip: is the schema at LATEST_SCHEMA_VERSION and the seed at SEED_VERSION?"""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT (SELECT MAX(version) FROM schema_version),
+                   (SELECT state_value FROM app_state WHERE state_key = 'seed_version')
+        """)
+        schema_version, seed_version = cursor.fetchone()
+        return schema_version == LATEST_SCHEMA_VERSION and seed_version == str(SEED_VERSION)
+    except Error:
+        # Missing tables on a brand-new database just mean "not provisioned yet"
+        return False
+    finally:
+        conn.close()
+
+
+def setup_database():
+    """Provision the database on first run or version change; otherwise skip straight to the GUI."""
+    started = time.perf_counter()
+    if database_is_current():
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        print(f"Database already at schema v{LATEST_SCHEMA_VERSION} / seed v{SEED_VERSION}; "
+              f"setup skipped in {elapsed_ms:.1f} ms.")
+        return
+    bootstrap_database()
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    print(f"Full database bootstrap took {elapsed_ms:.1f} ms.")
+
+
+# Hot queries that should be served by an index: (label, table alias to check, SQL, sample params)
+HOT_QUERIES = [
+    ('Owner pets already in event', 'er', """
+        SELECT COUNT(DISTINCT pee.pet_id)
+        FROM event_registration er
+        JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+        WHERE er.owner_id = %s AND er.event_id = %s AND er.status = 'Paid'
+    """, (1, 1)),
+    ('Entries of a registration', 'pee', """
+        SELECT pee.pet_id FROM pet_event_entry pee WHERE pee.registration_id = %s
+    """, (1,)),
+    ('Attendance by event and status', 't1', """
+        SELECT t1.entry_id FROM pet_event_entry t1
+        WHERE t1.event_id = %s AND t1.attendance_status = %s
+    """, (1, 'Present')),
+    ('Log actions on a date', 'pl', """
+        SELECT COUNT(DISTINCT pl.registration_id) FROM participation_log pl
+        WHERE pl.action_type = 'Transferred' AND pl.action_date = %s
+    """, ('2025-11-21',)),
+    ('Participation log keyset page', 'pl', """
+        SELECT pl.log_id FROM participation_log pl
+        ORDER BY pl.action_date DESC, pl.action_time DESC, pl.log_id DESC
+        LIMIT %s
+    """, (500,)),
+    ('Special awards of an event', 'awards', """
+        SELECT DISTINCT award_name FROM awards WHERE event_id = %s AND is_special = 1
+    """, (1,)),
+    ('Awards given on a date', 'a', """
+        SELECT a.award_name FROM awards a WHERE a.date = %s
+    """, ('2025-11-21',)),
+]
+
+
+def check_index_usage():
+    """EXPLAIN every hot query and return (label, key used, possible keys) per query."""
+    conn = get_db_connection()
+    if not conn:
+        return []
+    report = []
+    try:
+        cursor = conn.cursor(dictionary=True)
+        for label, alias, sql, params in HOT_QUERIES:
+            cursor.execute("EXPLAIN " + sql, params)
+            plan = cursor.fetchall()
+            row = next((r for r in plan if r.get('table') == alias), plan[0] if plan else {})
+            report.append((label, row.get('key'), row.get('possible_keys')))
+    except Error as err:
+        print(f"Error checking index usage: {err}")
+    finally:
+        conn.close()
+    return report
+
+
+def print_index_report():
+    """Print the EXPLAIN check; returns True when every hot query is answered through an index."""
+    report = check_index_usage()
+    all_ok = bool(report)
+    for label, key, possible in report:
+        ok = key is not None
+        all_ok = all_ok and ok
+        print(f"[{'OK' if ok else 'NO INDEX'}] {label}: key={key or '-'} possible={possible or '-'}")
+    return all_ok
+
 
 # --------------------------------------------------------------------------------------------------------------------
+# Event capacity counters
+
+# Distinct pets in an event's Paid registrations, i.e. what the counters are supposed to hold
+_PAID_PARTICIPANTS_SQL = """
+    SELECT COUNT(DISTINCT pee.pet_id)
+    FROM event_registration er
+    JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+    WHERE er.event_id = e.event_id AND er.status = 'Paid'
+"""
+
+
+class EventFullError(Exception):
+    """Raised inside a transaction when taking the spots would push an event past max_participants."""
+
+    def __init__(self, event_id, participants, max_participants):
+        super().__init__(f"Event {event_id} is full ({participants}/{max_participants}).")
+        self.event_id = event_id
+        self.participants = participants
+        self.max_participants = max_participants
+
+
+def resync_event_capacity(cursor):
+    """Rebuild every counter from the entries themselves (migration, reseed, or after hand edits)."""
+    cursor.execute(f"""
+        INSERT INTO event_capacity (event_id, max_participants, participants)
+        SELECT e.event_id, e.max_participants, ({_PAID_PARTICIPANTS_SQL})
+        FROM events e
+        ON DUPLICATE KEY UPDATE max_participants = VALUES(max_participants),
+                                participants = VALUES(participants)
+    """)
+
+
+def _lock_event_capacity(cursor, event_id):
+    """Lock an event's counter row until the transaction ends; returns (participants, max_participants)."""
+    cursor.execute("""
+        SELECT participants, max_participants FROM event_capacity
+        WHERE event_id = %s FOR UPDATE
+    """, (event_id,))
+    row = cursor.fetchone()
+    if row is None:
+        # Event added after the last resync: count it once, then lock the new row
+        cursor.execute(f"""
+            INSERT IGNORE INTO event_capacity (event_id, max_participants, participants)
+            SELECT e.event_id, e.max_participants, ({_PAID_PARTICIPANTS_SQL})
+            FROM events e WHERE e.event_id = %s
+        """, (event_id,))
+        cursor.execute("""
+            SELECT participants, max_participants FROM event_capacity
+            WHERE event_id = %s FOR UPDATE
+        """, (event_id,))
+        row = cursor.fetchone()
+    if row is None:
+        raise Error(f"Event {event_id} does not exist.")
+    return row
+
+
+def reserve_event_spots(cursor, event_id, count=1):
+    """Take `count` spots in the caller's transaction, or raise EventFullError and leave the counter alone."""
+    if count <= 0:
+        return
+    participants, max_participants = _lock_event_capacity(cursor, event_id)
+    if participants + count > max_participants:
+        raise EventFullError(event_id, participants, max_participants)
+    cursor.execute("""
+        UPDATE event_capacity SET participants = participants + %s WHERE event_id = %s
+    """, (count, event_id))
+
+
+def release_event_spots(cursor, event_id, count=1):
+    """Give `count` spots back in the caller's transaction."""
+    if count <= 0:
+        return
+    cursor.execute("""
+        UPDATE event_capacity SET participants = GREATEST(participants - %s, 0) WHERE event_id = %s
+    """, (count, event_id))
+
+
+def move_event_spots(cursor, from_event_id, to_event_id, count):
+    """Move spots between two events; rows are locked in id order so crossing transfers can't deadlock."""
+    move_event_spots_many(cursor, to_event_id, {from_event_id: count})
+
+
+def move_event_spots_many(cursor, to_event_id, from_counts):
+    """Move spots from several events ({event_id: count}) into one; raises EventFullError if they don't all fit."""
+    from_counts = {event_id: count for event_id, count in from_counts.items()
+                   if count > 0 and event_id != to_event_id}
+    if not from_counts:
+        return
+    for event_id in sorted({to_event_id, *from_counts}):
+        _lock_event_capacity(cursor, event_id)
+    reserve_event_spots(cursor, to_event_id, sum(from_counts.values()))
+    for event_id, count in from_counts.items():
+        release_event_spots(cursor, event_id, count)
+
+
+def reserve_event_spots_many(cursor, counts):
+    """Take spots in several events at once ({event_id: count}); all or nothing, locked in id order."""
+    event_ids = sorted(event_id for event_id, count in counts.items() if count > 0)
+    if not event_ids:
+        return
+    marks = ', '.join(['%s'] * len(event_ids))
+    cursor.execute(f"""
+        SELECT event_id, participants, max_participants FROM event_capacity
+        WHERE event_id IN ({marks}) ORDER BY event_id FOR UPDATE
+    """, event_ids)
+    current = {event_id: (participants, max_participants) for event_id, participants, max_participants in cursor.fetchall()}
+    for event_id in event_ids:
+        if event_id not in current:
+            current[event_id] = _lock_event_capacity(cursor, event_id)
+        participants, max_participants = current[event_id]
+        if participants + counts[event_id] > max_participants:
+            raise EventFullError(event_id, participants, max_participants)
+    cursor.executemany("""
+        UPDATE event_capacity SET participants = participants + %s WHERE event_id = %s
+    """, [(counts[event_id], event_id) for event_id in event_ids])
+
+
+def registration_pet_count(cursor, registration_id):
+    """How many distinct pets a registration holds spots for."""
+    cursor.execute("""
+        SELECT COUNT(DISTINCT pet_id) FROM pet_event_entry WHERE registration_id = %s
+    """, (registration_id,))
+    return cursor.fetchone()[0] or 0
 
-class login(QDialog):
-    def __init__(self):
-        super(login, self).__init__()
-        loadUi('./gui/login.ui', self)
-        self.exitbutt.clicked.connect(self.gotoregscreen)
-        self.adminlogbutt.clicked.connect(self.gotoadminlog)
-        self.ownerlogbutt.clicked.connect(self.ownerlogbut)
 
-    def gotoregscreen(self):
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-    
-    def gotoadminlog(self):
-        admlog = adminlog()
-        widget.addWidget(admlog)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-    
-    def ownerlogbut(self):
-        owlog = ownerlogin()
-        widget.addWidget(owlog)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-        
 # --------------------------------------------------------------------------------------------------------------------
-class ownerlogin(QDialog):
-    def __init__(self):
-        super(ownerlogin, self).__init__()
-        loadUi('./gui/ownerlogin.ui', self)
-        self.loginbutt.clicked.connect(self.login)
-        self.exitbutt.clicked.connect(self.gotoregscreen)
-        self.signupbutt.clicked.connect(self.gotoowonersignup)
-        self.logerrormes = self.findChild(QtWidgets.QLabel, 'logerrormes')
+# Finance rollups
+#
+# finance_rollup keeps one row per (event, day) so the finance report reads O(events x days)
+# rows instead of scanning every registration and log. The numbers are defined by the raw
+# tables (_FINANCE_LEDGER_SQL), and every write path posts the matching deltas in its own
+# transaction:
+#   registrations/revenue  registrations booked to the event on their payment_date (a transfer
+#                          re-books the registration to the destination on the transfer day, at
+#                          its new total, so transfer top-ups and fee reductions are in here)
+#   top_ups                top_up_amount of 'Transferred' log rows, by new event and action date
+#   refunds                refund_amount of 'Cancelled' log rows, by event and action date
+# Net is revenue - refunds. reconcile_finance_rollups() checks the rows against the raw tables.
+
+_FINANCE_LEDGER_SQL = """
+    SELECT event_id, day, SUM(registrations), SUM(revenue), SUM(top_ups), SUM(refunds)
+    FROM (
+        SELECT er.event_id, CAST(COALESCE(er.payment_date, er.registration_date) AS DATE) AS day,
+               COUNT(*) AS registrations, COALESCE(SUM(er.total_amount_paid), 0) AS revenue,
+               0 AS top_ups, 0 AS refunds
+        FROM event_registration er
+        WHERE {registrations}
+        GROUP BY er.event_id, CAST(COALESCE(er.payment_date, er.registration_date) AS DATE)
+        UNION ALL
+        SELECT pl.new_event_id, CAST(pl.action_date AS DATE), 0, 0, SUM(pl.top_up_amount), 0
+        FROM participation_log pl
+        WHERE pl.action_type = 'Transferred' AND pl.top_up_amount > 0 AND {logs}
+        GROUP BY pl.new_event_id, CAST(pl.action_date AS DATE)
+        UNION ALL
+        SELECT pl.original_event_id, CAST(pl.action_date AS DATE), 0, 0, 0, SUM(pl.refund_amount)
+        FROM participation_log pl
+        WHERE pl.action_type = 'Cancelled' AND pl.refund_amount > 0 AND {logs}
+        GROUP BY pl.original_event_id, CAST(pl.action_date AS DATE)
+    ) AS ledger
+    WHERE event_id IS NOT NULL AND day IS NOT NULL
+    GROUP BY event_id, day
+"""
+
+
+def _finance_ledger(registration_ids=None):
+    """The ledger SQL (and params), over every registration or just the given ones."""
+    if registration_ids is None:
+        return _FINANCE_LEDGER_SQL.format(registrations='1=1', logs='1=1'), []
+    marks = ', '.join(['%s'] * len(registration_ids))
+    sql = _FINANCE_LEDGER_SQL.format(registrations=f"er.registration_id IN ({marks})",
+                                     logs=f"pl.registration_id IN ({marks})")
+    return sql, list(registration_ids) * 3
+
+
+def post_finance(cursor, deltas):
+    """Add (event_id, day, registrations, revenue, top_ups, refunds) deltas to finance_rollup in the caller's transaction.
+
+    Deltas for the same row are summed first, and rows are written in key order so two
+    transactions posting to the same rows can't deadlock.
+    """
+    totals = {}
+    for event_id, day, registrations, revenue, top_ups, refunds in deltas:
+        key = (event_id, to_python_date(day) or day)
+        row = totals.setdefault(key, [0, 0.0, 0.0, 0.0])
+        row[0] += int(registrations or 0)
+        # Amounts arrive as Decimal (from the DB) or float (refund policy); add them up as floats
+        for i, value in enumerate((revenue, top_ups, refunds), start=1):
+            row[i] += float(value or 0)
+    rows = [(event_id, day, count, round(revenue, 2), round(top_ups, 2), round(refunds, 2))
+            for (event_id, day), (count, revenue, top_ups, refunds) in sorted(totals.items())
+            if count or abs(revenue) >= 0.005 or abs(top_ups) >= 0.005 or abs(refunds) >= 0.005]
+    if not rows:
+        return
+    cursor.executemany("""
+        INSERT INTO finance_rollup (event_id, day, registrations, revenue, top_ups, refunds)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE registrations = registrations + VALUES(registrations),
+                                revenue = revenue + VALUES(revenue),
+                                top_ups = top_ups + VALUES(top_ups),
+                                refunds = refunds + VALUES(refunds)
+    """, rows)
+
+
+def unpost_finance_for(cursor, registration_ids):
+    """Take registrations (and their log rows) back out of the rollups before they're deleted."""
+    if not registration_ids:
+        return
+    cursor.execute(*_finance_ledger(registration_ids))
+    post_finance(cursor, [(event_id, day, -registrations, -revenue, -top_ups, -refunds)
+                          for event_id, day, registrations, revenue, top_ups, refunds in cursor.fetchall()])
 
-        # Mask password input like the admin login screen
-        self.password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
 
-    def gotoregscreen(self):
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-    
-    def gotoowonersignup(self):
-        owreg = OwnerRegisScreen()
-        widget.addWidget(owreg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+def rebuild_finance_rollups(cursor):
+    """Recompute every rollup row from the raw tables (migration, reseed, or reconcile --fix)."""
+    cursor.execute("DELETE FROM finance_rollup")
+    sql, params = _finance_ledger()
+    cursor.execute(f"""
+        INSERT INTO finance_rollup (event_id, day, registrations, revenue, top_ups, refunds)
+        {sql}
+    """, params)
 
-    def login(self):
-        """Authenticate owner credentials."""
-        username = self.username.text().strip()
-        password = self.password.text().strip()
 
-        if self.logerrormes:
-            self.logerrormes.setText('')
+def reconcile_finance_rollups(fix=False):
+    """Compare finance_rollup with the raw tables; returns [(event_id, day, column, rollup, raw)] that differ.
 
-        if not username or not password:
-            if self.logerrormes:
-                self.logerrormes.setText('Please enter both username and password.')
-            return
+    With fix=True the rollups are rebuilt from the raw tables when anything is off.
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    columns = ('registrations', 'revenue', 'top_ups', 'refunds')
+    try:
+        cursor = conn.cursor()
+        # Days go through to_python_date on both sides: the ledger reads TEXT columns on the
+        # bootstrap schema, finance_rollup.day is a DATE
+        cursor.execute(*_finance_ledger())
+        raw = {(event_id, to_python_date(day)): values for event_id, day, *values in cursor.fetchall()}
+        cursor.execute("""
+            SELECT event_id, day, registrations, revenue, top_ups, refunds FROM finance_rollup
+        """)
+        rolled = {(event_id, to_python_date(day)): values for event_id, day, *values in cursor.fetchall()}
+        
+        mismatches = []
+        for key in sorted(set(raw) | set(rolled)):
+            raw_values = raw.get(key, (0, 0, 0, 0))
+            rolled_values = rolled.get(key, (0, 0, 0, 0))
+            for column, rolled_value, raw_value in zip(columns, rolled_values, raw_values):
+                if abs(float(rolled_value or 0) - float(raw_value or 0)) >= 0.005:
+                    mismatches.append((*key, column, rolled_value, raw_value))
+        
+        if mismatches and fix:
+            rebuild_finance_rollups(cursor)
+            conn.commit()
+        return mismatches
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def print_finance_reconciliation(fix=False):
+    """--reconcile-finance [--fix]: list rollup rows that disagree with the raw tables."""
+    mismatches = reconcile_finance_rollups(fix)
+    for event_id, day, column, rolled_value, raw_value in mismatches:
+        print(f"event {event_id} on {day}: {column} is {rolled_value} in the rollup, {raw_value} in the raw tables")
+    if not mismatches:
+        print("Finance rollups match the raw tables.")
+    elif fix:
+        print(f"{len(mismatches)} difference(s) found; rollups rebuilt from the raw tables.")
+    return not mismatches
+
+
+# Finance report groupings: label -> (first column, GROUP BY / ORDER BY)
+FINANCE_GROUPINGS = {
+    'Event': ("CONCAT(COALESCE(e.name, 'Event'), ' (ID: ', f.event_id, ')')", "f.event_id, e.name"),
+    'Day': ("f.day", "f.day"),
+    'Event Type': ("COALESCE(e.type, 'Unknown')", "e.type"),
+}
 
-        conn = get_db_connection()
-        if not conn:
-            if self.logerrormes:
-                self.logerrormes.setText('Database connection failed.')
-            return
 
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT owner_id, username, first_name, last_name, email, contact_number
-                FROM owner_log
-                WHERE username = %s AND password = %s
-            """, (username, password))
+def finance_report_sql(grouping='Event'):
+    """The finance report query, grouped by event, day or event type; reads only finance_rollup."""
+    label, group_by = FINANCE_GROUPINGS[grouping]
+    return f"""
+        SELECT {label},
+               SUM(f.registrations), SUM(f.revenue), SUM(f.top_ups), SUM(f.refunds),
+               SUM(f.revenue) - SUM(f.refunds)
+        FROM finance_rollup f
+        LEFT JOIN events e ON f.event_id = e.event_id
+        GROUP BY {group_by}
+        ORDER BY {group_by}
+    """
 
-            result = cursor.fetchone()
-            if result:
-                owner_id, db_username, first_name, last_name, email, contact_number = result
-                set_active_owner(
-                    owner_id=owner_id,
-                    username=db_username,
-                    first_name=first_name,
-                    last_name=last_name,
-                    email=email,
-                    contact_number=contact_number
-                )
-                self.gotommenu()
-            else:
-                if self.logerrormes:
-                    self.logerrormes.setText('Invalid username or password.')
-        except Error as err:
-            print(f"Owner login error: {err}")
-            if self.logerrormes:
-                self.logerrormes.setText('Login failed. Please try again.')
-        finally:
-            if conn:
-                conn.close()
 
-    def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-        
 # --------------------------------------------------------------------------------------------------------------------
+# Background queries
 
-class OwnerRegisScreen(QDialog):
-    def __init__(self):
-        super(OwnerRegisScreen, self).__init__()
-        loadUi('./gui/ownerregistration.ui', self)
-        self.owregbutt.clicked.connect(self.registerfunc)
-        self.exitbutt.clicked.connect(self.gotoregscreen)
-        self.owerrormes = self.findChild(QtWidgets.QLabel, 'owerrormes')
-        self.password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        
-    def gotoregscreen(self):
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-        
-    def registerfunc(self):
-        username = self.username.text().strip()
-        password = self.password.text().strip()
-        userfirstname = self.owfirstname.text().strip()
-        userlastname = self.owlastname.text().strip()
-        useremail = self.owemail.text().strip()
-        usernumber = self.ownumber.text().strip()
-        
-        self.owerrormes.setText('') 
+def run_query(sql, params=()):
+    """Run one read-only query on a pooled connection and return all rows (safe off the GUI thread)."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        conn.close()
 
-        if not username or not password or not userfirstname or not userlastname:
-            self.owerrormes.setText('Please fill in all required fields.')  
+
+class QueryTicket:
+    """Identifies one submitted query; flipped to cancelled when a newer one replaces it."""
+    __slots__ = ('key', 'cancelled')
+
+    def __init__(self, key):
+        self.key = key
+        self.cancelled = False
+
+
+class QuerySignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object, object)  # ticket, result
+    failed = QtCore.pyqtSignal(object, str)       # ticket, error message
+    progress = QtCore.pyqtSignal(object, object)  # ticket, progress value
+
+
+class QueryTask(QtCore.QRunnable):
+    """Runs a fetch function on the thread pool and reports back through signals.
+
+    With report_progress the function also gets a ``progress(value)`` keyword: each call
+    is forwarded to the GUI thread, and it returns False once the task was cancelled so
+    long jobs can stop early.
+    """
+
+    def __init__(self, ticket, fn, args, report_progress=False):
+        super(QueryTask, self).__init__()
+        self.ticket = ticket
+        self.fn = fn
+        self.args = args
+        self.report_progress = report_progress
+        self.signals = QuerySignals()
+
+    def _progress(self, value):
+        if self.ticket.cancelled:
+            return False
+        self.signals.progress.emit(self.ticket, value)
+        return True
+
+    def run(self):
+        if self.ticket.cancelled:
             return
-        
-        if not useremail and not usernumber:
-            self.owerrormes.setText('Provide atleast an email address or mobile number.')
+        try:
+            if self.report_progress:
+                result = self.fn(*self.args, progress=self._progress)
+            else:
+                result = self.fn(*self.args)
+        except Exception as err:
+            self.signals.failed.emit(self.ticket, str(err))
             return
-        
-        conn = get_db_connection()
-        
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Ensure username is unique
-                cursor.execute("SELECT owner_id FROM owner_log WHERE username = %s", (username,))
-                if cursor.fetchone():
-                    self.owerrormes.setText('Username already exists. Please choose another.')
-                    return
-                
-                # Get owner_id
-                cursor.execute("SELECT MAX(owner_id) FROM owners")
-                max_id = cursor.fetchone()[0]
-                new_owner_id = (max_id if max_id is not None else 0) + 1
-                
-                # Insert into the database
-                sql = "INSERT INTO owners (owner_id, first_name, last_name, email, contact_number) VALUES (%s, %s, %s, %s, %s)"
+        self.signals.finished.emit(self.ticket, result)
+
+
+class QueryExecutor(QtCore.QObject):
+    """Per-screen helper that runs DB fetches in the background and delivers results on the GUI thread.
+
+    Each request has a key (e.g. 'log'); submitting the same key again cancels the older
+    request so a stale result never overwrites a newer filter. cancel_all() is called when
+    the screen is hidden.
+    """
+
+    def __init__(self, parent=None):
+        super(QueryExecutor, self).__init__(parent)
+        self._pending = {}  # key -> (ticket, task, on_result, on_error, busy widgets, on_progress)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, busy=(), status_label=None,
+               on_progress=None):
+        self.cancel(key)
+        ticket = QueryTicket(key)
+        task = QueryTask(ticket, fn, args, report_progress=on_progress is not None)
+        task.signals.finished.connect(self._deliver)
+        task.signals.failed.connect(self._fail)
+        task.signals.progress.connect(self._report)
+        busy = [w for w in busy if w is not None]
+        for w in busy:
+            w.setEnabled(False)
+        if status_label is not None:
+            status_label.setText('Loading...')
+        self._pending[key] = (ticket, task, on_result, on_error, busy, on_progress)
+        QtCore.QThreadPool.globalInstance().start(task)
+        return ticket
+
+    def cancel(self, key):
+        entry = self._pending.pop(key, None)
+        if entry:
+            entry[0].cancelled = True
+            self._set_idle(entry[4])
+
+    def cancel_all(self):
+        for key in list(self._pending):
+            self.cancel(key)
+
+    def is_loading(self, key=None):
+        return key in self._pending if key is not None else bool(self._pending)
+
+    def _take(self, ticket):
+        entry = self._pending.get(ticket.key)
+        if ticket.cancelled or not entry or entry[0] is not ticket:
+            return None  # stale: a newer request (or a screen change) superseded it
+        del self._pending[ticket.key]
+        self._set_idle(entry[4])
+        return entry
+
+    def _set_idle(self, busy):
+        for w in busy:
+            w.setEnabled(True)
+
+    def _deliver(self, ticket, result):
+        entry = self._take(ticket)
+        if entry and entry[2]:
+            entry[2](result)
+
+    def _report(self, ticket, value):
+        entry = self._pending.get(ticket.key)
+        if entry and entry[0] is ticket and not ticket.cancelled and entry[5]:
+            entry[5](value)
+
+    def _fail(self, ticket, message):
+        entry = self._take(ticket)
+        if not entry:
+            return
+        if entry[3]:
+            entry[3](message)
+        else:
+            print(f"Background query '{ticket.key}' failed: {message}")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Table models
+
+class ColumnTableModel(QtCore.QAbstractTableModel):
+    """Read-only table model for the report screens.
+
+    Rows are stored as one Python list per column, exactly as fetched. Text is only
+    produced in data(), so the view formats just the cells it actually paints instead
+    of us building a QTableWidgetItem for every cell up front.
+
+    formatters maps column index -> fn(value) -> str; other columns use str(), with
+    None shown as ``empty``. Rows may be shorter than the header list; missing
+    columns read as None (handy for computed columns that only need a formatter).
+    """
+
+    def __init__(self, headers, formatters=None, empty='', parent=None):
+        super(ColumnTableModel, self).__init__(parent)
+        self._headers = list(headers)
+        self._formatters = formatters or {}
+        self._empty = empty
+        self._row_count = 0
+        self._columns = [[] for _ in self._headers]
+
+    def _split(self, rows):
+        columns = [list(values) for values in zip(*rows)] if rows else []
+        width = len(self._headers)
+        del columns[width:]
+        while len(columns) < width:
+            columns.append([None] * len(rows))
+        return columns
+
+    def set_rows(self, rows):
+        """Replace everything (one model reset, no per-cell work)."""
+        self.beginResetModel()
+        self._columns = self._split(rows)
+        self._row_count = len(rows)
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = self._row_count
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        for column, values in zip(self._columns, self._split(rows)):
+            column.extend(values)
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def prepend_rows(self, rows):
+        """Insert rows at the top (used by live views where the newest row comes first)."""
+        if not rows:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), 0, len(rows) - 1)
+        self._columns = [values + column for column, values in zip(self._columns, self._split(rows))]
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def trim(self, max_rows):
+        """Drop rows past max_rows from the bottom."""
+        if self._row_count <= max_rows:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), max_rows, self._row_count - 1)
+        for column in self._columns:
+            del column[max_rows:]
+        self._row_count = max_rows
+        self.endRemoveRows()
+
+    def clear(self):
+        self.set_rows([])
+
+    def raw_value(self, row, column):
+        return self._columns[column][row]
+
+    def row_values(self, row):
+        return tuple(column[row] for column in self._columns)
+
+    # --- QAbstractTableModel interface ---
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self.format_value(index.column(), self._columns[index.column()][index.row()])
+
+    def format_value(self, column, value):
+        """Text for one cell, the way the view shows it (exports use this too)."""
+        formatter = self._formatters.get(column)
+        if formatter:
+            return formatter(value)
+        return self._empty if value is None else str(value)
+
+    def headers(self):
+        return list(self._headers)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+
+# Rows per keyset page, and the most rows a paged report keeps loaded at once
+REPORT_PAGE_SIZE = 500
+REPORT_MAX_ROWS = 50000
+
+# Participation log live mode: how often to poll for new rows, and how many rows to keep on screen
+LOG_TAIL_POLL_MS = 3000
+LOG_TAIL_MAX_ROWS = 5000
+# Each poll re-reads the server's innodb_lock_wait_timeout plus this many seconds before the
+# newest row seen. Log rows are stamped before their transaction commits (it can sit in a lock
+# wait first) and log_ids come from per-kiosk blocks, so a row can commit after one with a
+# later (date, time, log_id) has already been shown
+LOG_TAIL_OVERLAP_S = 10
+
+
+class KeysetQuery:
+    """A filtered SELECT that can be resumed after the last row seen (keyset pagination).
+
+    ``sql`` must end in a WHERE clause (filters already applied, ``WHERE 1=1`` is fine)
+    and must not have ORDER BY/LIMIT. ``order_by`` lists the sort expressions, all in
+    the same direction, with a unique one (the primary key) last. ``key_columns`` are the
+    positions of those same values in each fetched row.
+    """
+
+    def __init__(self, sql, params, order_by, key_columns, descending=False):
+        self.sql = sql
+        self.params = tuple(params)
+        self.order_by = list(order_by)
+        self.key_columns = list(key_columns)
+        self.descending = descending
+
+    def page_sql(self, after_key, limit):
+        sql = self.sql
+        params = list(self.params)
+        if after_key is not None:
+            # (a, b, c) past (x, y, z), spelled out so MySQL can range-scan the index
+            op = '<' if self.descending else '>'
+            branches = []
+            for i, expr in enumerate(self.order_by):
+                terms = [f"{prev} = %s" for prev in self.order_by[:i]] + [f"{expr} {op} %s"]
+                branches.append('(' + ' AND '.join(terms) + ')')
+                params.extend(after_key[:i + 1])
+            sql += ' AND (' + ' OR '.join(branches) + ')'
+        direction = ' DESC' if self.descending else ''
+        sql += ' ORDER BY ' + ', '.join(expr + direction for expr in self.order_by) + ' LIMIT %s'
+        params.append(limit)
+        return sql, tuple(params)
+
+    def full_sql(self):
+        """The whole result in page order, no LIMIT (for exports)."""
+        direction = ' DESC' if self.descending else ''
+        return self.sql + ' ORDER BY ' + ', '.join(expr + direction for expr in self.order_by), self.params
+
+
+def fetch_keyset_page(query, after_key, limit):
+    """One page of a KeysetQuery plus the key to resume after it. Safe off the GUI thread."""
+    rows = run_query(*query.page_sql(after_key, limit))
+    last_key = tuple(rows[-1][i] for i in query.key_columns) if rows else after_key
+    return rows, last_key
+
+
+def fetch_row_count(sql, params=()):
+    """COUNT(*) of a filtered SELECT (same SQL a KeysetQuery pages through)."""
+    return run_query(f"SELECT COUNT(*) FROM ({sql}) AS filtered_rows", params)[0][0]
+
+
+class KeysetTableModel(ColumnTableModel):
+    """ColumnTableModel that pulls its rows a page at a time as the view scrolls.
+
+    start() loads the first page; Qt then calls canFetchMore()/fetchMore() whenever the
+    user nears the bottom. Pages are fetched in the background, and restarting (e.g. a
+    filter change) drops any page still in flight for the old query.
+    """
+
+    def __init__(self, headers, formatters=None, empty='', page_size=REPORT_PAGE_SIZE,
+                 max_rows=REPORT_MAX_ROWS, on_error=None, on_first_page=None, parent=None):
+        super(KeysetTableModel, self).__init__(headers, formatters, empty, parent)
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.on_error = on_error
+        self.on_first_page = on_first_page
+        self._pages = QueryExecutor(self)
+        self._query = None
+        self._last_key = None
+        self._exhausted = True
+
+    @property
+    def query(self):
+        """The KeysetQuery currently loaded (None before start())."""
+        return self._query
+
+    def start(self, query):
+        self._pages.cancel('page')
+        self.clear()
+        self._query = query
+        self._last_key = None
+        self._exhausted = False
+        self._request_page()
+
+    def cancel(self):
+        """Stop loading (screen hidden); the next fetchMore() picks up where we left off."""
+        self._pages.cancel('page')
+
+    def trim(self, max_rows):
+        """Drop rows from the bottom; paging resumes after the new last row."""
+        if self.rowCount() <= max_rows:
+            return
+        self._pages.cancel('page')
+        super(KeysetTableModel, self).trim(max_rows)
+        if self._query is None:
+            return
+        key_columns = self._query.key_columns
+        if max_rows and max(key_columns) < self.columnCount():
+            self._last_key = tuple(self.raw_value(max_rows - 1, i) for i in key_columns)
+            self._exhausted = False
+        else:
+            self._exhausted = True
+
+    def is_capped(self):
+        return not self._exhausted and self.rowCount() >= self.max_rows
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self._query is None or self._exhausted:
+            return False
+        return not self._pages.is_loading('page') and self.rowCount() < self.max_rows
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if self.canFetchMore(parent):
+            self._request_page()
+
+    def _request_page(self):
+        limit = min(self.page_size, self.max_rows - self.rowCount())
+        self._pages.submit('page', fetch_keyset_page, self._query, self._last_key, limit,
+                           on_result=lambda result: self._page_loaded(result, limit),
+                           on_error=self._page_failed)
+
+    def _page_loaded(self, result, limit):
+        first_page = self._last_key is None
+        rows, self._last_key = result
+        if len(rows) < limit:
+            self._exhausted = True
+        self.append_rows(rows)
+        if first_page and self.on_first_page:
+            self.on_first_page(rows)
+
+    def _page_failed(self, message):
+        self._exhausted = True
+        if self.on_error:
+            self.on_error(message)
+        else:
+            print(f"Error loading report page: {message}")
+
+
+def setup_report_view(view, model, stretch=True, row_height=None):
+    """Hook a QTableView up to a ColumnTableModel with settings that stay fast on big tables."""
+    view.setModel(model)
+    view.setWordWrap(True)
+    header = view.horizontalHeader()
+    if header:
+        # Only sample a few hundred rows when sizing columns to their contents
+        header.setResizeContentsPrecision(200)
+        if stretch:
+            header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+    vheader = view.verticalHeader()
+    if vheader:
+        # Fixed-height rows: the view never has to measure rows it isn't painting
+        vheader.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        if row_height:
+            vheader.setVisible(False)
+            vheader.setDefaultSectionSize(row_height)
+
+
+def text_or(default):
+    """Formatter that shows ``default`` for empty values (matches the old ``value or 'N/A'`` code)."""
+    return lambda value: str(value) if value else default
+
+
+def benchmark_table_model(row_count=100000):
+    """Time loading and painting row_count synthetic participation-log rows. Needs no database."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    headers = ['Log ID', 'Owner Name', 'Action Type', 'Action Date', 'Action Time',
+               'Original Event', 'New Event', 'Reason', 'Refund Amount', 'Top Up Amount']
+    rows = [
+        (i, f'Owner {i % 500}', 'Paid', '2025-01-01', '10:00:00', f'Event {i % 40}', None,
+         None, float(i % 300), None)
+        for i in range(row_count)
+    ]
+    view = QtWidgets.QTableView()
+    view.resize(1200, 700)
+    model = ColumnTableModel(headers, empty='N/A')
+    setup_report_view(view, model)
+    view.show()
+    app.processEvents()
+
+    started = time.perf_counter()
+    model.set_rows(rows)
+    loaded = time.perf_counter()
+    view.scrollToBottom()
+    app.processEvents()
+    painted = time.perf_counter()
+    view.resizeColumnsToContents()
+    resized = time.perf_counter()
+
+    print(f"{row_count} rows: set_rows {(loaded - started) * 1000:.1f} ms, "
+          f"first paint {(painted - loaded) * 1000:.1f} ms, "
+          f"resizeColumnsToContents {(resized - painted) * 1000:.1f} ms")
+    view.close()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Report export
+
+# Rows held in Python per fetchmany() while exporting (also how often progress is reported)
+EXPORT_BATCH = 2000
+EXPORT_FILE_FILTER = 'CSV files (*.csv);;Excel workbook (*.xlsx)'
+
+
+class _CsvExport:
+    def __init__(self, path, headers):
+        self._handle = open(path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(headers)
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._handle.close()
+
+
+class _XlsxExport:
+    """openpyxl's write-only mode streams rows to disk instead of building the sheet in memory."""
+
+    def __init__(self, path, headers):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ValueError("XLSX export needs openpyxl (pip install openpyxl); save as .csv instead.")
+        self._path = path
+        self._book = Workbook(write_only=True)
+        self._sheet = self._book.create_sheet()
+        self._sheet.append(headers)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self._sheet.append(row)
+
+    def close(self):
+        self._book.save(self._path)
+
+
+def export_report(sql, params, headers, path, format_value=None, progress=None):
+    """Stream a report query into a .csv or .xlsx file in constant memory.
+
+    The query runs on an unbuffered cursor over its own non-pooled connection and is read
+    with fetchmany(EXPORT_BATCH), so only one batch is ever held in Python. format_value(column, value) turns values into
+    the text the screen shows. progress(rows_written) is called after every batch; if it
+    returns False the export stops and the partial file is removed. Returns rows written
+    (None if cancelled).
+    """
+    width = len(headers)
+    sink_class = _XlsxExport if path.lower().endswith('.xlsx') else _CsvExport
+    conn = get_streaming_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    sink = None
+    cursor = None
+    written = 0
+    finished = False
+    try:
+        sink = sink_class(path, headers)
+        cursor = conn.cursor(buffered=False)
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH)
+            if not rows:
+                break
+            # Same shape as the table: extra fetched columns dropped, computed ones padded
+            rows = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+            if format_value:
+                rows = [[format_value(c, v) for c, v in enumerate(row)] for row in rows]
+            sink.write_rows(rows)
+            written += len(rows)
+            if progress and progress(written) is False:
+                return None
+        finished = True
+        return written
+    finally:
+        if sink:
+            sink.close()
+        if not finished and os.path.exists(path):
+            os.remove(path)
+        if not finished and cursor is not None:
+            # Cancelled or failed mid-result: stop the server sending the rest rather than
+            # reading it all just to hang up
+            stop_running_query(conn)
+        try:
+            conn.close()
+        except Error as err:
+            print(f"Error closing export connection: {err}")
+
+
+def start_report_export(parent, executor, sql, params, model, default_name, busy=(), status_label=None):
+    """Ask where to save, then run export_report in the background with a row counter in status_label."""
+    path, _ = QtWidgets.QFileDialog.getSaveFileName(parent, 'Export report', default_name, EXPORT_FILE_FILTER)
+    if not path:
+        return
+    if not os.path.splitext(path)[1]:
+        path += '.csv'
+
+    def show_progress(rows):
+        if status_label is not None:
+            status_label.setText(f"Exporting... {rows:,} rows")
+
+    def show_done(rows):
+        message = f"Exported {rows:,} rows to {os.path.basename(path)}" if rows is not None else "Export cancelled"
+        print(message)
+        if status_label is not None:
+            status_label.setText(message)
+
+    def show_error(msg):
+        print(f"Error exporting report: {msg}")
+        if status_label is not None:
+            status_label.setText(f"Export failed: {msg}")
+
+    show_progress(0)
+    executor.submit('export', export_report, sql, params, model.headers(), path, model.format_value,
+                    on_result=show_done, on_error=show_error, on_progress=show_progress, busy=busy)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Reference data cache
+
+# Even without an invalidation, reload after this many seconds so edits made by other clients show up
+REFERENCE_CACHE_TTL = 300.0
+
+_EVENT_FIELDS = (
+    'event_id', 'name', 'date', 'time', 'location', 'type', 'base_fee', 'extra_pet_discount',
+    'min_size_id', 'max_size_id', 'min_weight', 'max_weight', 'registration_deadline',
+    'status', 'max_participants', 'distance_km', 'time_limit'
+)
+
+
+def _load_size_categories():
+    return run_query("SELECT size_id, size_name FROM size_category ORDER BY size_id")
+
+
+def _load_breeds():
+    return run_query("SELECT breed_id, breed_name FROM breeds ORDER BY breed_name, breed_id")
+
+
+def _load_refund_policy():
+    return RefundPolicy(run_query("""
+        SELECT event_id, event_type, min_days_before, refund_percent FROM refund_policy_tier
+    """))
+
+
+def _load_events():
+    rows = run_query("""
+        SELECT event_id, name, date, time, location, type,
+               base_registration_fee, extra_pet_discount,
+               min_size_id, max_size_id, min_weight, max_weight,
+               registration_deadline, status, max_participants, distance_km, time_limit
+        FROM events
+        ORDER BY date, time, event_id
+    """)
+    return [dict(zip(_EVENT_FIELDS, row)) for row in rows]
+
+
+class ReferenceCache:
+    """In-process cache for the small lookup tables every screen needs.
+
+    Each table has a version number. Write paths call invalidate() after they commit,
+    which bumps the version; the next get() reloads. A load that races with an
+    invalidation is returned to its caller but not kept.
+    """
+
+    LOADERS = {
+        'sizes': _load_size_categories,
+        'breeds': _load_breeds,
+        'events': _load_events,
+        'refund_policy': _load_refund_policy,
+    }
+
+    def __init__(self, ttl=REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}   # name -> (version, loaded_at, rows)
+        self._versions = {}  # name -> version
+        self._counters = {'hits': 0, 'loads': 0}
+
+    def get(self, name):
+        with self._lock:
+            version = self._versions.get(name, 0)
+            entry = self._entries.get(name)
+            if entry and entry[0] == version and time.monotonic() - entry[1] < self.ttl:
+                self._counters['hits'] += 1
+                return entry[2]
+
+        rows = self.LOADERS[name]()  # Error propagates; failures are never cached
+
+        with self._lock:
+            self._counters['loads'] += 1
+            if self._versions.get(name, 0) == version:
+                self._entries[name] = (version, time.monotonic(), rows)
+        return rows
+
+    def invalidate(self, *names):
+        with self._lock:
+            for name in names or tuple(self.LOADERS):
+                self._versions[name] = self._versions.get(name, 0) + 1
+                self._entries.pop(name, None)
+
+    def version(self, name):
+        with self._lock:
+            return self._versions.get(name, 0)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, cached=sorted(self._entries))
+
+
+REFERENCE_DATA = ReferenceCache()
+
+
+def invalidate_reference_data(*names):
+    """Call after committing a change to size_category, breeds, events or refund_policy_tier."""
+    REFERENCE_DATA.invalidate(*names)
+
+
+def get_size_categories():
+    """[(size_id, size_name), ...] ordered by id."""
+    return REFERENCE_DATA.get('sizes')
+
+
+def size_id_for(size_name, default=3):
+    for size_id, name in get_size_categories():
+        if name == size_name:
+            return size_id
+    return default
+
+
+def get_breed_names():
+    names = []
+    for _, breed_name in REFERENCE_DATA.get('breeds'):
+        if breed_name and (not names or names[-1] != breed_name):
+            names.append(breed_name)
+    return names
+
+
+def cached_breed_id(breed_name):
+    """breed_id for a known breed name, or None if the cache hasn't seen it."""
+    for breed_id, name in REFERENCE_DATA.get('breeds'):
+        if name == breed_name:
+            return breed_id
+    return None
+
+
+def get_events(open_only=False, newest_first=False):
+    """Event dicts (copies) ordered by date/time; see _EVENT_FIELDS for the keys."""
+    events = [dict(e) for e in REFERENCE_DATA.get('events') if not open_only or e['status'] == 1]
+    if newest_first:
+        events.reverse()
+    return events
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Precompiled UI forms
+
+UI_DIR = './gui'
+COMPILED_UI_DIR = './gui/compiled'
+# PETSHOW_UI_DEV=1: edit .ui files in Designer and see changes without a rebuild (stale forms are
+# recompiled when opened). Otherwise a stale form is a missed build step and falls back to loadUi
+UI_DEV_MODE = os.environ.get('PETSHOW_UI_DEV') == '1'
+_UI_HASH_PREFIX = '# source-sha1: '
+# Bumped when the generated code changes shape, so older builds count as stale
+_UI_COMPILE_FORMAT = b'gui-search-path'
+
+# Compiled forms load their pixmaps as "gui:images/...", which Qt resolves against gui/
+# wherever the working directory is
+QtCore.QDir.addSearchPath('gui', os.path.abspath(UI_DIR))
+
+_ui_form_classes = {}  # ui file name -> Ui_* class (or None when running through loadUi)
+
+
+def _ui_module_path(ui_name):
+    stem = os.path.splitext(ui_name)[0]
+    module_name = ''.join(ch if ch.isalnum() else '_' for ch in stem) + '_ui'
+    return module_name, os.path.join(COMPILED_UI_DIR, module_name + '.py')
+
+
+def _ui_source_hash(ui_name):
+    with open(os.path.join(UI_DIR, ui_name), 'rb') as f:
+        return hashlib.sha1(f.read() + _UI_COMPILE_FORMAT).hexdigest()
+
+
+def ui_form_is_stale(ui_name):
+    """True when the compiled form is missing or was built from a different .ui file."""
+    _, py_path = _ui_module_path(ui_name)
+    try:
+        with open(py_path, encoding='utf-8') as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return True
+    return first_line != _UI_HASH_PREFIX + _ui_source_hash(ui_name)
+
+
+def compile_ui_form(ui_name):
+    """Compile one .ui file into gui/compiled, stamped with the source hash."""
+    _, py_path = _ui_module_path(ui_name)
+    os.makedirs(COMPILED_UI_DIR, exist_ok=True)
+    tmp_path = py_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write(f"{_UI_HASH_PREFIX}{_ui_source_hash(ui_name)}\n")
+        out.write(f"# Generated from gui/{ui_name} by `python main.py --compile-ui`; do not edit.\n")
+        # Relative pixmap paths in the .ui files are relative to gui/; point them at the gui: search path
+        with open(os.path.join(UI_DIR, ui_name), 'rb') as f:
+            source = re.sub(rb'<pixmap>(?!gui:|:)', b'<pixmap>gui:', f.read())
+        compileUi(io.BytesIO(source), out)
+    os.replace(tmp_path, py_path)
+
+
+def compile_ui_forms(force=False):
+    """Build step: (re)compile every stale form. Returns how many were written."""
+    count = 0
+    for ui_name in sorted(os.listdir(UI_DIR)):
+        if ui_name.endswith('.ui') and (force or ui_form_is_stale(ui_name)):
+            compile_ui_form(ui_name)
+            print(f"Compiled {ui_name}")
+            count += 1
+    print(f"{count} form(s) compiled into {COMPILED_UI_DIR}")
+    return count
+
+
+def _ui_form_class(ui_name):
+    if ui_name in _ui_form_classes:
+        return _ui_form_classes[ui_name]
+
+    form_cls = None
+    if ui_form_is_stale(ui_name):
+        if UI_DEV_MODE:
+            compile_ui_form(ui_name)
+        else:
+            print(f"{ui_name} has no up-to-date compiled form (run `python main.py --compile-ui`); using loadUi")
+    if not ui_form_is_stale(ui_name):
+        module_name, py_path = _ui_module_path(ui_name)
+        spec = importlib.util.spec_from_file_location(module_name, py_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        form_cls = next(obj for name, obj in vars(module).items() if name.startswith('Ui_'))
+
+    _ui_form_classes[ui_name] = form_cls
+    return form_cls
+
+
+def load_ui_form(screen, ui_name):
+    """Build a screen's widgets from its precompiled form (loadUi only as the dev fallback)."""
+    form_cls = _ui_form_class(ui_name)
+    if form_cls is None:
+        loadUi(os.path.join(UI_DIR, ui_name), screen)
+        return
+
+    form = form_cls()
+    form.setupUi(screen)
+    # loadUi puts every named child straight on the screen; keep that contract
+    for name, value in vars(form).items():
+        setattr(screen, name, value)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Screen manager
+
+# How many screen instances stay alive in the QStackedWidget at once
+SCREEN_CACHE_SIZE = 8
+
+
+def _screen_key(screen_cls, args):
+    """Hashable cache key for a screen; owner_context dicts become sorted item tuples."""
+    parts = []
+    for arg in args:
+        if isinstance(arg, dict):
+            arg = tuple(sorted(arg.items()))
+        parts.append(arg)
+    return (screen_cls, tuple(parts))
+
+
+class ScreenManager:
+    """Owns the pages of the global QStackedWidget.
+
+    show(cls, *args) brings up a screen. Instances are kept in a small LRU cache keyed by
+    class + constructor args; revisiting a cached screen calls its refresh() hook (if it has
+    one) instead of rebuilding it. Screens that hold half-typed form input subclass
+    FormScreen (``cache_screen = False``) and are rebuilt on every visit, but back() still
+    returns to the live instance. Anything pushed out of the cache is removed from the stack and deleted.
+    """
+
+    def __init__(self, stack, max_cached=SCREEN_CACHE_SIZE):
+        self.stack = stack
+        self.max_cached = max(1, max_cached)
+        self._cache = OrderedDict()  # key -> screen, least recently shown first
+        self._history = []           # (cls, args) in the order screens were shown
+        self._counters = {'created': 0, 'reused': 0, 'evicted': 0}
+
+    def show(self, screen_cls, *args, reuse=None):
+        key = _screen_key(screen_cls, args)
+        if reuse is None:
+            reuse = getattr(screen_cls, 'cache_screen', True)
+
+        screen = self._cache.pop(key, None)
+        if screen is not None and not reuse:
+            self._dispose(screen)
+            screen = None
+
+        if screen is None:
+            screen = screen_cls(*args)
+            self.stack.addWidget(screen)
+            self._counters['created'] += 1
+        else:
+            self._counters['reused'] += 1
+            refresh = getattr(screen, 'refresh', None)
+            if callable(refresh):
+                refresh()
+
+        self._cache[key] = screen
+        self.stack.setCurrentWidget(screen)
+        self._history.append((screen_cls, args))
+        del self._history[:-self.max_cached * 4]
+        self._evict()
+        return screen
+
+    def back(self):
+        """Return to the previously shown screen, reusing it if it's still alive."""
+        if len(self._history) < 2:
+            return None
+        left_cls, left_args = self._history.pop()
+        screen_cls, args = self._history.pop()
+        screen = self.show(screen_cls, *args, reuse=True)
+        if not getattr(left_cls, 'cache_screen', True):
+            # Form screens are single-use; don't keep the one we just left around
+            left = self._cache.pop(_screen_key(left_cls, left_args), None)
+            if left is not None and left is not screen:
+                self._dispose(left)
+        return screen
+
+    def drop_others(self):
+        """Delete every cached screen except the current one (used on logout)."""
+        current = self.stack.currentWidget()
+        for key, screen in list(self._cache.items()):
+            if screen is not current:
+                del self._cache[key]
+                self._dispose(screen)
+        self._history = self._history[-1:]
+
+    def _evict(self):
+        current = self.stack.currentWidget()
+        while len(self._cache) > self.max_cached:
+            key, screen = next(iter(self._cache.items()))
+            if screen is current:
+                break
+            del self._cache[key]
+            self._dispose(screen)
+
+    def _dispose(self, screen):
+        self.stack.removeWidget(screen)
+        screen.deleteLater()
+        self._counters['evicted'] += 1
+
+    def stats(self):
+        stats = dict(self._counters)
+        stats['cached'] = len(self._cache)
+        stats['stack_pages'] = self.stack.count()
+        return stats
+
+
+class FormScreen(QDialog):
+    """Base for screens holding half-typed form input: ScreenManager rebuilds them on every visit."""
+    cache_screen = False
+
+
+# Created in __main__ once the QStackedWidget exists
+SCREENS = None
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RegisterScreen(QDialog):
+    def __init__(self):
+        super(RegisterScreen, self).__init__()
+        load_ui_form(self, 'registerscreen.ui') 
+        clear_active_owner()
+        self.loginbutt.clicked.connect(self.gotologin)
+        self.exitbutt.clicked.connect(self.quit_application)
+
+    def gotologin(self):
+        SCREENS.show(login)
+
+    def quit_application(self):
+        app.quit()
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class login(QDialog):
+    def __init__(self):
+        super(login, self).__init__()
+        load_ui_form(self, 'login.ui')
+        self.exitbutt.clicked.connect(self.gotoregscreen)
+        self.adminlogbutt.clicked.connect(self.gotoadminlog)
+        self.ownerlogbutt.clicked.connect(self.ownerlogbut)
+
+    def gotoregscreen(self):
+        SCREENS.show(RegisterScreen)
+    
+    def gotoadminlog(self):
+        SCREENS.show(adminlog)
+    
+    def ownerlogbut(self):
+        SCREENS.show(ownerlogin)
+        
+# --------------------------------------------------------------------------------------------------------------------
+class ownerlogin(FormScreen):
+    def __init__(self):
+        super(ownerlogin, self).__init__()
+        load_ui_form(self, 'ownerlogin.ui')
+        self.loginbutt.clicked.connect(self.login)
+        self.exitbutt.clicked.connect(self.gotoregscreen)
+        self.signupbutt.clicked.connect(self.gotoowonersignup)
+        self.logerrormes = self.findChild(QtWidgets.QLabel, 'logerrormes')
+
+        # Mask password input like the admin login screen
+        self.password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+
+    def gotoregscreen(self):
+        SCREENS.show(RegisterScreen)
+    
+    def gotoowonersignup(self):
+        SCREENS.show(OwnerRegisScreen)
+
+    def login(self):
+        """Authenticate owner credentials."""
+        username = self.username.text().strip()
+        password = self.password.text().strip()
+
+        if self.logerrormes:
+            self.logerrormes.setText('')
+
+        if not username or not password:
+            if self.logerrormes:
+                self.logerrormes.setText('Please enter both username and password.')
+            return
+
+        conn = get_db_connection()
+        if not conn:
+            if self.logerrormes:
+                self.logerrormes.setText('Database connection failed.')
+            return
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT owner_id, username, first_name, last_name, email, contact_number
+                FROM owner_log
+                WHERE username = %s AND password = %s
+            """, (username, password))
+
+            result = cursor.fetchone()
+            if result:
+                owner_id, db_username, first_name, last_name, email, contact_number = result
+                set_active_owner(
+                    owner_id=owner_id,
+                    username=db_username,
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    contact_number=contact_number
+                )
+                self.gotommenu()
+            else:
+                if self.logerrormes:
+                    self.logerrormes.setText('Invalid username or password.')
+        except Error as err:
+            print(f"Owner login error: {err}")
+            if self.logerrormes:
+                self.logerrormes.setText('Login failed. Please try again.')
+        finally:
+            if conn:
+                conn.close()
+
+    def gotommenu(self):
+        SCREENS.show(mainmenu)
+        
+# --------------------------------------------------------------------------------------------------------------------
+
+class OwnerRegisScreen(FormScreen):
+    def __init__(self):
+        super(OwnerRegisScreen, self).__init__()
+        load_ui_form(self, 'ownerregistration.ui')
+        self.owregbutt.clicked.connect(self.registerfunc)
+        self.exitbutt.clicked.connect(self.gotoregscreen)
+        self.owerrormes = self.findChild(QtWidgets.QLabel, 'owerrormes')
+        self.password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        
+    def gotoregscreen(self):
+        SCREENS.show(RegisterScreen)
+        
+    def registerfunc(self):
+        username = self.username.text().strip()
+        password = self.password.text().strip()
+        userfirstname = self.owfirstname.text().strip()
+        userlastname = self.owlastname.text().strip()
+        useremail = self.owemail.text().strip()
+        usernumber = self.ownumber.text().strip()
+        
+        self.owerrormes.setText('') 
+
+        if not username or not password or not userfirstname or not userlastname:
+            self.owerrormes.setText('Please fill in all required fields.')  
+            return
+        
+        if not useremail and not usernumber:
+            self.owerrormes.setText('Provide atleast an email address or mobile number.')
+            return
+        
+        # Get owner_id (before the connection below is checked out; see IdAllocator)
+        try:
+            new_owner_id = allocate_id('owners')
+        except Error as err:
+            print(f"Error reserving owner id: {err}")
+            self.owerrormes.setText('Database connection failed. Check file access.')
+            return
+        
+        conn = get_db_connection()
+        
+        if conn:
+            try:
+                cursor = conn.cursor()
+                
+                # Ensure username is unique
+                cursor.execute("SELECT owner_id FROM owner_log WHERE username = %s", (username,))
+                if cursor.fetchone():
+                    self.owerrormes.setText('Username already exists. Please choose another.')
+                    return
+                
+                # Insert into the database
+                sql = "INSERT INTO owners (owner_id, first_name, last_name, email, contact_number) VALUES (%s, %s, %s, %s, %s)"
                 data = (new_owner_id, userfirstname, userlastname, useremail or None, usernumber or None)
                 
                 cursor.execute(sql, data)
@@ -640,16 +2550,14 @@ class OwnerRegisScreen(QDialog):
             self.owerrormes.setText('Database connection failed. Check file access.')
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
     
 # --------------------------------------------------------------------------------------------------------------------
 
-class adminlog(QDialog):
+class adminlog(FormScreen):
     def __init__(self):
         super(adminlog, self).__init__()
-        loadUi('./gui/adminlogscreen.ui', self)
+        load_ui_form(self, 'adminlogscreen.ui')
         self.loginbutt.clicked.connect(self.login)
         self.signupbutt.clicked.connect(self.gotoadminsignup)
         self.exitbutt.clicked.connect(self.gotoregscreen)
@@ -660,9 +2568,7 @@ class adminlog(QDialog):
     
     
     def gotoregscreen(self):
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(RegisterScreen)
 
     def login(self):
         """Handle admin login."""
@@ -704,20 +2610,16 @@ class adminlog(QDialog):
                 conn.close()
 
     def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmenu)
 
     def gotoadminsignup(self):
-        adsign = adminmsignup()
-        widget.addWidget(adsign)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmsignup)
         
 # --------------------------------------------------------------------------------------------------------------------
-class adminmsignup(QDialog):
+class adminmsignup(FormScreen):
     def __init__(self):
         super(adminmsignup, self).__init__()
-        loadUi('./gui/adminsignup.ui', self)
+        load_ui_form(self, 'adminsignup.ui')
         self.signupbutt.clicked.connect(self.signup)
         self.logerrormes = self.findChild(QtWidgets.QLabel, 'logerrormes')
         self.exitbutt.clicked.connect(self.gotoadminscreen)
@@ -726,9 +2628,7 @@ class adminmsignup(QDialog):
         self.password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
     
     def gotoadminscreen(self):
-        admn = adminlog()
-        widget.addWidget(admn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminlog)
 
     def signup(self):
         """Handle admin signup."""
@@ -743,6 +2643,14 @@ class adminmsignup(QDialog):
             self.logerrormes.setText('Please fill in all fields.')
             return
         
+        # Get next admin_id (before the connection below is checked out; see IdAllocator)
+        try:
+            new_admin_id = allocate_id('admin_log')
+        except Error as err:
+            print(f"Error during signup: {err}")
+            self.logerrormes.setText('Database connection failed.')
+            return
+        
         conn = get_db_connection()
         if not conn:
             self.logerrormes.setText('Database connection failed.')
@@ -758,11 +2666,6 @@ class adminmsignup(QDialog):
                 conn.close()
                 return
             
-            # Get next admin_id
-            cursor.execute("SELECT MAX(admin_id) FROM admin_log")
-            max_admin_id = cursor.fetchone()[0]
-            new_admin_id = (max_admin_id if max_admin_id is not None else 0) + 1
-            
             # Insert new admin with plain text password
             cursor.execute("""
                 INSERT INTO admin_log (admin_id, username, password, first_name, last_name)
@@ -789,16 +2692,14 @@ class adminmsignup(QDialog):
                 conn.close()
 
     def gotoadminlog(self):
-        adlog = adminlog()
-        widget.addWidget(adlog)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminlog)
         
 # --------------------------------------------------------------------------------------------------------------------
 
 class adminmenu(QDialog):
     def __init__(self):
         super(adminmenu, self).__init__()
-        loadUi('./gui/adminmenu.ui', self)
+        load_ui_form(self, 'adminmenu.ui')
         self.mmexitbutt.clicked.connect(self.gotoregscreen)
         self.upattendancebutt.clicked.connect(self.gotoupatten)
         self.vieweventawbutt.clicked.connect(self.gotoviewevntaw)
@@ -809,133 +2710,450 @@ class adminmenu(QDialog):
         if self.removeownerbutt:
             self.removeownerbutt.clicked.connect(self.goto_remove_owner_data)
             
-        # Load event status table
+        # Load event status table (off the GUI thread)
+        self.queries = QueryExecutor(self)
+        # Exports get their own executor so leaving the screen doesn't cancel them
+        self.exports = QueryExecutor(self)
+        self.exportbutt.clicked.connect(self.export_eventstatus)
+        self.relocatebutt.clicked.connect(self.relocate_entrants)
+        self.canceleventbutt.clicked.connect(self.cancel_event)
+        self.financebutt.clicked.connect(self.show_finance_report)
+        self.eventstatus_model = ColumnTableModel([
+            'Event Id', 'Event Name', 'Event Date', 'Time', 'Location', 
+            'Status', 'Awarded Pets', 'Award Name'
+        ], formatters={2: format_date_string}, parent=self)
+        setup_report_view(self.eventstatus, self.eventstatus_model, row_height=40)
+        self.load_eventstatus()
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
         self.load_eventstatus()
 
     def gotoregscreen(self):
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(RegisterScreen)
+        # Logging out: drop every admin screen
+        SCREENS.drop_others()
     
     def gotoawpetscore(self):
-        awpsc = awardpetscore()
-        widget.addWidget(awpsc)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(awardpetscore)
     
     def gotoupatten(self):
-        upat = updateattendance()
-        widget.addWidget(upat)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(updateattendance)
     
     def gotoviewevntaw(self):
-        evnt = vieweventaw()
-        widget.addWidget(evnt)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(vieweventaw)
 
     def gotoviewatten(self):
-        attn = eventattendancerep()
-        widget.addWidget(attn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(eventattendancerep)
 
     def gotopartlog(self):
-        prtlg = participantlog()
-        widget.addWidget(prtlg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(participantlog)
     
     def goto_remove_owner_data(self):
-        screen = RemoveOwnerDialog()
-        widget.addWidget(screen)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(RemoveOwnerDialog)
+
+    def relocate_entrants(self):
+        if RelocateEntrantsDialog(self).exec() == 1:  # QDialog.DialogCode.Accepted
+            self.load_eventstatus()
+
+    def cancel_event(self):
+        if CancelEventDialog(self).exec() == 1:
+            self.load_eventstatus()
+
+    def show_finance_report(self):
+        FinanceReportDialog(self).exec()
+
+    # Single SQL to retrieve all event/award/pet info
+    EVENTSTATUS_SQL = """
+        SELECT 
+            e.event_id, 
+            e.name, 
+            e.date, 
+            e.time, 
+            e.location,
+            CASE WHEN e.status = 1 THEN 'Open' ELSE 'Closed' END AS status,
+            COALESCE(p.name, 'No winner') AS awarded_pet,
+            COALESCE(a.award_name, 'No award') AS award_name
+        FROM events e
+        LEFT JOIN awards a ON e.event_id = a.event_id
+        LEFT JOIN pets p ON a.pet_id = p.pet_id
+        ORDER BY e.event_id, a.award_id
+    """
 
     def load_eventstatus(self):
-        """Load event status with awarded pets info into the table."""
-        conn = get_db_connection()
-        if not conn:
+        """Load event status with awarded pets info into the table (query runs in the background)."""
+        self.queries.submit('eventstatus', run_query, self.EVENTSTATUS_SQL,
+                            on_result=self.show_eventstatus,
+                            on_error=lambda msg: print(f"Error loading event status: {msg}"))
+
+    def export_eventstatus(self):
+        start_report_export(self, self.exports, self.EVENTSTATUS_SQL, (), self.eventstatus_model,
+                            'event_status.csv', busy=[self.exportbutt])
+
+    def show_eventstatus(self, rows):
+        """Fill the event status table from rows fetched in the background."""
+        self.eventstatus_model.set_rows(rows)
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.queries.cancel_all()
+        super().hideEvent(event)
+
+
+class RelocateEntrantsDialog(QDialog):
+    """Small admin popup: move every paid entrant of one event into another (venue change, cancelled event)."""
+
+    def __init__(self, parent=None):
+        super(RelocateEntrantsDialog, self).__init__(parent)
+        self.setWindowTitle("Relocate Entrants")
+        self.setModal(True)
+        layout = QtWidgets.QVBoxLayout()
+        
+        layout.addWidget(QtWidgets.QLabel("Move every paid entrant of:"))
+        self.from_event = QtWidgets.QComboBox()
+        layout.addWidget(self.from_event)
+        layout.addWidget(QtWidgets.QLabel("Into (open events only):"))
+        self.to_event = QtWidgets.QComboBox()
+        layout.addWidget(self.to_event)
+        layout.addWidget(QtWidgets.QLabel("Reason (goes in the participation log):"))
+        self.reason = QtWidgets.QLineEdit("Event relocated")
+        layout.addWidget(self.reason)
+        self.summary = QtWidgets.QLabel("")
+        layout.addWidget(self.summary)
+        
+        button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.relocate)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
+        
+        try:
+            for event in get_events():
+                self.from_event.addItem(f"{event['name']} (ID: {event['event_id']})", event['event_id'])
+            for event in get_events(open_only=True):
+                self.to_event.addItem(f"{event['name']} (ID: {event['event_id']})", event['event_id'])
+        except Error as err:
+            print(f"Error loading events: {err}")
+            self.summary.setText('Error loading events.')
+        
+        self.from_event.currentIndexChanged.connect(self.show_summary)
+        self.show_summary()
+
+    def show_summary(self):
+        """How many registrations/pets the chosen source event would give up."""
+        event_id = self.from_event.currentData()
+        if event_id is None:
             return
-    
         try:
-            cursor = conn.cursor()
+            registrations, pets = run_query("""
+                SELECT COUNT(DISTINCT er.registration_id), COUNT(DISTINCT pee.pet_id)
+                FROM event_registration er
+                JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+                WHERE er.event_id = %s AND er.status = 'Paid'
+            """, (event_id,))[0]
+        except Error as err:
+            print(f"Error counting entrants: {err}")
+            self.summary.setText('Error counting entrants.')
+            return
+        self.summary.setText(f"{registrations} registration(s), {pets} pet(s) to move.")
 
-            # Single SQL to retrieve all event/award/pet info
-            cursor.execute("""
-                SELECT 
-                    e.event_id, 
-                    e.name, 
-                    e.date, 
-                    e.time, 
-                    e.location,
-                    CASE WHEN e.status = 1 THEN 'Open' ELSE 'Closed' END AS status,
-                    COALESCE(p.name, 'No winner') AS awarded_pet,
-                    COALESCE(a.award_name, 'No award') AS award_name
-                FROM events e
-                LEFT JOIN awards a ON e.event_id = a.event_id
-                LEFT JOIN pets p ON a.pet_id = p.pet_id
-                ORDER BY e.event_id, a.award_id;
-            """)
+    def relocate(self):
+        from_event_id = self.from_event.currentData()
+        to_event_id = self.to_event.currentData()
+        if from_event_id is None or to_event_id is None:
+            self.summary.setText('Please pick both events.')
+            return
+        
+        from PyQt6.QtWidgets import QMessageBox
+        reply = QMessageBox.question(
+            self, 'Confirm Relocation',
+            f"Move every paid entrant of {self.from_event.currentText()} into {self.to_event.currentText()}?\n\n"
+            f"Fees are re-priced to the new event; differences are logged as top-ups/refunds.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        try:
+            moves, skipped = relocate_event_entrants(from_event_id, to_event_id,
+                                                     self.reason.text().strip() or 'Event relocated')
+        except RelocationRejected as err:
+            self.summary.setText(str(err))
+            return
+        except EventFullError as err:
+            self.summary.setText(f"Not enough room: the new event has "
+                                 f"{err.max_participants - err.participants} spot(s) left.")
+            return
+        except Error as err:
+            print(f"Error relocating entrants: {err}")
+            self.summary.setText('Relocation failed: Database Error.')
+            return
+        
+        top_ups = sum(move['top_up'] for move in moves)
+        refunds = sum(move['refund'] for move in moves)
+        message = (f"Moved {len(moves)} registration(s).\n"
+                   f"Top-ups due: ₱{top_ups:.2f}\nRefunds due: ₱{refunds:.2f}")
+        if skipped:
+            message += f"\n\n{len(skipped)} registration(s) left behind (mostly a pet already entered in the new event)."
+        print(message)
+        QMessageBox.information(self, 'Relocation Complete', message)
+        self.accept()
 
-            rows = cursor.fetchall()
 
-            # Set up table
-            self.eventstatus.setRowCount(len(rows))
-            self.eventstatus.setColumnCount(8)
-            self.eventstatus.setHorizontalHeaderLabels([
-                'Event Id', 'Event Name', 'Event Date', 'Time', 'Location', 
-                'Status', 'Awarded Pets', 'Award Name'
-            ])
+class CancelEventDialog(QDialog):
+    """Small admin popup: call off an event, cancelling and refunding every paid registration.
 
-            # Populate table
-            for row_index, row in enumerate(rows):
-                event_id, name, date, time, location, status, awarded_pet, award_name = row
-
-                formatted_date = format_date_string(date)
-                formatted_time = str(time) if time not in (None, '') else ''
-
-                values = [
-                    event_id,
-                    name,
-                    formatted_date,
-                    formatted_time,
-                    location,
-                    status,
-                    awarded_pet,
-                    award_name
-                ]
-
-                for col_index, value in enumerate(values):
-                    item = QtWidgets.QTableWidgetItem(str(value))
-                    if col_index in [1, 4, 6, 7]:
-                        item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-                    self.eventstatus.setItem(row_index, col_index, item)
+    The work runs in the background (it can be thousands of registrations) with a running
+    count in the summary line; the popup can't be closed until it's done.
+    """
 
-            # Enable wrapping
-            self.eventstatus.setWordWrap(True)
+    def __init__(self, parent=None):
+        super(CancelEventDialog, self).__init__(parent)
+        self.setWindowTitle("Cancel Event")
+        self.setModal(True)
+        self.jobs = QueryExecutor(self)
+        self.paid_count = 0
+        layout = QtWidgets.QVBoxLayout()
+        
+        # Closed events stay in the list so a cancellation that stopped part way can be finished
+        layout.addWidget(QtWidgets.QLabel("Event to cancel:"))
+        self.event = QtWidgets.QComboBox()
+        layout.addWidget(self.event)
+        layout.addWidget(QtWidgets.QLabel("Reason (goes in the participation log):"))
+        self.reason = QtWidgets.QLineEdit("Event cancelled")
+        layout.addWidget(self.reason)
+        self.summary = QtWidgets.QLabel("")
+        layout.addWidget(self.summary)
+        
+        self.button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.cancel_event)
+        self.button_box.rejected.connect(self.reject)
+        layout.addWidget(self.button_box)
+        self.setLayout(layout)
+        
+        try:
+            for event in get_events():
+                self.event.addItem(f"{event['name']} (ID: {event['event_id']})", event['event_id'])
+        except Error as err:
+            print(f"Error loading events: {err}")
+            self.summary.setText('Error loading events.')
+        
+        self.event.currentIndexChanged.connect(self.show_summary)
+        self.show_summary()
 
-            # Resize behavior
-            header = self.eventstatus.horizontalHeader()
-            if header:
-                header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+    def show_summary(self):
+        """Paid registrations and money at stake for the chosen event."""
+        event_id = self.event.currentData()
+        if event_id is None:
+            return
+        try:
+            self.paid_count, paid_total = run_query("""
+                SELECT COUNT(*), COALESCE(SUM(total_amount_paid), 0)
+                FROM event_registration
+                WHERE event_id = %s AND status = 'Paid'
+            """, (event_id,))[0]
+        except Error as err:
+            print(f"Error counting registrations: {err}")
+            self.summary.setText('Error counting registrations.')
+            return
+        self.summary.setText(f"{self.paid_count} paid registration(s), ₱{float(paid_total):.2f} collected.")
 
-            vheader = self.eventstatus.verticalHeader()
-            if vheader:
-                vheader.setVisible(False)
-                vheader.setDefaultSectionSize(40)
+    def cancel_event(self):
+        event_id = self.event.currentData()
+        if event_id is None:
+            self.summary.setText('Please pick an event.')
+            return
+        
+        from PyQt6.QtWidgets import QMessageBox
+        reply = QMessageBox.question(
+            self, 'Confirm Cancellation',
+            f"Cancel {self.event.currentText()}?\n\n"
+            f"The event is closed and all {self.paid_count} paid registration(s) are cancelled "
+            f"and refunded by the refund policy. This can't be undone.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        self.jobs.submit('cancel', cancel_event, event_id, self.reason.text().strip() or 'Event cancelled',
+                         on_result=self.show_totals,
+                         on_error=self.show_error,
+                         on_progress=lambda done: self.summary.setText(f"Cancelled {done} of {self.paid_count}..."),
+                         busy=[self.button_box, self.event, self.reason],
+                         status_label=self.summary)
 
-        except Error as err:
-                print(f"Error loading event status: {err}")
-        finally:
-                if conn:
-                    conn.close()
+    def show_totals(self, totals):
+        from PyQt6.QtWidgets import QMessageBox
+        message = (f"Cancelled {totals['registrations']} registration(s) ({totals['pets']} pet(s)).\n"
+                   f"Collected: ₱{totals['amount_paid']:.2f}\nRefunded: ₱{totals['refunded']:.2f}")
+        print(message)
+        QMessageBox.information(self, 'Event Cancelled', message)
+        self.accept()
+
+    def show_error(self, message):
+        print(f"Error cancelling event: {message}")
+        # Whatever was committed stays; running it again finishes the rest
+        self.summary.setText('Cancellation stopped part way. Run it again to finish.')
+
+    def reject(self):
+        if self.jobs.is_loading():
+            return  # let the cancellation finish first
+        super().reject()
+
+
+class FinanceReportDialog(QDialog):
+    """Small admin popup: revenue, top-ups, refunds and net per event, day or event type.
+
+    Reads only the finance_rollup rows, so it stays quick however many registrations there are.
+    """
+
+    def __init__(self, parent=None):
+        super(FinanceReportDialog, self).__init__(parent)
+        self.setWindowTitle("Finance Report")
+        self.setModal(True)
+        self.setMinimumSize(760, 480)
+        self.queries = QueryExecutor(self)
+        self.exports = QueryExecutor(self)
+        layout = QtWidgets.QVBoxLayout()
+        
+        controls = QtWidgets.QHBoxLayout()
+        controls.addWidget(QtWidgets.QLabel("Group by:"))
+        self.grouping = QtWidgets.QComboBox()
+        self.grouping.addItems(list(FINANCE_GROUPINGS))
+        controls.addWidget(self.grouping)
+        controls.addStretch()
+        self.checkbutt = QtWidgets.QPushButton("Check Totals")
+        controls.addWidget(self.checkbutt)
+        self.exportbutt = QtWidgets.QPushButton("Export")
+        controls.addWidget(self.exportbutt)
+        layout.addLayout(controls)
+        
+        self.table = QtWidgets.QTableView()
+        layout.addWidget(self.table)
+        self.summary = QtWidgets.QLabel("")
+        layout.addWidget(self.summary)
+        
+        button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Close)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
+        
+        self.grouping.currentIndexChanged.connect(self.load_report)
+        self.checkbutt.clicked.connect(self.check_totals)
+        self.exportbutt.clicked.connect(self.export_report)
+        self.load_report()
+
+    def load_report(self):
+        grouping = self.grouping.currentText()
+        money = lambda value: f"₱{float(value or 0):.2f}"
+        # First column is named after the grouping, so the model is rebuilt with it
+        self.model = ColumnTableModel(
+            [grouping, 'Registrations', 'Revenue', 'Top-ups', 'Refunds', 'Net'],
+            formatters={0: format_date_string if grouping == 'Day' else str,
+                        2: money, 3: money, 4: money, 5: money}, parent=self)
+        setup_report_view(self.table, self.model)
+        self.queries.submit('report', run_query, finance_report_sql(grouping),
+                            on_result=self.show_report,
+                            on_error=self.show_error,
+                            status_label=self.summary)
+
+    def show_report(self, rows):
+        self.model.set_rows(rows)
+        revenue = sum(float(row[2] or 0) for row in rows)
+        refunds = sum(float(row[4] or 0) for row in rows)
+        self.summary.setText(f"Revenue ₱{revenue:.2f} - Refunds ₱{refunds:.2f} = Net ₱{revenue - refunds:.2f}")
+
+    def show_error(self, message):
+        print(f"Error loading finance report: {message}")
+        self.summary.setText('Error loading finance report.')
+
+    def check_totals(self):
+        """Run the reconciliation (read-only) and say whether the rollups match the raw tables."""
+        def show_result(mismatches):
+            if mismatches:
+                self.summary.setText(f"{len(mismatches)} difference(s) from the raw tables; "
+                                     f"run main.py --reconcile-finance --fix to rebuild.")
+            else:
+                self.summary.setText("Totals match the raw registrations and logs.")
+        self.queries.submit('reconcile', reconcile_finance_rollups,
+                            on_result=show_result,
+                            on_error=self.show_error,
+                            busy=[self.checkbutt],
+                            status_label=self.summary)
+
+    def export_report(self):
+        start_report_export(self, self.exports, finance_report_sql(self.grouping.currentText()), (),
+                            self.model, 'finance_report.csv', busy=[self.exportbutt], status_label=self.summary)
         
 # --------------------------------------------------------------------------------------------------------------------
 
-class updateattendance(QDialog):
+def set_attendance(event_id, entry_ids, status):
+    """One UPDATE for any number of the event's entries; returns how many rows changed."""
+    if not entry_ids:
+        return 0
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        marks = ', '.join(['%s'] * len(entry_ids))
+        cursor.execute(f"""
+            UPDATE pet_event_entry 
+            SET attendance_status = %s 
+            WHERE event_id = %s AND entry_id IN ({marks})
+        """, [status, event_id, *entry_ids])
+        changed = cursor.rowcount
+        conn.commit()
+        return changed
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def mark_remaining_no_show(event_id):
+    """Every entry of the event still 'Registered' becomes 'No Show'; returns their entry_ids."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        # Lock the rows first so we can report exactly which ones the UPDATE hit
+        cursor.execute("""
+            SELECT entry_id FROM pet_event_entry
+            WHERE event_id = %s AND attendance_status = 'Registered'
+            FOR UPDATE
+        """, (event_id,))
+        entry_ids = [row[0] for row in cursor.fetchall()]
+        if entry_ids:
+            cursor.execute("""
+                UPDATE pet_event_entry 
+                SET attendance_status = 'No Show' 
+                WHERE event_id = %s AND attendance_status = 'Registered'
+            """, (event_id,))
+        conn.commit()
+        return entry_ids
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+class updateattendance(FormScreen):
     def __init__(self):
         super(updateattendance, self).__init__()
-        loadUi('./gui/upattendancestatus.ui', self)
+        load_ui_form(self, 'upattendancestatus.ui')
         self.exitbutt.clicked.connect(self.gotoadminmenu)
         self.savebutt.clicked.connect(self.save_attendance)
+        self.noshowbutt.clicked.connect(self.mark_rest_no_show)
         self.errormessage = self.findChild(QtWidgets.QLabel, 'errormessage')
         
+        # Filled by load_attendance_data so picking a pet or patching a row needs no query
+        self.entry_for_pet = {}
+        self.row_for_entry = {}
+        
         # Load events and attendance statuses
         self.load_events()
         self.load_attendance_statuses()
@@ -949,30 +3167,18 @@ class updateattendance(QDialog):
     
     def load_events(self):
         """Grab all events and stick them in the dropdown."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT event_id, name 
-                FROM events 
-                ORDER BY date, time
-            """)
-            
-            events = cursor.fetchall()
-            self.events.clear()
-            self.events.addItem("Select Event")
-            
-            for event_id, event_name in events:
-                display_text = f"{event_name} (ID: {event_id})"
-                self.events.addItem(display_text)
+            events = get_events()
         except Error as err:
             print(f"Error loading events: {err}")
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.events.clear()
+        self.events.addItem("Select Event")
+        
+        for event in events:
+            display_text = f"{event['name']} (ID: {event['event_id']})"
+            self.events.addItem(display_text)
     
     def load_attendance_statuses(self):
         """Load all possible attendance statuses."""
@@ -997,75 +3203,26 @@ class updateattendance(QDialog):
             self.eventstatus.setRowCount(0)
             return
         
-        # Load pets for this event
-        self.load_pets_for_event(event_id)
-        
-        # Load and display attendance data
+        # One query fills both the table and the pet dropdown
         self.load_attendance_data(event_id)
     
-    def load_pets_for_event(self, event_id):
-        """Load all pets registered for the selected event."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT p.pet_id, p.name
-                FROM pet_event_entry pee
-                JOIN pets p ON pee.pet_id = p.pet_id
-                WHERE pee.event_id = %s
-                ORDER BY p.name
-            """, (event_id,))
-            
-            pets = cursor.fetchall()
-            self.pets.clear()
-            self.pets.addItem("Select Pet")
-            
-            for pet_id, pet_name in pets:
-                display_text = f"{pet_name} (ID: {pet_id})"
-                self.pets.addItem(display_text)
-        except Error as err:
-            print(f"Error loading pets: {err}")
-        finally:
-            if conn:
-                conn.close()
-    
     def on_pet_selected(self):
-        """When a pet is selected, find its entry_id for updating."""
+        """When a pet is selected, look up its entry_id (already loaded with the table)."""
         pet_text = self.pets.currentText()
-        event_text = self.events.currentText()
         
-        if pet_text == "Select Pet" or event_text == "Select Event":
+        if not pet_text or pet_text == "Select Pet":
             self.selected_entry_id = None
             return
         
         try:
             pet_id = int(pet_text.split('(ID: ')[1].split(')')[0])
-            event_id = int(event_text.split('(ID: ')[1].split(')')[0])
-            
-            conn = get_db_connection()
-            if conn:
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT entry_id 
-                        FROM pet_event_entry 
-                        WHERE pet_id = %s AND event_id = %s
-                        LIMIT 1
-                    """, (pet_id, event_id))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        self.selected_entry_id = result[0]
-                finally:
-                    conn.close()
-        except:
+        except (IndexError, ValueError):
             self.selected_entry_id = None
+            return
+        self.selected_entry_id = self.entry_for_pet.get(pet_id)
     
     def load_attendance_data(self, event_id):
-        """Load attendance data for the selected event and display in table."""
+        """Load attendance data for the selected event into the table (tick boxes for bulk check-in) and the pet dropdown."""
         conn = get_db_connection()
         if not conn:
             return
@@ -1089,6 +3246,13 @@ class updateattendance(QDialog):
                 'Entry ID', 'Pet ID', 'Pet Name', 'Current Status'
             ])
             
+            self.pets.blockSignals(True)
+            self.pets.clear()
+            self.pets.addItem("Select Pet")
+            self.entry_for_pet = {}
+            self.row_for_entry = {}
+            self.selected_entry_id = None
+            
             # Populate table
             for row, data in enumerate(results):
                 entry_id = data[0]
@@ -1099,9 +3263,19 @@ class updateattendance(QDialog):
                 values = [str(entry_id), str(pet_id), pet_name, current_status]
                 for col, value in enumerate(values):
                     item = QtWidgets.QTableWidgetItem(str(value))
+                    if col == 0:
+                        # Tick box for bulk check-in
+                        item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+                        item.setCheckState(QtCore.Qt.CheckState.Unchecked)
                     if col in [2, 3]:  # Pet Name, Current Status
                         item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
                     self.eventstatus.setItem(row, col, item)
+                
+                self.row_for_entry[entry_id] = row
+                if pet_id not in self.entry_for_pet:
+                    self.entry_for_pet[pet_id] = entry_id
+                    self.pets.addItem(f"{pet_name} (ID: {pet_id})")
+            self.pets.blockSignals(False)
             
             # Use same formatting as participantlog - stretch mode with word wrap
             self.eventstatus.setWordWrap(True)
@@ -1121,11 +3295,47 @@ class updateattendance(QDialog):
             if conn:
                 conn.close()
     
+    def ticked_entry_ids(self):
+        """Entry ids whose tick box is checked."""
+        entry_ids = []
+        for entry_id, row in self.row_for_entry.items():
+            item = self.eventstatus.item(row, 0)
+            if item and item.checkState() == QtCore.Qt.CheckState.Checked:
+                entry_ids.append(entry_id)
+        return entry_ids
+    
+    def patch_status(self, entry_ids, new_status):
+        """Update the Current Status cells (and clear the ticks) without re-querying."""
+        for entry_id in entry_ids:
+            row = self.row_for_entry.get(entry_id)
+            if row is None:
+                continue
+            self.eventstatus.item(row, 3).setText(new_status)
+            self.eventstatus.item(row, 0).setCheckState(QtCore.Qt.CheckState.Unchecked)
+    
+    def selected_event_id(self):
+        """event_id from the dropdown text, or None after setting an error."""
+        event_text = self.events.currentText()
+        if event_text == "Select Event":
+            if self.errormessage:
+                self.errormessage.setText('Please select an event.')
+            return None
+        
+        try:
+            return int(event_text.split('(ID: ')[1].split(')')[0])
+        except (IndexError, ValueError):
+            if self.errormessage:
+                self.errormessage.setText('Invalid event selection.')
+            return None
+    
     def save_attendance(self):
-        """Update the attendance status for the selected pet and refresh display."""
-        if not self.selected_entry_id:
+        """Give every ticked pet (or just the selected one) the new status with a single UPDATE."""
+        entry_ids = self.ticked_entry_ids()
+        if not entry_ids and self.selected_entry_id:
+            entry_ids = [self.selected_entry_id]
+        if not entry_ids:
             if self.errormessage:
-                self.errormessage.setText('Please select an event and pet first.')
+                self.errormessage.setText('Please tick some pets or select an event and pet first.')
             return
         
         new_status = self.attendancestatus.currentText()
@@ -1134,70 +3344,82 @@ class updateattendance(QDialog):
                 self.errormessage.setText('Please select a new attendance status.')
             return
         
-        event_text = self.events.currentText()
-        if event_text == "Select Event":
-            if self.errormessage:
-                self.errormessage.setText('Please select an event.')
+        event_id = self.selected_event_id()
+        if event_id is None:
             return
         
         try:
-            event_id = int(event_text.split('(ID: ')[1].split(')')[0])
-        except:
+            set_attendance(event_id, entry_ids, new_status)
+        except Error as err:
+            print(f"Error updating attendance: {err}")
             if self.errormessage:
-                self.errormessage.setText('Invalid event selection.')
+                self.errormessage.setText('Error updating attendance status.')
             return
         
-        conn = get_db_connection()
-        if not conn:
-            if self.errormessage:
-                self.errormessage.setText('Database connection failed.')
+        self.patch_status(entry_ids, new_status)
+        if self.errormessage:
+            if len(entry_ids) == 1:
+                self.errormessage.setText(f'Attendance status updated to {new_status} successfully!')
+            else:
+                self.errormessage.setText(f'{len(entry_ids)} pets updated to {new_status} successfully!')
+        
+        # Clear selections
+        self.pets.setCurrentIndex(0)
+        self.attendancestatus.setCurrentIndex(0)
+        self.selected_entry_id = None
+    
+    def mark_rest_no_show(self):
+        """End of check-in: everyone still 'Registered' becomes 'No Show'."""
+        event_id = self.selected_event_id()
+        if event_id is None:
+            return
+        
+        from PyQt6.QtWidgets import QMessageBox
+        reply = QMessageBox.question(
+            self,
+            'Mark No Shows',
+            'Mark every pet still "Registered" for this event as No Show?',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
             return
         
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE pet_event_entry 
-                SET attendance_status = %s 
-                WHERE entry_id = %s
-            """, (new_status, self.selected_entry_id))
-            
-            conn.commit()
-            
-            if self.errormessage:
-                self.errormessage.setText(f'Attendance status updated to {new_status} successfully!')
-            
-            # Refresh the display
-            self.load_attendance_data(event_id)
-            
-            # Clear selections
-            self.pets.setCurrentIndex(0)
-            self.attendancestatus.setCurrentIndex(0)
-            self.selected_entry_id = None
-            
+            entry_ids = mark_remaining_no_show(event_id)
         except Error as err:
-            print(f"Error updating attendance: {err}")
-            if conn:
-                conn.rollback()
+            print(f"Error marking no shows: {err}")
             if self.errormessage:
                 self.errormessage.setText('Error updating attendance status.')
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.patch_status(entry_ids, 'No Show')
+        if self.errormessage:
+            self.errormessage.setText(f'{len(entry_ids)} pets marked as No Show.')
 
     def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmenu)
         
 # --------------------------------------------------------------------------------------------------------------------
 
 class vieweventaw(QDialog):
     def __init__(self):
         super(vieweventaw, self).__init__()
-        loadUi('./gui/eventawardsrep.ui', self)
+        load_ui_form(self, 'eventawardsrep.ui')
         self.exitbutt.clicked.connect(self.gotoadminmenu)
         self.errormessage = self.findChild(QtWidgets.QLabel, 'errormessage')
         
+        self.queries = QueryExecutor(self)
+        self.exports = QueryExecutor(self)
+        self.awards_query = None    # (sql, params) behind the rows on screen
+        self.exportbutt.clicked.connect(self.export_event_awards)
+        self.awards_model = ColumnTableModel(
+            ['Event Id', 'Event Name', 'Event Date', 'Event Type', 'Status', 'Winning Pet', 'Award Name'],
+            formatters={
+                1: text_or('Event'), 2: format_date_string, 3: text_or('N/A'),
+                4: text_or('Unknown'), 5: text_or('No winner'), 6: text_or('No award')
+            }, parent=self)
+        setup_report_view(self.eventawardsstatus, self.awards_model, row_height=40)
+
         # Load award types into the combo box
         self.load_award_types()
         
@@ -1205,107 +3427,93 @@ class vieweventaw(QDialog):
         self.eventawards.currentIndexChanged.connect(self.load_event_awards)
         
         # Load initial data
-        self.load_event_awards()
-    
-    def load_award_types(self):
-        """Fill the Award Type dropdown using is_special categories."""
-        self.eventawards.clear()
-        self.eventawards.addItem("All Awards")        # show everything
-        self.eventawards.addItem("Placement Awards")  # is_special = 0
-        self.eventawards.addItem("Special Awards")    # is_special = 1
-
-    def load_event_awards(self):
-        """Load events with their winning pets and awards based on selected award type."""
-        conn = get_db_connection()
-        if not conn:
-            return
-
-        try:
-            cursor = conn.cursor()
-            selected_type = self.eventawards.currentText()
-
-            base_select = """
-                SELECT e.event_id,
-                       e.name,
-                       e.date,
-                       e.type,
-                       CASE WHEN e.status = 1 THEN 'Open' ELSE 'Closed' END AS event_status,
-                       COALESCE(p.name, 'No winner') AS winning_pet,
-                       COALESCE(a.award_name, 'No award') AS award_name
-                FROM events e
-                LEFT JOIN awards a ON a.event_id = e.event_id
-                LEFT JOIN pets p ON p.pet_id = a.pet_id
-            """
-
-            params = ()
-            if selected_type == "Placement Awards":
-                query = base_select + " WHERE a.is_special = 0 ORDER BY e.event_id, a.award_id"
-                params = ()
-            elif selected_type == "Special Awards":
-                query = base_select + " WHERE a.is_special = 1 ORDER BY e.event_id, a.award_id"
-                params = ()
-            else:  # All Awards
-                query = base_select + " ORDER BY e.event_id, a.award_id"
-
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            # Set up table
-            self.eventawardsstatus.setRowCount(len(results))
-            self.eventawardsstatus.setColumnCount(7)
-            self.eventawardsstatus.setHorizontalHeaderLabels([
-                'Event Id', 'Event Name', 'Event Date', 'Event Type', 'Status', 'Winning Pet', 'Award Name'
-            ])
-            
-            # Populate table
-            for row, data in enumerate(results):
-                event_id = data[0]
-                event_name = data[1] or 'Event'
-                event_date = format_date_string(data[2])
-                event_type = data[3] or 'N/A'
-                event_status = data[4] or 'Unknown'
-                winning_pet = data[5] or 'No winner'
-                award_name = data[6] or 'No award'
-                
-                values = [str(event_id), event_name, event_date, event_type, event_status, winning_pet, award_name]
-                for col, value in enumerate(values):
-                    item = QtWidgets.QTableWidgetItem(str(value))
-                    if col in [1, 4, 5, 6]:  # Event Name, Status, Winning Pet, Award Type
-                        item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-                    self.eventawardsstatus.setItem(row, col, item)
-            
-            # Make table look good with word wrap and proper sizing
-            self.eventawardsstatus.setWordWrap(True)
-            header = self.eventawardsstatus.horizontalHeader()
-            if header:
-                # Use stretch mode to fill the widget initially, still allows manual resizing
-                header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-            vheader = self.eventawardsstatus.verticalHeader()
-            if vheader:
-                vheader.setVisible(False)
-                vheader.setDefaultSectionSize(40)
-            
-        except Error as err:
-            print(f"Error loading event awards: {err}")
-            if self.errormessage:
-                self.errormessage.setText('Error loading event awards.')
-        finally:
-            if conn:
-                conn.close()
+        self.load_event_awards()
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        self.load_event_awards()
+    
+    def load_award_types(self):
+        """Fill the Award Type dropdown using is_special categories."""
+        self.eventawards.clear()
+        self.eventawards.addItem("All Awards")        # show everything
+        self.eventawards.addItem("Placement Awards")  # is_special = 0
+        self.eventawards.addItem("Special Awards")    # is_special = 1
+
+    def load_event_awards(self):
+        """Load events with their winning pets and awards based on selected award type."""
+        selected_type = self.eventawards.currentText()
+
+        base_select = """
+            SELECT e.event_id,
+                   e.name,
+                   e.date,
+                   e.type,
+                   CASE WHEN e.status = 1 THEN 'Open' ELSE 'Closed' END AS event_status,
+                   COALESCE(p.name, 'No winner') AS winning_pet,
+                   COALESCE(a.award_name, 'No award') AS award_name
+            FROM events e
+            LEFT JOIN awards a ON a.event_id = e.event_id
+            LEFT JOIN pets p ON p.pet_id = a.pet_id
+        """
+
+        params = ()
+        if selected_type == "Placement Awards":
+            query = base_select + " WHERE a.is_special = 0 ORDER BY e.event_id, a.award_id"
+            params = ()
+        elif selected_type == "Special Awards":
+            query = base_select + " WHERE a.is_special = 1 ORDER BY e.event_id, a.award_id"
+            params = ()
+        else:  # All Awards
+            query = base_select + " ORDER BY e.event_id, a.award_id"
+
+        self.awards_query = (query, params)
+        self.queries.submit('awards', run_query, query, params,
+                            on_result=self.show_event_awards,
+                            on_error=self.show_awards_error)
+
+    def export_event_awards(self):
+        if self.awards_query is None:
+            return
+        start_report_export(self, self.exports, *self.awards_query, self.awards_model,
+                            'event_awards.csv', busy=[self.exportbutt], status_label=self.errormessage)
+
+    def show_event_awards(self, results):
+        """Fill the awards table from rows fetched in the background."""
+        self.awards_model.set_rows(results)
+
+    def show_awards_error(self, message):
+        print(f"Error loading event awards: {message}")
+        if self.errormessage:
+            self.errormessage.setText('Error loading event awards.')
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.queries.cancel_all()
+        super().hideEvent(event)
 
     def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmenu)
         
 # --------------------------------------------------------------------------------------------------------------------
 
 class eventattendancerep(QDialog):
     def __init__(self):
         super(eventattendancerep, self).__init__()
-        loadUi('./gui/eventattendancerep.ui', self)
+        load_ui_form(self, 'eventattendancerep.ui')
         self.exitbutt.clicked.connect(self.gotoadminmenu)
         self.totalpetmess = self.findChild(QtWidgets.QLabel, 'totalpetmess')
+        self.queries = QueryExecutor(self)
+        self.exports = QueryExecutor(self)
+        self.exportbutt.clicked.connect(self.export_attendance)
+        self.attendance_total = 0
+        self.attendance_model = KeysetTableModel(
+            ['Entry ID', 'Pet ID', 'Pet Name', 'Owner Name', 'Attendance Status', 'Total Count'],
+            formatters={
+                2: text_or('Unknown'), 3: text_or('Unknown'), 4: text_or('Unknown'),
+                5: lambda _: str(self.attendance_total)
+            }, on_error=self.show_attendance_error, parent=self)
+        setup_report_view(self.eventawardsstatus, self.attendance_model, row_height=40)
         
         # Load events and attendance statuses into dropdowns
         self.load_events()
@@ -1317,34 +3525,26 @@ class eventattendancerep(QDialog):
         
         # Load initial data (Defaults to All/All)
         self.load_attendance_data()
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        self.load_attendance_data()
     
     def load_events(self):
-        """Pull all events from the database and put them in the first dropdown."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
+        """Put all events (from the reference cache) in the first dropdown."""
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT event_id, name 
-                FROM events 
-                ORDER BY date, time
-            """)
-            
-            events = cursor.fetchall()
-            self.eventawards.clear()
-            # Default to All Events
-            self.eventawards.addItem("All Events")
-            
-            for event_id, event_name in events:
-                display_text = f"{event_name} (ID: {event_id})"
-                self.eventawards.addItem(display_text)
+            events = get_events()
         except Error as err:
             print(f"Error loading events: {err}")
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.eventawards.clear()
+        # Default to All Events
+        self.eventawards.addItem("All Events")
+        
+        for event in events:
+            display_text = f"{event['name']} (ID: {event['event_id']})"
+            self.eventawards.addItem(display_text)
     
     def load_attendance_statuses(self):
         """Load all possible attendance statuses into the second dropdown."""
@@ -1356,114 +3556,138 @@ class eventattendancerep(QDialog):
         self.eventawards_2.addItem("Registered")
     
     def load_attendance_data(self):
-        """Load attendance data dynamically based on filters."""
-        conn = get_db_connection()
-        if not conn:
-            return
+        """Load attendance data dynamically based on filters (query runs in the background)."""
+        # Base Query: Links Entry -> Pet -> Owner
+        query = """
+            SELECT t1.entry_id,
+                   p.pet_id,
+                   p.name AS pet_name,
+                   CONCAT(o.first_name, ' ', o.last_name) AS owner_name,
+                   t1.attendance_status
+            FROM pet_event_entry t1
+            JOIN pets p ON t1.pet_id = p.pet_id
+            JOIN owners o ON p.owner_id = o.owner_id
+            WHERE 1=1
+        """
+        
+        params = []
+        
+        # Apply Event Filter
+        event_text = self.eventawards.currentText()
+        if event_text and event_text != "All Events":
+            try:
+                event_id = int(event_text.split('(ID: ')[1].split(')')[0])
+                query += " AND t1.event_id = %s"
+                params.append(event_id)
+            except:
+                pass # Ignore parse error, show all
         
-        try:
-            cursor = conn.cursor()
-            
-            # Base Query: Links Entry -> Pet -> Owner
-            query = """
-                SELECT t1.entry_id,
-                       p.pet_id,
-                       p.name AS pet_name,
-                       CONCAT(o.first_name, ' ', o.last_name) AS owner_name,
-                       t1.attendance_status
-                FROM pet_event_entry t1
-                JOIN pets p ON t1.pet_id = p.pet_id
-                JOIN owners o ON p.owner_id = o.owner_id
-                WHERE 1=1
-            """
-            
-            params = []
-            
-            # Apply Event Filter
-            event_text = self.eventawards.currentText()
-            if event_text and event_text != "All Events":
-                try:
-                    event_id = int(event_text.split('(ID: ')[1].split(')')[0])
-                    query += " AND t1.event_id = %s"
-                    params.append(event_id)
-                except:
-                    pass # Ignore parse error, show all
-            
-            # Apply Status Filter
-            status_text = self.eventawards_2.currentText()
-            if status_text and status_text != "All Statuses":
-                query += " AND t1.attendance_status = %s"
-                params.append(status_text)
-            
-            # Order by Entry ID
-            query += " ORDER BY t1.entry_id"
-            
-            cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
-            
-            total_count = len(results)
-            
-            # Set up table
-            self.eventawardsstatus.setRowCount(total_count)
-            self.eventawardsstatus.setColumnCount(6)
-            self.eventawardsstatus.setHorizontalHeaderLabels([
-                'Entry ID', 'Pet ID', 'Pet Name', 'Owner Name', 'Attendance Status', 'Total Count'
-            ])
-            
-            # Populate table
-            for row, data in enumerate(results):
-                entry_id = data[0]
-                pet_id = data[1]
-                pet_name = data[2] or 'Unknown'
-                owner_name = data[3] or 'Unknown'
-                attendance_status = data[4] or 'Unknown'
-                
-                values = [str(entry_id), str(pet_id), pet_name, owner_name, attendance_status, str(total_count)]
-                
-                for col, value in enumerate(values):
-                    item = QtWidgets.QTableWidgetItem(str(value))
-                    if col in [2, 3, 4]:  # Pet Name, Owner Name, Status
-                        item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-                    self.eventawardsstatus.setItem(row, col, item)
-            
-            # Update the top summary label
-            if total_count > 0:
-                if status_text == "All Statuses":
-                    self.totalpetmess.setText(f'Total pets found: {total_count}')
-                else:
-                    self.totalpetmess.setText(f'Total pets with {status_text} status: {total_count}')
+        # Apply Status Filter
+        status_text = self.eventawards_2.currentText()
+        if status_text and status_text != "All Statuses":
+            query += " AND t1.attendance_status = %s"
+            params.append(status_text)
+        
+        # Page through in entry_id order (the keyset)
+        self.attendance_model.start(KeysetQuery(query, params, ['t1.entry_id'], [0]))
+
+        self.queries.submit('attendance_count', fetch_row_count, query, tuple(params),
+                            on_result=lambda count: self.show_attendance_summary(count, status_text),
+                            on_error=self.show_attendance_error,
+                            status_label=self.totalpetmess)
+
+    def export_attendance(self):
+        if self.attendance_model.query is None:
+            return
+        start_report_export(self, self.exports, *self.attendance_model.query.full_sql(), self.attendance_model,
+                            'attendance_report.csv', busy=[self.exportbutt], status_label=self.totalpetmess)
+
+    def show_attendance_summary(self, total_count, status_text):
+        """Update the summary label (and the Total Count column) with the filtered total."""
+        self.attendance_total = total_count
+        self.eventawardsstatus.viewport().update()
+        
+        # Update the top summary label
+        if total_count > 0:
+            if status_text == "All Statuses":
+                self.totalpetmess.setText(f'Total pets found: {total_count}')
             else:
-                self.totalpetmess.setText('No pets found for the selected criteria.')
-            
-            # Make table look good
-            self.eventawardsstatus.setWordWrap(True)
-            self.eventawardsstatus.resizeColumnsToContents()
-            header = self.eventawardsstatus.horizontalHeader()
-            if header:
-                header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-            vheader = self.eventawardsstatus.verticalHeader()
-            if vheader:
-                vheader.setVisible(False)
-                vheader.setDefaultSectionSize(40)
-            
-        except Error as err:
-            print(f"Error loading attendance data: {err}")
-            self.totalpetmess.setText('Error loading attendance data.')
-        finally:
-            if conn:
-                conn.close()
+                self.totalpetmess.setText(f'Total pets with {status_text} status: {total_count}')
+        else:
+            self.totalpetmess.setText('No pets found for the selected criteria.')
+
+    def show_attendance_error(self, message):
+        print(f"Error loading attendance data: {message}")
+        self.totalpetmess.setText('Error loading attendance data.')
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.queries.cancel_all()
+        self.attendance_model.cancel()
+        super().hideEvent(event)
 
     def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmenu)
         
 # --------------------------------------------------------------------------------------------------------------------
 
+# Where live mode starts on an empty participation log
+_LOG_TAIL_START = ('1000-01-01', '00:00:00', 0)
+# Live mode polls in (action_date, action_time, log_id) order, served by idx_log_keyset
+_LOG_TAIL_ORDER = ['pl.action_date', 'pl.action_time', 'pl.log_id']
+
+
+def log_time_text(action_time):
+    """'HH:MM:SS' for a TIME column (the connector hands those back as timedelta) or TEXT one."""
+    if isinstance(action_time, timedelta):
+        seconds = int(action_time.total_seconds())
+        return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return str(action_time)
+
+
+def log_tail_key(action_date, action_time, log_id):
+    """A log row's (date, time, log_id) as comparable strings, whether the columns are TEXT or DATE/TIME."""
+    day = to_python_date(action_date)
+    return (day.strftime("%Y-%m-%d") if day else str(action_date), log_time_text(action_time), log_id)
+
+
+def log_tail_since(tail_key, overlap_s):
+    """Where a live-mode poll resumes: overlap_s seconds before the newest row seen."""
+    if tail_key == _LOG_TAIL_START:
+        return tail_key
+    try:
+        newest = datetime.strptime(f"{tail_key[0]} {tail_key[1][:8]}", "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return tail_key[0], tail_key[1], 0
+    since = newest - timedelta(seconds=overlap_s)
+    return since.strftime("%Y-%m-%d"), since.strftime("%H:%M:%S"), 0
+
+
+def fetch_log_totals(sql, params):
+    """(filtered row count, live-mode overlap in seconds) for the participation log screen.
+
+    The overlap has to cover the longest a writer can sit in a lock wait between stamping
+    its log row and committing it, so it follows the server's innodb_lock_wait_timeout.
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM ({sql}) AS filtered_rows", params)
+        count = cursor.fetchone()[0]
+        cursor.execute("SELECT @@GLOBAL.innodb_lock_wait_timeout")
+        lock_wait = int(cursor.fetchone()[0] or 0)
+        return count, lock_wait + LOG_TAIL_OVERLAP_S
+    finally:
+        conn.close()
+
+
 class participantlog(QDialog):
     def __init__(self):
         super(participantlog, self).__init__()
-        loadUi('./gui/participantlog.ui', self)
+        load_ui_form(self, 'participantlog.ui')
         self.exitbutt.clicked.connect(self.gotoadminmenu)
 
         # Connect filters to the load function
@@ -1473,27 +3697,49 @@ class participantlog(QDialog):
         self.owerrormes = self.findChild(QtWidgets.QLabel, 'owerrormes')
     
         self.logsummary = self.findChild(QtWidgets.QLabel, 'logsummary')
+        self.queries = QueryExecutor(self)
+        self.exports = QueryExecutor(self)
+        self.exportbutt.clicked.connect(self.export_participation_log)
+
+        # Log table is a model/view pair: None shows as N/A, money columns get a peso sign
+        money = lambda value: 'N/A' if value is None else f"₱{float(value):.2f}"
+        self.log_model = KeysetTableModel([
+            'Log ID', 'Owner Name', 'Action Type', 'Action Date', 'Action Time',
+            'Original Event', 'New Event', 'Reason', 'Refund Amount', 'Top Up Amount'
+        ], formatters={4: log_time_text, 8: money, 9: money}, empty='N/A', on_error=self.show_log_error,
+           on_first_page=self.start_log_tail, parent=self)
+        setup_report_view(self.participantlog, self.log_model)
+
+        # Live mode: poll for log rows newer than the last one we've seen
+        self.log_filter = None      # (filtered SQL, params, action text) of the current view
+        self.log_count = 0
+        self.tail_key = None        # newest (action_date, action_time, log_id) shown; None until the first page
+        self.tail_seen = {}         # log_id -> key of rows already shown within the overlap window
+        self.tail_overlap = None    # seconds each poll re-reads; None until counted
+        self.live_timer = QtCore.QTimer(self)
+        self.live_timer.setInterval(LOG_TAIL_POLL_MS)
+        self.live_timer.timeout.connect(self.poll_new_logs)
+        self.livefollow = self.findChild(QtWidgets.QCheckBox, 'livefollow')
+        if self.livefollow:
+            self.livefollow.toggled.connect(self.set_live_mode)
 
         # Load filters and initial data
         self.load_filter_options()
         self.load_participation_log()
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        self.load_participation_log()
     
     def load_filter_options(self):
         """Populate the Event and Action Type dropdowns."""
-        conn = get_db_connection()
-        if not conn:
-            return
-            
         try:
-            cursor = conn.cursor()
-            
-            # Load Events
+            # Load Events (newest first, from the reference cache)
             self.filter_event.clear()
             self.filter_event.addItem("All Events")
             
-            cursor.execute("SELECT event_id, name FROM events ORDER BY date DESC")
-            for event_id, name in cursor.fetchall():
-                self.filter_event.addItem(f"{name} (ID: {event_id})")
+            for event in get_events(newest_first=True):
+                self.filter_event.addItem(f"{event['name']} (ID: {event['event_id']})")
                 
             # Load Action Types
             self.filter_action.clear()
@@ -1506,143 +3752,412 @@ class participantlog(QDialog):
             
         except Error as err:
             print(f"Error loading filters: {err}")
-        finally:
-            conn.close()
 
     def load_participation_log(self):
-        """Pull all participation log stuff and show names instead of those boring IDs."""
-        conn = get_db_connection()
-        if not conn:
-            if self.owerrormes:
-                self.owerrormes.setText('Database connection failed.')
+        """Pull all participation log stuff and show names instead of those boring IDs.
+
+        Rows are paged in the background as the table scrolls; changing a filter again
+        cancels the older request.
+        """
+        # Base query: Grab all the log entries but swap out IDs for actual names
+        query = """
+            SELECT pl.log_id, 
+                   CONCAT(o.first_name, ' ', o.last_name) as owner_name,
+                   pl.action_type, 
+                   pl.action_date, 
+                   pl.action_time,
+                   e_orig.name as original_event_name,
+                   e_new.name as new_event_name,
+                   pl.reason, 
+                   pl.refund_amount, 
+                   pl.top_up_amount
+            FROM participation_log pl
+            LEFT JOIN event_registration er ON pl.registration_id = er.registration_id
+            LEFT JOIN owners o ON er.owner_id = o.owner_id
+            LEFT JOIN events e_orig ON pl.original_event_id = e_orig.event_id
+            LEFT JOIN events e_new ON pl.new_event_id = e_new.event_id
+            WHERE 1=1
+        """
+
+        params = []
+
+        # Apply Event Filter
+        event_text = self.filter_event.currentText()
+        if event_text and event_text != "All Events":
+            try:
+                # Extract ID from "Event Name (ID: 5)"
+                event_id = int(event_text.split('(ID: ')[1].split(')')[0])
+                query += " AND (pl.original_event_id = %s OR pl.new_event_id = %s)"
+                params.extend([event_id, event_id])
+            except:
+                pass
+
+        # Apply Action Type Filter
+        action_text = self.filter_action.currentText()
+        
+        if action_text == "Other":
+            # Filter for anything NOT in the main categories
+            query += " AND pl.action_type NOT IN ('Paid', 'Cancelled', 'Transferred', 'Modified')"
+            
+        elif action_text and action_text != "All Actions":
+            # Standard exact match
+            query += " AND pl.action_type = %s"
+            params.append(action_text)
+        
+        # Rows come a page at a time, newest first; (date, time, log_id) is the keyset
+        self.log_model.start(KeysetQuery(
+            query, params, ['pl.action_date', 'pl.action_time', 'pl.log_id'], [3, 4, 0], descending=True
+        ))
+
+        # The summary needs the full total (one COUNT(*) over the same filters); the same
+        # trip reads the lock wait timeout live mode's overlap is sized from. Live mode
+        # itself starts from the first page's rows (start_log_tail)
+        self.log_filter = (query, tuple(params), action_text)
+        self.tail_key = None
+        self.tail_seen = {}
+        self.tail_overlap = None
+        self.queries.cancel('log_tail')
+        self.queries.submit('log_count', fetch_log_totals, query, tuple(params),
+                            on_result=self.show_log_totals,
+                            on_error=self.show_log_error,
+                            status_label=self.logsummary)
+
+    def export_participation_log(self):
+        """Every row matching the filters, not just the pages loaded (or the live-mode window)."""
+        if self.log_model.query is None:
             return
-        
-        try:
-            cursor = conn.cursor()
-            
-            # Base query: Grab all the log entries but swap out IDs for actual names
-            query = """
-                SELECT pl.log_id, 
-                       CONCAT(o.first_name, ' ', o.last_name) as owner_name,
-                       pl.action_type, 
-                       pl.action_date, 
-                       pl.action_time,
-                       e_orig.name as original_event_name,
-                       e_new.name as new_event_name,
-                       pl.reason, 
-                       pl.refund_amount, 
-                       pl.top_up_amount
-                FROM participation_log pl
-                LEFT JOIN event_registration er ON pl.registration_id = er.registration_id
-                LEFT JOIN owners o ON er.owner_id = o.owner_id
-                LEFT JOIN events e_orig ON pl.original_event_id = e_orig.event_id
-                LEFT JOIN events e_new ON pl.new_event_id = e_new.event_id
-                WHERE 1=1
-            """
-
-            params = []
-
-            # Apply Event Filter
-            event_text = self.filter_event.currentText()
-            if event_text and event_text != "All Events":
-                try:
-                    # Extract ID from "Event Name (ID: 5)"
-                    event_id = int(event_text.split('(ID: ')[1].split(')')[0])
-                    query += " AND (pl.original_event_id = %s OR pl.new_event_id = %s)"
-                    params.extend([event_id, event_id])
-                except:
-                    pass
-
-            # Apply Action Type Filter
-            action_text = self.filter_action.currentText()
-            
-            if action_text == "Other":
-                # Filter for anything NOT in the main categories
-                query += " AND pl.action_type NOT IN ('Paid', 'Cancelled', 'Transferred', 'Modified')"
-                
-            elif action_text and action_text != "All Actions":
-                # Standard exact match
-                query += " AND pl.action_type = %s"
-                params.append(action_text)
-            
-            # Final ordering
-            query += " ORDER BY pl.action_date DESC, pl.action_time DESC"
-            
-            cursor.execute(query, tuple(params))
-            logs = cursor.fetchall()
-
-            # Update the Summary Label
-            count = len(logs)
-            if self.logsummary:
-                # Determine the text to display based on filters
-                display_action = action_text if action_text and action_text != "All Actions" else "Total"
-                
-                if count > 0:
-                    if display_action == "Total":
-                         self.logsummary.setText(f"Total logs found: {count}")
-                    else:
-                         self.logsummary.setText(f"Total '{display_action}' logs found: {count}")
+        start_report_export(self, self.exports, *self.log_model.query.full_sql(), self.log_model,
+                            'participation_log.csv', busy=[self.exportbutt], status_label=self.logsummary)
+
+    def show_log_totals(self, totals):
+        self.log_count, self.tail_overlap = totals
+        self.show_log_summary(self.log_count, self.log_filter[2])
+        if self.tail_key is not None:
+            self.forget_old_tail_rows()
+
+    def start_log_tail(self, rows):
+        """Live mode picks up from the newest row the first page showed (rows are newest first).
+
+        Seeding from the same rows the table holds means nothing committed between the
+        page and some other query can slip through unshown.
+        """
+        self.tail_key = log_tail_key(rows[0][3], rows[0][4], rows[0][0]) if rows else _LOG_TAIL_START
+        self.tail_seen = {row[0]: log_tail_key(row[3], row[4], row[0]) for row in rows}
+        if self.tail_overlap is not None:
+            self.forget_old_tail_rows()
+
+    def forget_old_tail_rows(self):
+        """Only rows inside the overlap window can come back from a poll."""
+        since = log_tail_since(self.tail_key, self.tail_overlap)
+        self.tail_seen = {log_id: key for log_id, key in self.tail_seen.items() if key >= since}
+
+    def set_live_mode(self, enabled):
+        """Live mode keeps the newest LOG_TAIL_MAX_ROWS rows and adds new ones as they're logged."""
+        if enabled:
+            self.log_model.max_rows = LOG_TAIL_MAX_ROWS
+            self.log_model.trim(LOG_TAIL_MAX_ROWS)
+            self.live_timer.start()
+            self.poll_new_logs()
+        else:
+            self.live_timer.stop()
+            self.queries.cancel('log_tail')
+            self.log_model.max_rows = REPORT_MAX_ROWS
+
+    def poll_new_logs(self):
+        """Ask for rows from just before the newest one seen, in time order, with the current filters applied.
+
+        log_id alone can't be the cursor: each kiosk draws ids from its own block, so a row
+        logged later can have a smaller id. Rows the window returns again are skipped.
+        """
+        if self.tail_key is None or self.tail_overlap is None or self.log_filter is None \
+                or self.queries.is_loading('log_tail'):
+            return
+        query, params, _ = self.log_filter
+        tail = KeysetQuery(query, params, _LOG_TAIL_ORDER, [3, 4, 0])
+        since = log_tail_since(self.tail_key, self.tail_overlap)
+        self.queries.submit('log_tail', run_query, *tail.page_sql(since, LOG_TAIL_MAX_ROWS),
+                            on_result=self.add_new_logs,
+                            on_error=lambda msg: print(f"Error polling logs: {msg}"))
+
+    def add_new_logs(self, rows):
+        keys = [(row, log_tail_key(row[3], row[4], row[0])) for row in rows]
+        new_rows = [row for row, key in keys if row[0] not in self.tail_seen]
+        for row, key in keys:
+            self.tail_seen[row[0]] = key
+            self.tail_key = max(self.tail_key, key)
+        self.forget_old_tail_rows()
+        if not new_rows:
+            return
+        # Newest first, same as the rest of the table
+        self.log_model.prepend_rows(new_rows[::-1])
+        self.log_model.trim(LOG_TAIL_MAX_ROWS)
+        self.log_count += len(new_rows)
+        self.show_log_summary(self.log_count, self.log_filter[2])
+
+    def show_log_summary(self, count, action_text):
+        """Update the summary line once the filtered total is known."""
+        if self.logsummary:
+            # Determine the text to display based on filters
+            display_action = action_text if action_text and action_text != "All Actions" else "Total"
+            
+            if count > 0:
+                if display_action == "Total":
+                     self.logsummary.setText(f"Total logs found: {count}")
                 else:
-                    if display_action == "Total":
-                        self.logsummary.setText("No logs found.")
-                    else:
-                        self.logsummary.setText(f"No '{display_action}' logs found.")
-            
-            # Set up table
-            self.participantlog.setRowCount(len(logs))
-            self.participantlog.setColumnCount(10)
-            self.participantlog.setHorizontalHeaderLabels([
-                'Log ID', 'Owner Name', 'Action Type', 'Action Date', 'Action Time',
-                'Original Event', 'New Event', 'Reason', 'Refund Amount', 'Top Up Amount'
-            ])
-            
-            for row, log in enumerate(logs):
-                for col, value in enumerate(log):
-                    if value is None:
-                        display_value = 'N/A'
-                    elif isinstance(value, (int, float)):
-                        if col == 8 or col == 9:  # refund or top_up
-                             display_value = f"₱{float(value):.2f}"
-                        else:
-                            display_value = str(value)
-                    else:
-                        display_value = str(value)
-                    
-                    item = QtWidgets.QTableWidgetItem(display_value)
-                    if col in [1, 2, 5, 6, 7]:
-                        item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-                    self.participantlog.setItem(row, col, item)
-                    
-            self.participantlog.setWordWrap(True)
-            # Resize columns to contents
-            self.participantlog.resizeColumnsToContents()
-            # Force the header to stretch to fill the available width
-            header = self.participantlog.horizontalHeader()
-            header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-
-        except Error as err:
-            print(f"Error loading logs: {err}")
-        finally:
-            if conn:
-                conn.close()
+                     self.logsummary.setText(f"Total '{display_action}' logs found: {count}")
+            else:
+                if display_action == "Total":
+                    self.logsummary.setText("No logs found.")
+                else:
+                    self.logsummary.setText(f"No '{display_action}' logs found.")
+
+    def show_log_error(self, message):
+        print(f"Error loading logs: {message}")
+        if self.owerrormes:
+            self.owerrormes.setText('Error loading logs.')
+        if self.logsummary:
+            self.logsummary.setText('')
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.live_timer.stop()
+        self.queries.cancel_all()
+        self.log_model.cancel()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.livefollow and self.livefollow.isChecked():
+            self.live_timer.start()
 
     def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(adminmenu)
         
 # --------------------------------------------------------------------------------------------------------------------
 
-class awardpetscore(QDialog):
+# "1st", "2nd", "3rd", "10th", ... anywhere in a placement award's name
+_PLACE_PATTERN = re.compile(r'\b(\d+)(?:st|nd|rd|th)\b', re.IGNORECASE)
+# Placement award names that spell the place out instead
+PLACEMENT_ALIASES = {'champion': 1, 'winner': 1, 'runner up': 2, 'runner-up': 2}
+
+
+def placement_rank(award_name):
+    """Which place a placement award is for (1 = winner), or None if the name doesn't say."""
+    match = _PLACE_PATTERN.search(award_name or '')
+    if match:
+        return int(match.group(1))
+    lowered = (award_name or '').lower()
+    for alias, rank in PLACEMENT_ALIASES.items():
+        if alias in lowered:
+            return rank
+    return None
+
+
+class PlacementLeaderboard:
+    """One event's scores kept sorted in memory, plus who holds each placement award.
+
+    Highest score ranks first; ties go to the lower entry_id (the earlier entry) so the
+    order never depends on what order the database hands rows back in.
+    """
+
+    def __init__(self, event_id, entries, awards):
+        self.event_id = event_id
+        self.entries = {}        # entry_id -> [pet_id, score or None]
+        self.entry_for_pet = {}  # pet_id -> entry_id
+        self._ranking = []       # sorted (-score, entry_id)
+        self.awards = []         # [award_id, place, pet_id] for awards whose name gives a place
+        self.is_placement = bool(awards)
+        for entry_id, pet_id, score in entries:
+            self.entries[entry_id] = [pet_id, None]
+            self.entry_for_pet.setdefault(pet_id, entry_id)
+            if score is not None:
+                self.set_score(entry_id, score)
+        for award_id, award_name, pet_id in awards:
+            place = placement_rank(award_name)
+            if place:
+                self.awards.append([award_id, place, pet_id])
+
+    def set_score(self, entry_id, score):
+        """Move an entry to its new spot: one bisect to find the old key, one to insert the new one."""
+        entry = self.entries[entry_id]
+        if entry[1] is not None:
+            del self._ranking[bisect.bisect_left(self._ranking, (-entry[1], entry_id))]
+        entry[1] = float(score)
+        bisect.insort(self._ranking, (-entry[1], entry_id))
+
+    def score_of(self, entry_id):
+        return self.entries[entry_id][1] if entry_id in self.entries else None
+
+    def top(self, count):
+        """pet_ids of the best `count` scored entries, in order."""
+        return [self.entries[entry_id][0] for _, entry_id in self._ranking[:count]]
+
+    def placement_changes(self):
+        """(pet_id, award_id) for each placement award whose holder no longer matches the ranking."""
+        if not self.awards:
+            return []
+        podium = self.top(max(place for _, place, _ in self.awards))
+        changes = []
+        for award_id, place, pet_id in self.awards:
+            # Places nobody has scored for yet keep whoever they had
+            if place <= len(podium) and podium[place - 1] != pet_id:
+                changes.append((podium[place - 1], award_id))
+        return changes
+
+    def apply_changes(self, changes):
+        """Remember the placement changes once they're committed."""
+        holders = {award_id: pet_id for pet_id, award_id in changes}
+        for award in self.awards:
+            if award[0] in holders:
+                award[2] = holders[award[0]]
+
+
+def load_leaderboard(event_id):
+    """Entries, scores and placement awards for one event, read once when the event is picked."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT entry_id, pet_id, pet_result
+            FROM pet_event_entry
+            WHERE event_id = %s
+        """, (event_id,))
+        entries = cursor.fetchall()
+        cursor.execute("""
+            SELECT award_id, award_name, pet_id
+            FROM awards
+            WHERE event_id = %s AND is_special = 0
+            ORDER BY award_id
+        """, (event_id,))
+        awards = cursor.fetchall()
+        return PlacementLeaderboard(event_id, entries, awards)
+    finally:
+        conn.close()
+
+
+# Score rows per executemany round trip during a CSV import
+SCORE_IMPORT_BATCH = 1000
+# Same ceiling as the score spin box
+MAX_SCORE = 10.00
+
+
+def read_score_rows(path, leaderboard):
+    """Stream a judges' CSV, yielding (line, entry_id, score, error) per data row.
+
+    The header must name a `score` column and either `entry_id` or `pet_id`; ids are
+    checked against the event's entries in the leaderboard, not the database.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        reader = csv.reader(handle)
+        header = [cell.strip().lower() for cell in next(reader, [])]
+        if 'score' not in header or not {'entry_id', 'pet_id'} & set(header):
+            raise ValueError("the header needs a score column and an entry_id or pet_id column")
+        id_name = 'entry_id' if 'entry_id' in header else 'pet_id'
+        id_col = header.index(id_name)
+        score_col = header.index('score')
+
+        for row in reader:
+            line = reader.line_num
+            if not any(cell.strip() for cell in row):
+                continue
+            try:
+                row_id = int(row[id_col])
+            except (IndexError, ValueError):
+                yield line, None, None, f"{id_name} is missing or not a number"
+                continue
+            entry_id = row_id if id_name == 'entry_id' else leaderboard.entry_for_pet.get(row_id)
+            if entry_id not in leaderboard.entries:
+                yield line, None, None, f"{id_name} {row_id} is not entered in this event"
+                continue
+            try:
+                score = round(float(row[score_col]), 2)
+            except (IndexError, ValueError):
+                yield line, None, None, "score is missing or not a number"
+                continue
+            if not 0 <= score <= MAX_SCORE:
+                yield line, None, None, f"score {score} is outside 0-{MAX_SCORE:.0f}"
+                continue
+            yield line, entry_id, score, None
+
+
+def import_scores(event_id, path, leaderboard=None):
+    """Apply a judges' score CSV to one event in a single transaction.
+
+    Good rows go out in executemany batches as the file streams (a later row for the same
+    entry wins); placements are recomputed once at the end. Returns (applied, errors, seconds)
+    where errors is [(line, message)]. The leaderboard is updated as rows are read, so
+    reload it if this raises.
+    """
+    started = time.perf_counter()
+    leaderboard = leaderboard or load_leaderboard(event_id)
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+
+    applied = 0
+    errors = []
+    batch = []
+    try:
+        cursor = conn.cursor()
+        update_sql = "UPDATE pet_event_entry SET pet_result = %s WHERE entry_id = %s"
+        for line, entry_id, score, error in read_score_rows(path, leaderboard):
+            if error:
+                errors.append((line, error))
+                continue
+            leaderboard.set_score(entry_id, score)
+            batch.append((score, entry_id))
+            if len(batch) >= SCORE_IMPORT_BATCH:
+                cursor.executemany(update_sql, batch)
+                applied += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(update_sql, batch)
+            applied += len(batch)
+
+        # One placement pass for the whole file
+        changes = leaderboard.placement_changes()
+        if changes:
+            cursor.executemany("UPDATE awards SET pet_id = %s WHERE award_id = %s", changes)
+        conn.commit()
+        leaderboard.apply_changes(changes)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    rows = applied + len(errors)
+    print(f"Score import for event {event_id}: {rows} rows ({applied} applied, {len(errors)} rejected) "
+          f"in {elapsed:.2f} s, {rows / elapsed if elapsed else 0:.0f} rows/s")
+    return applied, errors, elapsed
+
+
+def write_score_error_report(path, errors):
+    """Write rejected rows to <name>_errors.csv next to the import; returns that path."""
+    report_path = os.path.splitext(path)[0] + '_errors.csv'
+    with open(report_path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['line', 'error'])
+        writer.writerows(errors)
+    return report_path
+
+
+class awardpetscore(FormScreen):
     def __init__(self):
         super(awardpetscore, self).__init__()
-        loadUi('./gui/awardgivingpetscore.ui', self)
+        load_ui_form(self, 'awardgivingpetscore.ui')
         self.petexitbutt.clicked.connect(self.gotoadminmenu)
         self.savebutt.clicked.connect(self.save_score_and_award)
         self.message = self.findChild(QtWidgets.QLabel, 'message')
         self.editawardsbutt = self.findChild(QtWidgets.QPushButton, 'editawardsbutt')
         if self.editawardsbutt:
             self.editawardsbutt.clicked.connect(self.open_edit_awards)
+        self.importscoresbutt = self.findChild(QtWidgets.QPushButton, 'importscoresbutt')
+        if self.importscoresbutt:
+            self.importscoresbutt.clicked.connect(self.import_scores_csv)
         
         # Load events and awards
         self.load_events()
@@ -1650,6 +4165,7 @@ class awardpetscore(QDialog):
         # track currently selected event
         self.current_event_id = None
         self.current_event_is_placement = False
+        self.leaderboard = None
         
         # Connect event selection to load pets and display data
         self.pastevents.currentIndexChanged.connect(self.on_event_selected)
@@ -1679,31 +4195,19 @@ class awardpetscore(QDialog):
         self.update_selected_pet_score()
     
     def load_events(self):
-        """Grab all events and put them in the dropdown."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
+        """Grab all events (newest first) and put them in the dropdown."""
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT event_id, name 
-                FROM events 
-                ORDER BY date DESC, time DESC
-            """)
-            
-            events = cursor.fetchall()
-            self.pastevents.clear()
-            self.pastevents.addItem("Select Event")
-            
-            for event_id, event_name in events:
-                display_text = f"{event_name} (ID: {event_id})"
-                self.pastevents.addItem(display_text)
+            events = get_events(newest_first=True)
         except Error as err:
             print(f"Error loading events: {err}")
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.pastevents.clear()
+        self.pastevents.addItem("Select Event")
+        
+        for event in events:
+            display_text = f"{event['name']} (ID: {event['event_id']})"
+            self.pastevents.addItem(display_text)
     
     def load_awards(self, event_id: int):
         """Load awards for this event into dropdown, only special awards."""
@@ -1731,27 +4235,6 @@ class awardpetscore(QDialog):
             if conn:
                 conn.close()
     
-    def is_placement_event(self, event_id: int) -> bool:
-        """Return True if this event uses placement awards (is_special=0)."""
-        conn = get_db_connection()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM awards 
-                WHERE event_id = %s AND is_special = 0
-            """, (event_id,))
-            count = cursor.fetchone()[0] or 0
-            return count > 0
-        except Error as err:
-            print(f"Error checking event award type: {err}")
-            return False
-        finally:
-            if conn:
-                conn.close()
-
     def on_event_selected(self):
         """When an event is selected, load pets and display data."""
         event_text = self.pastevents.currentText()
@@ -1760,6 +4243,7 @@ class awardpetscore(QDialog):
             self.petswhoparticipated.clear()
             self.current_event_id = None
             self.current_event_is_placement = False
+            self.leaderboard = None
             # Enable everything by default
             self.doubleSpinBox.setEnabled(True)
             self.awards.setEnabled(True)
@@ -1771,11 +4255,18 @@ class awardpetscore(QDialog):
             self.eventstatus.setRowCount(0)
             self.current_event_id = None
             self.current_event_is_placement = False
+            self.leaderboard = None
             return
 
         self.current_event_id = event_id
+        # Scores and placement awards are read once here; saving a score works off this copy
+        try:
+            self.leaderboard = load_leaderboard(event_id)
+        except Error as err:
+            print(f"Error loading leaderboard: {err}")
+            self.leaderboard = None
         # Decide if this is a placement event (has placement‑type awards)
-        self.current_event_is_placement = self.is_placement_event(event_id)
+        self.current_event_is_placement = bool(self.leaderboard and self.leaderboard.is_placement)
 
         # UI rules:
         # placement event → score enabled, awards dropdown disabled
@@ -1825,39 +4316,24 @@ class awardpetscore(QDialog):
                 conn.close()
     
     def on_pet_selected(self):
-        """When a pet is selected, store its ID for saving."""
+        """When a pet is selected, store its ID (and entry, from the leaderboard) for saving."""
         pet_text = self.petswhoparticipated.currentText()
         event_text = self.pastevents.currentText()
         
-        if pet_text == "Select Pet" or event_text == "Select Event":
+        if pet_text == "Select Pet" or event_text == "Select Event" or self.leaderboard is None:
             self.selected_pet_id = None
             self.selected_entry_id = None
             return
         
         try:
             pet_id = int(pet_text.split('(ID: ')[1].split(')')[0])
-            event_id = int(event_text.split('(ID: ')[1].split(')')[0])
-            
-            conn = get_db_connection()
-            if conn:
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT entry_id 
-                        FROM pet_event_entry 
-                        WHERE pet_id = %s AND event_id = %s
-                        LIMIT 1
-                    """, (pet_id, event_id))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        self.selected_entry_id = result[0]
-                        self.selected_pet_id = pet_id
-                finally:
-                    conn.close()
-        except:
+        except (IndexError, ValueError):
             self.selected_pet_id = None
             self.selected_entry_id = None
+            return
+        
+        self.selected_entry_id = self.leaderboard.entry_for_pet.get(pet_id)
+        self.selected_pet_id = pet_id if self.selected_entry_id is not None else None
     
     def load_event_data(self, event_id):
         """Load event data with pets registered and display in table."""
@@ -1944,70 +4420,39 @@ class awardpetscore(QDialog):
             # Update pet_result in pet_event_entry
             if self.current_event_is_placement:
                 # Placement event: update score only
-                # 1) Save this pet's score
+                # 1) Re-rank in memory and work out which placement awards change hands
                 score = self.doubleSpinBox.value()
+                self.leaderboard.set_score(self.selected_entry_id, score)
+                changes = self.leaderboard.placement_changes()
+
+                # 2) Save this pet's score and every placement change in one go
                 cursor.execute("""
                     UPDATE pet_event_entry
                     SET pet_result = %s
                     WHERE entry_id = %s
                 """, (score, self.selected_entry_id))
-
-                # 2) Recompute rankings (highest score first)
-                cursor.execute("""
-                    SELECT pee.pet_id
-                    FROM pet_event_entry pee
-                    WHERE pee.event_id = %s
-                      AND pee.pet_result IS NOT NULL
-                    ORDER BY pee.pet_result DESC
-                """, (event_id,))
-                ranking = cursor.fetchall()
-
-                # 3) Update 1st place / champion (top of the ranking)
-                if len(ranking) >= 1:
-                    win_pet_id = ranking[0][0]
-                    cursor.execute("""
+                if changes:
+                    cursor.executemany("""
                         UPDATE awards
                         SET pet_id = %s
-                        WHERE event_id = %s
-                          AND is_special = 0
-                          AND (
-                                award_name LIKE '%1st%' OR
-                                award_name LIKE '%Champion%'
-                              )
-                    """, (win_pet_id, event_id))
-
-                # 4) Update 2nd place / runner‑up (second in the ranking)
-                if len(ranking) >= 2:
-                    win2_pet_id = ranking[1][0]
-                    cursor.execute("""
-                        SELECT award_id
-                        FROM awards
-                        WHERE event_id = %s
-                          AND is_special = 0
-                          AND (
-                                award_name LIKE '%2nd%' OR
-                                award_name LIKE '%Runner Up%'
-                            )
-                        LIMIT 1
-                    """, (event_id,))
-
-                    row = cursor.fetchone()
-
-                    if row:
-                        award_id = row[0]
-                        cursor.execute("""
-                            UPDATE awards
-                            SET pet_id = %s
-                            WHERE award_id = %s
-                        """, (win2_pet_id, award_id))
+                        WHERE award_id = %s
+                    """, changes)
 
                 conn.commit()
+                self.leaderboard.apply_changes(changes)
                 if self.message:
                     self.message.setText(
                         f'Score {score:.2f} saved and placements updated based on current rankings.'
                     )
                 if self.pet_score_label:
                     self.pet_score_label.setText(f"Pet score: {score:.2f}")
+
+                # Nothing in the table depends on scores, so just reset the form
+                self.petswhoparticipated.setCurrentIndex(0)
+                self.doubleSpinBox.setValue(0.00)
+                self.selected_pet_id = None
+                self.selected_entry_id = None
+                return
             else:
                 # Special event: award only, no score
                 award_name = self.awards.currentText()
@@ -2080,6 +4525,12 @@ class awardpetscore(QDialog):
                 conn.rollback()
             if self.message:
                 self.message.setText('Error saving score or award.')
+            if self.current_event_is_placement:
+                # The in-memory ranking already moved; start again from what the database has
+                try:
+                    self.leaderboard = load_leaderboard(event_id)
+                except Error as reload_err:
+                    print(f"Error reloading leaderboard: {reload_err}")
         finally:
             if conn:
                 conn.close()
@@ -2090,14 +4541,48 @@ class awardpetscore(QDialog):
                 self.message.setText("Please select an event first.")
             return
 
-        edit_screen = EditAwardsDialog(self.current_event_id)   # no parent needed
-        widget.addWidget(edit_screen)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(EditAwardsDialog, self.current_event_id)
         
         # after closing, reload awards for current event
         if self.current_event_id:
             self.load_awards(self.current_event_id)
 
+    def import_scores_csv(self):
+        """Pick a judges' CSV (entry_id or pet_id, score) and import it into the selected placement event."""
+        if not self.current_event_id or not self.current_event_is_placement or self.leaderboard is None:
+            if self.message:
+                self.message.setText('Please select a placement event first.')
+            return
+        
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import judges' scores", '', 'CSV files (*.csv)')
+        if not path:
+            return
+        
+        try:
+            applied, errors, elapsed = import_scores(self.current_event_id, path, self.leaderboard)
+        except (OSError, ValueError, Error) as err:
+            print(f"Error importing scores: {err}")
+            if self.message:
+                self.message.setText(f'Import failed: {err}')
+            # Rows read before the failure already moved the in-memory ranking
+            try:
+                self.leaderboard = load_leaderboard(self.current_event_id)
+            except Error as reload_err:
+                print(f"Error reloading leaderboard: {reload_err}")
+            return
+        
+        text = f'Imported {applied} scores in {elapsed:.2f}s.'
+        if errors:
+            try:
+                report_path = write_score_error_report(path, errors)
+                text += f' {len(errors)} rows rejected, see {os.path.basename(report_path)}.'
+            except OSError as err:
+                print(f"Error writing score import report: {err}")
+                text += f' {len(errors)} rows rejected (first: line {errors[0][0]}, {errors[0][1]}).'
+        if self.message:
+            self.message.setText(text)
+        self.update_selected_pet_score()
+
                 
     def update_selected_pet_score(self):
         ev_text = self.pastevents.currentText()
@@ -2110,59 +4595,106 @@ class awardpetscore(QDialog):
                 self.pet_score_label.setText("Pet score: 0.00")
             return
 
-        # Extract IDs from "Name (ID: N)"
+        # Extract the pet's ID from "Name (ID: N)"
         try:
-            event_id = int(ev_text.split("(ID: ")[1].split(")")[0])
-            pet_id   = int(pt_text.split("(ID: ")[1].split(")")[0])
+            pet_id = int(pt_text.split("(ID: ")[1].split(")")[0])
         except Exception:
             self.doubleSpinBox.setValue(0.0)
             if self.pet_score_label:
                 self.pet_score_label.setText("Pet score: 0.00")
             return
 
-        # Look up the score and display it
-        conn = get_db_connection()
-        if not conn:
-            if self.pet_score_label:
-                self.pet_score_label.setText("Pet score: (DB error)")
-            return
+        # Scores live in the leaderboard loaded with the event
+        entry_id = self.leaderboard.entry_for_pet.get(pet_id) if self.leaderboard else None
+        score = self.leaderboard.score_of(entry_id) if entry_id is not None else None
+        score = score if score is not None else 0.0
+
+        self.doubleSpinBox.setValue(score)
+        if self.pet_score_label:
+            self.pet_score_label.setText(f"Pet score: {score:.2f}")
+
+    def gotoadminmenu(self):
+        SCREENS.show(adminmenu)
+        
+# --------------------------------------------------------------------------------------------------------------------
+
+# Registrations removed per transaction while clearing out an owner's history
+OWNER_DELETE_CHUNK = 200
+
+
+def delete_owners(owner_ids, chunk_size=OWNER_DELETE_CHUNK):
+    """Remove owners and everything that hangs off them, relying on the ON DELETE CASCADE rules.
+
+    Registrations go first, chunk_size per transaction (their entries and logs cascade), so a
+    long history never holds locks for long; Paid ones hand their spots back on the way. The
+    owners themselves (pets, breeds, awards, owner_log cascade) go last in one short transaction.
+    If this fails part way, running it again picks up where it stopped. Returns how many
+    registrations were removed.
+    """
+    owner_ids = list(owner_ids)
+    if not owner_ids:
+        return 0
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+
+    owner_marks = ', '.join(['%s'] * len(owner_ids))
+    removed = 0
+    try:
+        cursor = conn.cursor()
+        while True:
+            cursor.execute(f"""
+                SELECT registration_id FROM event_registration
+                WHERE owner_id IN ({owner_marks})
+                ORDER BY registration_id
+                LIMIT %s
+            """, [*owner_ids, chunk_size])
+            registration_ids = [row[0] for row in cursor.fetchall()]
+            if not registration_ids:
+                break
+            reg_marks = ', '.join(['%s'] * len(registration_ids))
+
+            # Paid registrations free their spots (counters touched in event id order)
+            cursor.execute(f"""
+                SELECT er.event_id, COUNT(DISTINCT pee.pet_id)
+                FROM event_registration er
+                JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+                WHERE er.registration_id IN ({reg_marks}) AND er.status = 'Paid'
+                GROUP BY er.event_id
+                ORDER BY er.event_id
+            """, registration_ids)
+            for event_id, pet_count in cursor.fetchall():
+                release_event_spots(cursor, event_id, pet_count)
+
+            # Their money leaves the finance rollups along with them
+            unpost_finance_for(cursor, registration_ids)
+            cursor.execute(f"DELETE FROM event_registration WHERE registration_id IN ({reg_marks})",
+                           registration_ids)
+            conn.commit()
+            removed += len(registration_ids)
 
-        try:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT pet_result
-                FROM pet_event_entry
-                WHERE event_id = %s AND pet_id = %s
-                LIMIT 1
-            """, (event_id, pet_id))
-            row = cur.fetchone()
-            score = float(row[0]) if row and row[0] is not None else 0.0
-
-            self.doubleSpinBox.setValue(score)
-            if self.pet_score_label:
-                self.pet_score_label.setText(f"Pet score: {score:.2f}")
-        except Error as err:
-            print("load score error:", err)
-            if self.pet_score_label:
-                self.pet_score_label.setText("Pet score: (error)")
-        finally:
-            conn.close()
+        cursor.execute(f"DELETE FROM owners WHERE owner_id IN ({owner_marks})", owner_ids)
+        conn.commit()
+        return removed
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
-    def gotoadminmenu(self):
-        admmn = adminmenu()
-        widget.addWidget(admmn)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
-        
-# --------------------------------------------------------------------------------------------------------------------
 
-class RemoveOwnerDialog(QDialog):
+class RemoveOwnerDialog(FormScreen):
     def __init__(self, parent=None):
         super(RemoveOwnerDialog, self).__init__(parent)
-        loadUi('./gui/removeowner.ui', self)
+        load_ui_form(self, 'removeowner.ui')
 
         self.deleteownerbutt.clicked.connect(self.delete_owner)
         self.exitbutton.clicked.connect(self.go_back)
 
+        # Ctrl/Shift-click rows to remove several owners at once
+        self.ownerstable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.ownerstable.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+
         self.load_owners()
 
     def load_owners(self):
@@ -2203,115 +4735,57 @@ class RemoveOwnerDialog(QDialog):
             conn.close()
 
     def delete_owner(self):
-        idx = self.ownercombo.currentIndex()
-        owner_id = self.ownercombo.itemData(idx)
-
+        """Remove the owners selected in the table (or the one picked in the dropdown)."""
         self.msglabel.setText("")
 
-        if not owner_id:
+        owner_ids = []
+        for index in self.ownerstable.selectionModel().selectedRows():
+            item = self.ownerstable.item(index.row(), 0)
+            if item:
+                owner_ids.append(int(item.text()))
+        if not owner_ids:
+            owner_id = self.ownercombo.itemData(self.ownercombo.currentIndex())
+            if owner_id:
+                owner_ids = [owner_id]
+
+        if not owner_ids:
             self.msglabel.setText("Please select an owner to delete.")
             return
 
-        conn = get_db_connection()
-        if not conn:
-            self.msglabel.setText("Database connection failed.")
+        from PyQt6.QtWidgets import QMessageBox
+        who = "this owner" if len(owner_ids) == 1 else f"these {len(owner_ids)} owners"
+        reply = QMessageBox.question(
+            self, 'Remove Owners',
+            f"Remove {who} along with their pets, registrations and history?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
             return
 
         try:
-            cur = conn.cursor()
-
-            # 1) Collect this owner's pets and registrations
-            cur.execute("SELECT pet_id FROM pets WHERE owner_id = %s", (owner_id,))
-            pet_ids = [row[0] for row in cur.fetchall()]
-
-            cur.execute("SELECT registration_id FROM event_registration WHERE owner_id = %s",
-                        (owner_id,))
-            reg_ids = [row[0] for row in cur.fetchall()]
-
-            # 2) If there are pets, delete everything that points to those pets
-            if pet_ids:
-                pet_placeholders = ",".join(["%s"] * len(pet_ids))
-
-                # pet_breed_junction
-                cur.execute(
-                    f"DELETE FROM pet_breed_junction WHERE pet_id IN ({pet_placeholders})",
-                    pet_ids
-                )
-
-                # awards tied to these pets
-                cur.execute(
-                    f"DELETE FROM awards WHERE pet_id IN ({pet_placeholders})",
-                    pet_ids
-                )
-
-                # pet_event_entry rows by pet
-                cur.execute(
-                    f"DELETE FROM pet_event_entry WHERE pet_id IN ({pet_placeholders})",
-                    pet_ids
-                )
-
-            # 3) If there are registrations, delete their logs and entries, then the regs
-            if reg_ids:
-                reg_placeholders = ",".join(["%s"] * len(reg_ids))
-
-                # participation_log
-                cur.execute(
-                    f"DELETE FROM participation_log "
-                    f"WHERE registration_id IN ({reg_placeholders})",
-                    reg_ids
-                )
-
-                # pet_event_entry rows by registration
-                cur.execute(
-                    f"DELETE FROM pet_event_entry "
-                    f"WHERE registration_id IN ({reg_placeholders})",
-                    reg_ids
-                )
-
-                # event_registration rows themselves
-                cur.execute(
-                    f"DELETE FROM event_registration "
-                    f"WHERE registration_id IN ({reg_placeholders})",
-                    reg_ids
-                )
-
-            # 4) Delete the pets themselves
-            if pet_ids:
-                pet_placeholders = ",".join(["%s"] * len(pet_ids))
-                cur.execute(
-                    f"DELETE FROM pets WHERE pet_id IN ({pet_placeholders})",
-                    pet_ids
-                )
-                
-            # 4.5) delete any owner_log entries for this owner
-            cur.execute("DELETE FROM owner_log WHERE owner_id = %s", (owner_id,))
-
-            # 5) Finally, delete the owner record
-            cur.execute("DELETE FROM owners WHERE owner_id = %s", (owner_id,))
-
-            conn.commit()
-            self.msglabel.setText("Owner and all related data removed.")
-            self.load_owners()  # refresh table + dropdown
-
+            delete_owners(owner_ids)
         except Error as err:
             print("Owner cascade delete error:", err)
-            conn.rollback()
-            self.msglabel.setText("Error deleting owner; no changes were saved.")
-        finally:
-            conn.close()
+            self.msglabel.setText("Error deleting owner; try again to finish removing it.")
+            self.load_owners()
+            return
+
+        if len(owner_ids) == 1:
+            self.msglabel.setText("Owner and all related data removed.")
+        else:
+            self.msglabel.setText(f"{len(owner_ids)} owners and all related data removed.")
+        self.load_owners()  # refresh table + dropdown
 
     def go_back(self):
-        current = widget.currentIndex()
-        widget.setCurrentIndex(current - 1)
-        widget.removeWidget(self)
+        SCREENS.back()
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class EditAwardsDialog(QDialog):
+class EditAwardsDialog(FormScreen):
     def __init__(self, event_id=None, parent=None):
         super(EditAwardsDialog, self).__init__(parent)
-        loadUi('./gui/editawards.ui', self)
+        load_ui_form(self, 'editawards.ui')
 
         self.event_id = event_id
         self.msglabel.setText("")
@@ -2332,12 +4806,8 @@ class EditAwardsDialog(QDialog):
         self.on_mode_changed()
         
     def go_back(self):
-        # Simple: go back one screen in the stack
-        current = widget.currentIndex()
-        if current > 0:
-            widget.setCurrentIndex(current - 1)
-        # Optionally remove this screen so the stack doesn't grow forever
-        widget.removeWidget(self)
+        # Simple: go back to the screen that opened us (this one gets cleaned up)
+        SCREENS.back()
 
 
     def load_events(self):
@@ -2446,6 +4916,13 @@ class EditAwardsDialog(QDialog):
         if not self.event_id or not name:
             self.msglabel.setText("Select an event and enter award name.")
             return
+        # Taken before the connection below is checked out (see IdAllocator)
+        try:
+            self.next_id = allocate_id('awards')
+        except Error as err:
+            print(f"Error reserving award id: {err}")
+            self.msglabel.setText("DB error.")
+            return
         conn = get_db_connection()
         if not conn:
             self.msglabel.setText("DB error.")
@@ -2463,9 +4940,6 @@ class EditAwardsDialog(QDialog):
                 self.msglabel.setText("Award already exists for this event.")
                 return
 
-            cur.execute("SELECT COALESCE(MAX(award_id), 0) + 1 FROM awards")
-            self.next_id = cur.fetchone()[0]
-            
             cur.execute("""
                 INSERT INTO awards (award_id, pet_id, is_special, award_name, description, date, event_id)
                 VALUES (%s, NULL, 1, %s, %s, CURDATE(), %s)
@@ -2513,10 +4987,143 @@ class EditAwardsDialog(QDialog):
             conn.close()
 
 # --------------------------------------------------------------------------------------------------------------------
+
+def fetch_month_summaries(year, month):
+    """One query for a whole calendar page: {'yyyy-mm-dd': day rollup} for every day with activity.
+
+    Each rollup holds 'events' [(name, time)], 'registrations' / 'transfers' (registrations,
+    owners, pets), 'withdrawals' (registrations, owners) and 'awards' [(event, award, count)].
+    Safe to run off the GUI thread.
+    """
+    first_day = date(year, month, 1)
+    last_day = date(year + month // 12, month % 12 + 1, 1)
+    # Dates may be TEXT (older setup) or DATE; compare as 'yyyy-mm-dd' strings either way
+    bounds = (first_day.isoformat(), last_day.isoformat())
+    rows = run_query("""
+        SELECT 'event', e.date, e.name, e.time, 0, 0, 0
+        FROM events e
+        WHERE e.date >= %s AND e.date < %s
+        UNION ALL
+        SELECT 'registration', er.registration_date, NULL, NULL,
+               COUNT(DISTINCT er.registration_id), COUNT(DISTINCT er.owner_id), COUNT(DISTINCT pee.pet_id)
+        FROM event_registration er
+        JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+        WHERE er.registration_date >= %s AND er.registration_date < %s AND er.status = 'Paid'
+        GROUP BY er.registration_date
+        UNION ALL
+        SELECT 'transfer', pl.action_date, NULL, NULL,
+               COUNT(DISTINCT pl.registration_id), COUNT(DISTINCT er.owner_id), COUNT(DISTINCT pee.pet_id)
+        FROM participation_log pl
+        JOIN event_registration er ON pl.registration_id = er.registration_id
+        JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+        WHERE pl.action_type = 'Transferred' AND pl.action_date >= %s AND pl.action_date < %s
+        GROUP BY pl.action_date
+        UNION ALL
+        SELECT 'withdrawal', pl.action_date, NULL, NULL,
+               COUNT(DISTINCT pl.registration_id), COUNT(DISTINCT er.owner_id), 0
+        FROM participation_log pl
+        JOIN event_registration er ON pl.registration_id = er.registration_id
+        WHERE pl.action_type = 'Cancelled' AND pl.action_date >= %s AND pl.action_date < %s
+        GROUP BY pl.action_date
+        UNION ALL
+        SELECT 'award', a.date, e.name, a.award_name, COUNT(*), 0, 0
+        FROM awards a
+        JOIN events e ON a.event_id = e.event_id
+        WHERE a.date >= %s AND a.date < %s
+        GROUP BY a.date, e.name, a.award_name
+    """, bounds * 5)
+
+    days = {}
+    for kind, day, name, detail, n1, n2, n3 in rows:
+        day_date = to_python_date(day)
+        if day_date is None:
+            continue
+        rollup = days.setdefault(day_date.isoformat(), {
+            'events': [], 'registrations': None, 'transfers': None, 'withdrawals': None, 'awards': []
+        })
+        if kind == 'event':
+            rollup['events'].append((name, detail))
+        elif kind == 'registration':
+            rollup['registrations'] = (n1, n2, n3)
+        elif kind == 'transfer':
+            rollup['transfers'] = (n1, n2, n3)
+        elif kind == 'withdrawal':
+            rollup['withdrawals'] = (n1, n2)
+        else:
+            rollup['awards'].append((name, detail, n1))
+    for rollup in days.values():
+        rollup['events'].sort(key=lambda event: str(event[1]))
+        rollup['awards'].sort()
+    return days
+
+
+def date_summary_rows(date_str, rollup):
+    """The (information, details) rows the day table shows for one day's rollup (None = quiet day)."""
+    all_rows = []
+    rollup = rollup or {}
+    
+    # 1. Events on this date
+    if rollup.get('events'):
+        all_rows.append(("--- EVENTS ON THIS DATE ---", ""))
+        for event_name, event_time in rollup['events']:
+            all_rows.append((f"Event: {event_name}", f"Time: {event_time}"))
+        all_rows.append(("", ""))  # Empty row
+    
+    # 2. New registrations 
+    reg_result = rollup.get('registrations')
+    if reg_result and reg_result[0] > 0:
+        all_rows.append(("--- NEW REGISTRATIONS ---", ""))
+        all_rows.append((f"Total Registrations: {reg_result[0]}", ""))
+        all_rows.append((f"Total Participants: {reg_result[1]}", ""))
+        all_rows.append((f"Total Pets: {reg_result[2]}", ""))
+        all_rows.append(("", ""))  # Empty row
+    
+    # 3. Transfers 
+    transfer_result = rollup.get('transfers')
+    if transfer_result and transfer_result[0] > 0:
+        all_rows.append(("--- TRANSFERS ---", ""))
+        all_rows.append((f"Total Transfers: {transfer_result[0]}", ""))
+        all_rows.append((f"Participants: {transfer_result[1]}", ""))
+        all_rows.append((f"Pets: {transfer_result[2]}", ""))
+        all_rows.append(("", ""))  # Empty row
+    
+    # 4. Withdrawals 
+    withdrawal_result = rollup.get('withdrawals')
+    if withdrawal_result and withdrawal_result[0] > 0:
+        # Since pet_event_entry is deleted on withdrawal, we approximate pet count
+        # Each registration typically has at least one pet
+        total_withdrawals = withdrawal_result[0]
+        total_participants = withdrawal_result[1]
+        # Use number of withdrawals as proxy for pets (each withdrawal = at least 1 pet)
+        total_pets = total_withdrawals
+        
+        all_rows.append(("--- WITHDRAWALS ---", ""))
+        all_rows.append((f"Total Withdrawals: {total_withdrawals}", ""))
+        all_rows.append((f"Participants: {total_participants}", ""))
+        all_rows.append((f"Pets: {total_pets}", ""))
+        all_rows.append(("", ""))  # Empty row
+    
+    # 5. Awards summary
+    if rollup.get('awards'):
+        all_rows.append(("--- AWARDS ---", ""))
+        current_event = None
+        for event_name, award_name, award_count in rollup['awards']:
+            if event_name != current_event:
+                if current_event is not None:
+                    all_rows.append(("", ""))
+                all_rows.append((f"Event: {event_name}", ""))
+                current_event = event_name
+            all_rows.append((f"  {award_name}: {award_count}", ""))
+
+    if not all_rows:
+        all_rows.append(("No events or activities", f"on {date_str}"))
+    return all_rows
+
+
 class mainmenu(QDialog):
     def __init__(self, owner_context=None):
         super(mainmenu, self).__init__()
-        loadUi('./gui/mainmenu.ui', self)
+        load_ui_form(self, 'mainmenu.ui')
         self.owner_context = owner_context or get_active_owner()
         if not self.owner_context:
             print("Warning: main menu opened without an active owner; owner-specific actions may fail.")
@@ -2528,198 +5135,119 @@ class mainmenu(QDialog):
         self.statusbutt.clicked.connect(self.gotostatus)
         self.mmexitbutt.clicked.connect(self.gotoregscreen)
         self.calendarWidget.selectionChanged.connect(self.on_date_selected)
+        self.calendarWidget.currentPageChanged.connect(self.load_month)
         
         # Set up the mini "what's happening today" table
-        self.load_date_summary()
+        self.queries = QueryExecutor(self)
+        self.month_summaries = {}  # (year, month) -> {'yyyy-mm-dd': day rollup}
+        self.load_month(self.calendarWidget.yearShown(), self.calendarWidget.monthShown())
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        # Things may have happened while we were away; refetch the page on show
+        self.month_summaries = {}
+        self.load_month(self.calendarWidget.yearShown(), self.calendarWidget.monthShown())
     
     def on_date_selected(self):
         """When the calendar changes, refresh the summary table."""
         self.load_date_summary()
     
+    def load_month(self, year, month):
+        """Fetch a whole calendar page's rollups in one background query (unless we already have it)."""
+        if (year, month) in self.month_summaries:
+            self.highlight_active_dates(year, month)
+            self.load_date_summary()
+            return
+        # Paging through months quickly cancels the older lookups
+        self.queries.submit('month', fetch_month_summaries, year, month,
+                            on_result=lambda days: self.set_month(year, month, days),
+                            on_error=lambda msg: print(f"Error loading date summary: {msg}"))
+    
+    def set_month(self, year, month, days):
+        """A month's rollups arrived: keep them, mark the busy days, and show the selected one."""
+        self.month_summaries[(year, month)] = days
+        self.highlight_active_dates(year, month)
+        self.load_date_summary()
+    
+    def highlight_active_dates(self, year, month):
+        """Bold, highlighted day numbers for every date that has something going on."""
+        self.calendarWidget.setDateTextFormat(QtCore.QDate(), QtGui.QTextCharFormat())  # clear old marks
+        active = QtGui.QTextCharFormat()
+        active.setFontWeight(QtGui.QFont.Weight.Bold)
+        active.setBackground(QtGui.QColor(251, 176, 59))
+        active.setForeground(QtGui.QColor(255, 255, 255))
+        for date_str in self.month_summaries.get((year, month), {}):
+            self.calendarWidget.setDateTextFormat(QtCore.QDate.fromString(date_str, "yyyy-MM-dd"), active)
+    
     def load_date_summary(self):
-        "Grab events and basic stats for the currently selected date."
+        "Show the selected date's summary from the month already in memory (fetching the month if needed)."
         selected_date = self.calendarWidget.selectedDate()
         date_str = selected_date.toString("yyyy-MM-dd")
-        
-        conn = get_db_connection()
-        if not conn:
+        month_key = (selected_date.year(), selected_date.month())
+        if month_key not in self.month_summaries:
+            # set_month() comes back here once the page is loaded
+            self.load_month(*month_key)
             return
-        
-        try:
-            cursor = conn.cursor()
-            all_rows = []
-            
-            # 1. Get events on this date
-            cursor.execute("""
-                SELECT name, time
-                FROM events
-                WHERE date = %s
-                ORDER BY time
-            """, (date_str,))
-            
-            events = cursor.fetchall()
-            if events:
-                all_rows.append(("--- EVENTS ON THIS DATE ---", ""))
-                for event_name, event_time in events:
-                    all_rows.append((f"Event: {event_name}", f"Time: {event_time}"))
-                all_rows.append(("", ""))  # Empty row
-            
-            # 2. New registrations 
-            cursor.execute("""
-                SELECT COUNT(DISTINCT er.registration_id) as total_registrations,
-                       COUNT(DISTINCT er.owner_id) as total_participants,
-                       COUNT(DISTINCT pee.pet_id) as total_pets
-                FROM event_registration er
-                JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                WHERE er.registration_date = %s AND er.status = 'Paid'
-            """, (date_str,))
-            
-            reg_result = cursor.fetchone()
-            if reg_result and reg_result[0] > 0:
-                all_rows.append(("--- NEW REGISTRATIONS ---", ""))
-                all_rows.append((f"Total Registrations: {reg_result[0]}", ""))
-                all_rows.append((f"Total Participants: {reg_result[1]}", ""))
-                all_rows.append((f"Total Pets: {reg_result[2]}", ""))
-                all_rows.append(("", ""))  # Empty row
-            
-            # 3. Transfers 
-            cursor.execute("""
-                SELECT COUNT(DISTINCT pl.registration_id) as total_transfers,
-                       COUNT(DISTINCT er.owner_id) as total_participants,
-                       COUNT(DISTINCT pee.pet_id) as total_pets
-                FROM participation_log pl
-                JOIN event_registration er ON pl.registration_id = er.registration_id
-                JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                WHERE pl.action_type = 'Transferred' AND pl.action_date = %s
-            """, (date_str,))
-            
-            transfer_result = cursor.fetchone()
-            if transfer_result and transfer_result[0] > 0:
-                all_rows.append(("--- TRANSFERS ---", ""))
-                all_rows.append((f"Total Transfers: {transfer_result[0]}", ""))
-                all_rows.append((f"Participants: {transfer_result[1]}", ""))
-                all_rows.append((f"Pets: {transfer_result[2]}", ""))
-                all_rows.append(("", ""))  # Empty row
-            
-            # 4. Withdrawals 
-            cursor.execute("""
-                SELECT COUNT(DISTINCT pl.registration_id) as total_withdrawals,
-                       COUNT(DISTINCT er.owner_id) as total_participants
-                FROM participation_log pl
-                JOIN event_registration er ON pl.registration_id = er.registration_id
-                WHERE pl.action_type = 'Cancelled' AND pl.action_date = %s
-            """, (date_str,))
-            
-            withdrawal_result = cursor.fetchone()
-            if withdrawal_result and withdrawal_result[0] > 0:
-                # Since pet_event_entry is deleted on withdrawal, we approximate pet count
-                # Each registration typically has at least one pet
-                total_withdrawals = withdrawal_result[0]
-                total_participants = withdrawal_result[1]
-                # Use number of withdrawals as proxy for pets (each withdrawal = at least 1 pet)
-                total_pets = total_withdrawals
-                
-                all_rows.append(("--- WITHDRAWALS ---", ""))
-                all_rows.append((f"Total Withdrawals: {total_withdrawals}", ""))
-                all_rows.append((f"Participants: {total_participants}", ""))
-                all_rows.append((f"Pets: {total_pets}", ""))
-                all_rows.append(("", ""))  # Empty row
-            
-            # 5. Awards summary
-            cursor.execute("""
-                SELECT e.name as event_name, a.award_name, COUNT(*) as award_count
-                FROM awards a
-                JOIN events e ON a.event_id = e.event_id
-                WHERE a.date = %s
-                GROUP BY e.name, a.award_name
-                ORDER BY e.name, a.award_name
-            """, (date_str,))
-            
-            awards = cursor.fetchall()
-            if awards:
-                all_rows.append(("--- AWARDS ---", ""))
-                current_event = None
-                for event_name, award_name, award_count in awards:
-                    if event_name != current_event:
-                        if current_event is not None:
-                            all_rows.append(("", ""))
-                        all_rows.append((f"Event: {event_name}", ""))
-                        current_event = event_name
-                    all_rows.append((f"  {award_name}: {award_count}", ""))
-            
-            # Populate table
-            if not all_rows:
-                all_rows.append(("No events or activities", f"on {date_str}"))
-            
-            self.eventontheday.setRowCount(len(all_rows))
-            self.eventontheday.setColumnCount(2)
-            self.eventontheday.setHorizontalHeaderLabels(['Information', 'Details'])
-            
-            for row, (col1, col2) in enumerate(all_rows):
-                item1 = QtWidgets.QTableWidgetItem(col1)
-                item2 = QtWidgets.QTableWidgetItem(col2)
-                self.eventontheday.setItem(row, 0, item1)
-                self.eventontheday.setItem(row, 1, item2)
-            
-            # Resize columns
-            self.eventontheday.resizeColumnsToContents()
-            header = self.eventontheday.horizontalHeader()
-            if header:
-                header.setStretchLastSection(True)
-                header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-            vheader = self.eventontheday.verticalHeader()
-            if vheader:
-                vheader.setVisible(False)
-                vheader.setDefaultSectionSize(28)
-            
-        except Error as err:
-            print(f"Error loading date summary: {err}")
-        finally:
-            if conn:
-                conn.close()
+        self.show_date_summary(date_summary_rows(date_str, self.month_summaries[month_key].get(date_str)))
+
+    def show_date_summary(self, all_rows):
+        """Populate the day table from prepared rows."""
+        self.eventontheday.setRowCount(len(all_rows))
+        self.eventontheday.setColumnCount(2)
+        self.eventontheday.setHorizontalHeaderLabels(['Information', 'Details'])
+        
+        for row, (col1, col2) in enumerate(all_rows):
+            item1 = QtWidgets.QTableWidgetItem(col1)
+            item2 = QtWidgets.QTableWidgetItem(col2)
+            self.eventontheday.setItem(row, 0, item1)
+            self.eventontheday.setItem(row, 1, item2)
+        
+        # Resize columns
+        self.eventontheday.resizeColumnsToContents()
+        header = self.eventontheday.horizontalHeader()
+        if header:
+            header.setStretchLastSection(True)
+            header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+        vheader = self.eventontheday.verticalHeader()
+        if vheader:
+            vheader.setVisible(False)
+            vheader.setDefaultSectionSize(28)
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.queries.cancel_all()
+        super().hideEvent(event)
 
     def gotoregscreen(self):
         clear_active_owner()
-        reg = RegisterScreen()
-        widget.addWidget(reg)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(RegisterScreen)
+        # Logging out: drop every screen built for this owner
+        SCREENS.drop_others()
 
     def gotoentries(self):
-        entrs= entries()
-        widget.addWidget(entrs)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(entries)
 
     def gotoevents(self):
-        evs = viewevents()
-        widget.addWidget(evs)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(viewevents)
 
     def gotostatus(self):
-        status_screen = yourstatuss(self.owner_context)
-        widget.addWidget(status_screen)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(yourstatuss, self.owner_context)
 
     def gotopetregis(self):
-        petregis = petregistration(self.owner_context)
-        widget.addWidget(petregis)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(petregistration, self.owner_context)
     
     def gotoenrollev(self):
-        enrollev = enrollevent(self.owner_context)
-        widget.addWidget(enrollev)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(enrollevent, self.owner_context)
     
     def gotoeditinfo(self):
-        editin = editinf(self.owner_context)
-        widget.addWidget(editin)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(editinf, self.owner_context)
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class petregistration(QDialog):
+class petregistration(FormScreen):
     def __init__(self, owner_context=None):
         super(petregistration, self).__init__()
-        loadUi('./gui/petregistration.ui', self)
+        load_ui_form(self, 'petregistration.ui')
 
         self.petsex.addItems(['Male', 'Female', 'Unknown'])
         self.petsize.addItems(['Small', 'Medium', 'Large', 'Extra Large']) 
@@ -2768,34 +5296,21 @@ class petregistration(QDialog):
             self.muzzleno.setStyleSheet(off)
 
     def load_breeds(self):
-        """Grab all breeds from the database and add them to the combo box, plus "Other" option."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
+        """Add all known breeds (from the reference cache) to the combo box, plus "Other" option."""
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT breed_name 
-                FROM breeds 
-                ORDER BY breed_name
-            """)
-            
-            breeds = cursor.fetchall()
-            self.petbreed.clear()
-            
-            # Add all breeds
-            for breed in breeds:
-                if breed[0]:
-                    self.petbreed.addItem(breed[0])
-            
-            # Add "Other" option at the end
-            self.petbreed.addItem("Other")
+            breeds = get_breed_names()
         except Error as err:
             print(f"Error loading breeds: {err}")
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.petbreed.clear()
+        
+        # Add all breeds
+        for breed_name in breeds:
+            self.petbreed.addItem(breed_name)
+        
+        # Add "Other" option at the end
+        self.petbreed.addItem("Other")
     
     def on_breed_selected(self):
         """Handle when breed selection changes - if "Other" is selected, clear the text so user can type."""
@@ -2829,8 +5344,19 @@ class petregistration(QDialog):
         
         muzzle_required = 1 if self.muzzleyes.isChecked() else 0 
         
-        size_map = {'Small': 1, 'Medium': 2, 'Large': 3, 'Extra Large': 3}
-        actual_size_id = size_map.get(petsize_name, 3) 
+        # Unknown names (e.g. 'Extra Large') fall back to the biggest category, as before
+        actual_size_id = size_id_for(petsize_name, 3)
+
+        # Ids are taken before the connection below is checked out (see IdAllocator).
+        # Known breeds come from the reference cache; only unseen names hit the DB
+        try:
+            breed_id = cached_breed_id(petbreed)
+            new_pet_id = allocate_id('pets')
+            new_breed_id = allocate_id('breeds') if breed_id is None else None
+        except Error as err:
+            print(f"Error reserving pet id: {err}")
+            self.petregiserr.setText('Database connection failed.')
+            return
 
         conn = get_db_connection()
         if conn:
@@ -2841,27 +5367,21 @@ class petregistration(QDialog):
                     self.petregiserr.setText('Please log in as an owner before registering pets.')
                     return
 
-                cursor.execute("SELECT MAX(pet_id) FROM pets")
-                max_pet_id = cursor.fetchone()[0]
-                new_pet_id = (max_pet_id if max_pet_id is not None else 0) + 1
-                
 
-                sql_breed_lookup = "SELECT breed_id FROM breeds WHERE breed_name = %s"
-                cursor.execute(sql_breed_lookup, (petbreed,))
-                breed_result = cursor.fetchone()
+                breed_added = False
+                if breed_id is None:
+                    sql_breed_lookup = "SELECT breed_id FROM breeds WHERE breed_name = %s"
+                    cursor.execute(sql_breed_lookup, (petbreed,))
+                    breed_result = cursor.fetchone()
 
-                if breed_result:
-                    breed_id = breed_result[0]
-                else:
-                    
-                    cursor.execute("SELECT MAX(breed_id) FROM breeds")
-                    max_breed_id = cursor.fetchone()[0]
-                    new_breed_id = max(16, (max_breed_id if max_breed_id is not None else 0) + 1)
-                    
-                    sql_insert_breed = "INSERT INTO breeds (breed_id, breed_name, size_id) VALUES (%s, %s, %s)"
-                    cursor.execute(sql_insert_breed, (new_breed_id, petbreed, 3)) 
-                    
-                    breed_id = new_breed_id
+                    if breed_result:
+                        breed_id = breed_result[0]
+                    else:
+                        sql_insert_breed = "INSERT INTO breeds (breed_id, breed_name, size_id) VALUES (%s, %s, %s)"
+                        cursor.execute(sql_insert_breed, (new_breed_id, petbreed, 3)) 
+                        
+                        breed_id = new_breed_id
+                    breed_added = True
                 
                 sql_pet = """
                 INSERT INTO pets 
@@ -2888,6 +5408,8 @@ class petregistration(QDialog):
                 cursor.execute(sql_junction, data_junction)
                 
                 conn.commit()
+                if breed_added:
+                    invalidate_reference_data('breeds')
                 
                 cursor.execute("SELECT pet_id FROM pets WHERE pet_id = %s", (new_pet_id,))
                 if cursor.fetchone():
@@ -2913,36 +5435,260 @@ class petregistration(QDialog):
             self.petregiserr.setText('Database connection failed.')
 
     def gotopetregistered(self):
-        pregistrd = petrgistrd()
-        widget.addWidget(pregistrd)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(petrgistrd)
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class petrgistrd(QDialog):
     def __init__(self):
         super(petrgistrd, self).__init__()
-        loadUi('./gui/petregistered!.ui', self)
+        load_ui_form(self, 'petregistered!.ui')
         self.sucpetregbackbutt.clicked.connect(self.gotommenu)
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
         
 # --------------------------------------------------------------------------------------------------------------------
 
-class enrollevent(QDialog):
+# How long the enrollment screen waits for the selections to settle before re-quoting
+QUOTE_DEBOUNCE_MS = 150
+
+
+def fetch_quote_snapshot(owner_id):
+    """Owner name, the owner's pets already in each event, and every event's participant counter. Safe off the GUI thread."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+
+    try:
+        cursor = conn.cursor()
+        
+        # Get owner name
+        owner_name = "Unknown"
+        if owner_id:
+            cursor.execute("""
+                SELECT first_name, last_name 
+                FROM owners 
+                WHERE owner_id = %s
+            """, (owner_id,))
+            owner_result = cursor.fetchone()
+            if owner_result:
+                owner_name = f"{owner_result[0]} {owner_result[1]}"
+        
+        # Every pet this owner already has in a paid registration, grouped by event
+        cursor.execute("""
+            SELECT DISTINCT er.event_id, pee.pet_id
+            FROM event_registration er
+            JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+            WHERE er.owner_id = %s AND er.status = 'Paid'
+        """, (owner_id,))
+        entered = {}
+        for event_id, pet_id in cursor.fetchall():
+            entered.setdefault(event_id, set()).add(pet_id)
+        
+        # Total participants per event (all owners), straight off the counters
+        cursor.execute("SELECT event_id, participants FROM event_capacity")
+        participants = dict(cursor.fetchall())
+        
+        return owner_name, entered, participants
+    finally:
+        conn.close()
+
+
+class EnrollmentQuotes:
+    """Fee quotes for one owner worked out in memory from a single snapshot.
+
+    Nothing here touches the database; enrollevnt re-checks the numbers inside its
+    transaction and refuses if the quote has gone stale.
+    """
+
+    def __init__(self, owner_name, entered, participants):
+        self.owner_name = owner_name
+        self.entered = entered            # event_id -> set of this owner's pet_ids
+        self.participants = participants  # event_id -> participant count
+
+    def owner_pet_count(self, event_id):
+        return len(self.entered.get(event_id, ()))
+
+    def quote(self, event, pet_id=None):
+        """Fee breakdown and capacity numbers for entering `pet_id` into `event`."""
+        existing_pets = self.owner_pet_count(event['event_id'])
+        base_fee = event['base_fee']
+        # First pet pays full price, additional pets get the discount
+        discount = event['extra_pet_discount'] if existing_pets else 0
+        participants = self.participants.get(event['event_id'], 0)
+        return {
+            'existing_pets': existing_pets,
+            'base_fee': base_fee,
+            'discount': discount,
+            'total': base_fee - discount,
+            'participants': participants,
+            'available_spots': max(0, (event.get('max_participants') or 0) - participants),
+            'already_entered': pet_id in self.entered.get(event['event_id'], ()),
+        }
+
+    def quote_basket(self, items):
+        """Price a basket of (event, pet) pairs the same way enroll_basket will."""
+        return price_basket(items, {event_id: len(pets) for event_id, pets in self.entered.items()})
+
+
+class EnrollmentRejected(Exception):
+    """A basket enrollment that was refused before anything was written; the message is for the user."""
+
+    def __init__(self, message, stale_quote=False):
+        super().__init__(message)
+        self.stale_quote = stale_quote
+
+
+def price_basket(items, existing_counts):
+    """Group (event, pet) pairs by event and price each pet.
+
+    existing_counts[event_id] is how many of the owner's pets are already paid up in that
+    event; the first pet overall pays the base fee and every pet after it gets the discount.
+    """
+    groups = {}
+    for event, pet in items:
+        group = groups.setdefault(event['event_id'], {'event': event, 'pets': [], 'fees': []})
+        already_in = existing_counts.get(event['event_id'], 0) + len(group['pets'])
+        group['pets'].append(pet)
+        group['fees'].append(event['base_fee'] - (event['extra_pet_discount'] if already_in else 0))
+    for group in groups.values():
+        group['total'] = sum(group['fees'])
+    return list(groups.values())
+
+
+def enroll_basket(owner_id, items, reg_date, quoted_total=None):
+    """Enroll every (event, pet) pair in one transaction: one registration per event, rows written with executemany.
+
+    Duplicates, deadlines, event status and the owner's existing entries are checked with one
+    query each. Raises EnrollmentRejected or EventFullError with nothing written; returns the
+    priced groups (see price_basket) with their new registration_id.
+    """
+    if not items:
+        raise EnrollmentRejected('Nothing to enroll.')
+    events_by_id = {event['event_id']: event for event, _ in items}
+    # One registration and one log row per event; ids are taken before the transaction opens
+    registration_ids = allocate_ids('event_registration', len(events_by_id))
+    entry_ids = iter(allocate_ids('pet_event_entry', len(items)))
+    log_ids = allocate_ids('participation_log', len(events_by_id))
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+
+    pet_names = {pet['pet_id']: pet['name'] for _, pet in items}
+    event_ids = sorted(events_by_id)
+    event_marks = ', '.join(['%s'] * len(event_ids))
+    try:
+        cursor = conn.cursor()
+        
+        # Pets that already have a paid entry in the event they're being added to
+        pair_marks = ', '.join(['(%s, %s)'] * len(items))
+        cursor.execute(f"""
+            SELECT DISTINCT pee.pet_id, pee.event_id
+            FROM pet_event_entry pee
+            JOIN event_registration er ON pee.registration_id = er.registration_id
+            WHERE er.status = 'Paid' AND (pee.pet_id, pee.event_id) IN ({pair_marks})
+        """, [value for event, pet in items for value in (pet['pet_id'], event['event_id'])])
+        duplicate = cursor.fetchone()
+        cursor.fetchall()
+        if duplicate:
+            raise EnrollmentRejected(f"{pet_names[duplicate[0]]} is already registered for "
+                                     f"{events_by_id[duplicate[1]]['name']}.")
+        
+        # Deadlines, status and fees come from the table, not the cached event dicts
+        cursor.execute(f"""
+            SELECT event_id, registration_deadline, status, base_registration_fee, extra_pet_discount
+            FROM events WHERE event_id IN ({event_marks})
+        """, event_ids)
+        current_events = {}
+        for event_id, deadline, event_status, base_fee, extra_pet_discount in cursor.fetchall():
+            current_events[event_id] = dict(events_by_id[event_id], base_fee=base_fee,
+                                            extra_pet_discount=extra_pet_discount)
+            name = events_by_id[event_id]['name']
+            if event_status != 1:
+                raise EnrollmentRejected(f'{name} is no longer open for registration.')
+            deadline_date = to_python_date(deadline)
+            if deadline_date and reg_date > deadline_date:
+                raise EnrollmentRejected(f'Registration deadline for {name} ({deadline_date:%Y-%m-%d}) has passed.')
+        for event_id in event_ids:
+            if event_id not in current_events:
+                raise EnrollmentRejected(f"{events_by_id[event_id]['name']} is no longer available.")
+        
+        # The owner's pets already in each event decide who gets the extra-pet discount
+        cursor.execute(f"""
+            SELECT er.event_id, COUNT(DISTINCT pee.pet_id)
+            FROM event_registration er
+            JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+            WHERE er.owner_id = %s AND er.event_id IN ({event_marks}) AND er.status = 'Paid'
+            GROUP BY er.event_id
+        """, [owner_id, *event_ids])
+        # Priced at today's fees, so an admin fee change since the quote shows up as a stale quote
+        groups = price_basket([(current_events[event['event_id']], pet) for event, pet in items],
+                              dict(cursor.fetchall()))
+        total = sum(group['total'] for group in groups)
+        if quoted_total is not None and total != quoted_total:
+            raise EnrollmentRejected(f'The price is now ₱{total:.2f}. Please check the summary and enroll again.',
+                                     stale_quote=True)
+        
+        # Every spot in one go; raises EventFullError if any event would overflow
+        reserve_event_spots_many(cursor, {group['event']['event_id']: len(group['pets']) for group in groups})
+        
+        now = datetime.now()
+        action_date = now.strftime("%Y-%m-%d")
+        action_time = now.strftime("%H:%M:%S")
+        reg_date_text = reg_date.strftime("%Y-%m-%d")
+        
+        registrations, entries, logs = [], [], []
+        for registration_id, log_id, group in zip(registration_ids, log_ids, groups):
+            event_id = group['event']['event_id']
+            group['registration_id'] = registration_id
+            registrations.append((registration_id, owner_id, event_id, reg_date_text,
+                                  group['total'], action_date, action_time, 'Paid'))
+            for pet in group['pets']:
+                entries.append((next(entry_ids), registration_id, pet['pet_id'], event_id, 'Registered'))
+            logs.append((log_id, registration_id, 'Paid', action_date, action_time,
+                         event_id, None, 'New registration', 0.00, 0.00))
+        
+        cursor.executemany("""
+            INSERT INTO event_registration 
+            (registration_id, owner_id, event_id, registration_date, 
+             total_amount_paid, payment_date, payment_time, status)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, registrations)
+        cursor.executemany("""
+            INSERT INTO pet_event_entry 
+            (entry_id, registration_id, pet_id, event_id, attendance_status)
+            VALUES (%s, %s, %s, %s, %s)
+        """, entries)
+        cursor.executemany("""
+            INSERT INTO participation_log
+            (log_id, registration_id, action_type, action_date, action_time,
+             original_event_id, new_event_id, reason, refund_amount, top_up_amount)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, logs)
+        post_finance(cursor, [(group['event']['event_id'], action_date, 1, group['total'], 0, 0)
+                              for group in groups])
+        
+        conn.commit()
+        return groups
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+class enrollevent(FormScreen):
     def __init__(self, owner_context=None):
         super(enrollevent, self).__init__()
-        loadUi('./gui/enrollevent.ui', self)
+        load_ui_form(self, 'enrollevent.ui')
         self.enrollevexitbutt.clicked.connect(self.gotommenu)
         self.enrolevbutt.clicked.connect(self.enrollevnt)
+        self.addbasketbutt.clicked.connect(self.add_to_basket)
+        self.clearbasketbutt.clicked.connect(self.clear_basket)
         
         
         self.petregiserr = self.findChild(QtWidgets.QLabel, 'petregiserr')
@@ -2950,12 +5696,21 @@ class enrollevent(QDialog):
         self.enrollsummary = self.findChild(QtWidgets.QLabel, 'enrollsummary')
         self.enrollattstat = self.findChild(QtWidgets.QLabel, 'enrollattstat')
         self.owerusername = self.findChild(QtWidgets.QLabel, 'owerusername')
+        self.queries = QueryExecutor(self)
         
         # Keep track of which owner/pet/event we're dealing with
         self.owner_context = owner_context or get_active_owner()
         self.current_owner_id = self.owner_context['owner_id'] if self.owner_context else None
         self.selected_pet_id = None
         self.event_data = {}
+        self.quotes = None
+        self.basket = []  # (event, pet) pairs waiting to be enrolled together
+        
+        # Flicking through the dropdowns restarts this; we only re-quote once they settle
+        self.quote_timer = QtCore.QTimer(self)
+        self.quote_timer.setSingleShot(True)
+        self.quote_timer.setInterval(QUOTE_DEBOUNCE_MS)
+        self.quote_timer.timeout.connect(self.refresh_selection)
         
         # Default registration date to "today" so user doesn't have to pick
         from datetime import date
@@ -2971,75 +5726,37 @@ class enrollevent(QDialog):
         self.load_pets()
         
     def load_owner_data(self):
-        "Load the active owner's name for display."
+        "Load the active owner's name and the quote snapshot (done once per screen)."
         if self.current_owner_id is None:
             self.owerusername.setText('Please log in as an owner first.')
             return
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT first_name, last_name 
-                    FROM owners 
-                    WHERE owner_id = %s
-                """, (self.current_owner_id,))
-                owner_data = cursor.fetchone()
-                if owner_data:
-                    owner_name = f"{owner_data[0]} {owner_data[1]}"
-                    self.owerusername.setText(owner_name)
-            except Error as err:
-                print(f"Error loading owner data: {err}")
-            finally:
-                if conn:
-                    conn.close()
+        self.queries.submit('quotes', fetch_quote_snapshot, self.current_owner_id,
+                            on_result=self.set_quotes,
+                            on_error=lambda msg: print(f"Error loading owner data: {msg}"),
+                            busy=[self.enrolevbutt])
+    
+    def set_quotes(self, snapshot):
+        """Snapshot is in: show the owner's name and price the current selection."""
+        self.quotes = EnrollmentQuotes(*snapshot)
+        self.owerusername.setText(self.quotes.owner_name)
+        self.calculate_payment()
     
     def load_events(self):
         """Pull all open events into the event dropdown."""
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT event_id, name, date, time, location, type, 
-                           base_registration_fee, extra_pet_discount,
-                           min_size_id, max_size_id, min_weight, max_weight,
-                           registration_deadline
-                    FROM events 
-                    WHERE status = 1
-                    ORDER BY date, time
-                """)
-                
-                events = cursor.fetchall()
-                self.enrollselev.clear()
-                self.event_dict = {}
-                
-                for event in events:
-                    event_id = event[0]
-                    event_name = event[1]
-                    display_text = event_name
-                    self.enrollselev.addItem(display_text)
-                    self.event_dict[display_text] = {
-                        'event_id': event_id,
-                        'name': event[1],
-                        'date': event[2],
-                        'time': event[3],
-                        'location': event[4],
-                        'type': event[5],
-                        'base_fee': event[6],
-                        'extra_pet_discount': event[7],
-                        'min_size_id': event[8],
-                        'max_size_id': event[9],
-                        'min_weight': event[10],
-                        'max_weight': event[11],
-                        'registration_deadline': event[12]
-                    }
-            except Error as err:
-                print(f"Error loading events: {err}")
-                self.petregiserr.setText('Error loading events.')
-            finally:
-                if conn:
-                    conn.close()
+        try:
+            events = get_events(open_only=True)
+        except Error as err:
+            print(f"Error loading events: {err}")
+            self.petregiserr.setText('Error loading events.')
+            return
+        
+        self.enrollselev.clear()
+        self.event_dict = {}
+        
+        for event in events:
+            display_text = event['name']
+            self.enrollselev.addItem(display_text)
+            self.event_dict[display_text] = event
     
     def load_pets(self):
         """Put all this owner's pets into the pet dropdown."""
@@ -3091,12 +5808,8 @@ class enrollevent(QDialog):
         self.event_data = self.event_dict[selected_text]
         self.selected_event_id = self.event_data['event_id']
         
-        # Update summary
-        self.update_summary()
-        
-        # Check pet size if a pet is selected
-        if self.selectpetbutt.currentText():
-            self.check_pet_size_compatibility()
+        # Update summary and size checks once the selection settles
+        self.quote_timer.start()
     
     def on_pet_selected(self):
         """When the pet changes, update summary and size checks."""
@@ -3106,11 +5819,15 @@ class enrollevent(QDialog):
         
         self.selected_pet_id = self.pet_dict[selected_text]['pet_id']
         
-        # Update summary
+        # Update summary and size checks once the selection settles
+        self.quote_timer.start()
+    
+    def refresh_selection(self):
+        """Debounced: redo the summary, quote and size check for whatever is selected now."""
         self.update_summary()
         
-        # Check size compatibility if an event is selected
-        if self.enrollselev.currentText():
+        # Check size compatibility if both an event and a pet are selected
+        if self.enrollselev.currentText() and self.selectpetbutt.currentText():
             self.check_pet_size_compatibility()
     
     def check_pet_size_compatibility(self):
@@ -3194,279 +5911,207 @@ class enrollevent(QDialog):
         self.calculate_payment()
     
     def calculate_payment(self):
-        """Figure out how much to pay and show it."""
+        """Figure out how much to pay and show it (quoted from the in-memory snapshot, no queries)."""
         self.enrollpayment.clear()
         self.statuspart.clear()
         
-        if not self.enrollselev.currentText():
+        if not self.enrollselev.currentText() or self.enrollselev.currentText() not in self.event_dict:
             return
         
-        event = self.event_dict[self.enrollselev.currentText()]
-        base_fee = event['base_fee']
-        discount = event['extra_pet_discount']
-        event_id = event['event_id']
+        if self.quotes is None:
+            # Snapshot still loading; set_quotes() calls back in here when it lands
+            self.enrollpayment.addItem("Loading prices...")
+            return
         
-        # See how many of this owner's pets already joined this event
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Get owner name
-                owner_name = "Unknown"
-                if self.current_owner_id:
-                    cursor.execute("""
-                        SELECT first_name, last_name 
-                        FROM owners 
-                        WHERE owner_id = %s
-                    """, (self.current_owner_id,))
-                    owner_result = cursor.fetchone()
-                    if owner_result:
-                        owner_name = f"{owner_result[0]} {owner_result[1]}"
-                
-                # Get pet name
-                pet_name = "Not selected"
-                if self.selectpetbutt.currentText():
-                    pet_text = self.selectpetbutt.currentText()
-                    if pet_text in self.pet_dict:
-                        pet_name = self.pet_dict[pet_text]['name']
-                
-                # Add event and enrollment information
-                self.enrollpayment.addItem(f"Event: {event['name']}")
-                self.enrollpayment.addItem(f"Event Date: {event['date']} at {event['time']}")
-                self.enrollpayment.addItem(f"Owner: {owner_name}")
-                self.enrollpayment.addItem(f"Pet: {pet_name}")
-                self.enrollpayment.addItem("")  # Empty line separator
-                
-                cursor.execute("""
-                    SELECT COUNT(DISTINCT pee.pet_id)
-                    FROM event_registration er
-                    JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                    WHERE er.owner_id = %s AND er.event_id = %s AND er.status = 'Paid'
-                """, (self.current_owner_id, event_id))
-                
-                existing_pets_count = cursor.fetchone()[0] or 0
-                
-                # Calculate total
-                if existing_pets_count == 0:
-                    # First pet pays full price
-                    total = base_fee
-                    self.enrollpayment.addItem(f"Base Registration Fee: ₱{base_fee:.2f}")
-                else:
-                    # Additional pets get discount
-                    total = base_fee - discount
-                    self.enrollpayment.addItem(f"Base Registration Fee: ₱{base_fee:.2f}")
-                    self.enrollpayment.addItem(f"Extra Pet Discount: -₱{discount:.2f}")
-                
-                self.enrollpayment.addItem(f"Total Amount: ₱{total:.2f}")
-                
-                # Count total participants for this event (all owners)
-                cursor.execute("""
-                    SELECT COUNT(DISTINCT pee.pet_id)
-                    FROM event_registration er
-                    JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                    WHERE er.event_id = %s AND er.status = 'Paid'
-                """, (event_id,))
-                
-                total_participants = cursor.fetchone()[0] or 0
-                max_participants = event.get('max_participants', 0)
-                available_spots = max(0, max_participants - total_participants)
-                
-                # Participation status - only show participants and available spots
-                self.statuspart.addItem(f"Participants: {total_participants}")
-                self.statuspart.addItem(f"Available Spots: {available_spots}")
-                
-            except Error as err:
-                print(f"Error calculating payment: {err}")
-            finally:
-                if conn:
-                    conn.close()
+        event = self.event_dict[self.enrollselev.currentText()]
         
-    def enrollevnt(self):
-        """Handle event enrollment logic."""
-        self.petregiserr.setText('')
-        self.petwarningsize.setText('')
+        # Get pet name
+        pet_name = "Not selected"
+        pet_id = None
+        if self.selectpetbutt.currentText():
+            pet_text = self.selectpetbutt.currentText()
+            if pet_text in self.pet_dict:
+                pet_name = self.pet_dict[pet_text]['name']
+                pet_id = self.pet_dict[pet_text]['pet_id']
         
-        # Validate selections
+        self.show_payment(event, pet_name, self.quotes.quote(event, pet_id))
+        if self.basket:
+            self.show_basket()
+    
+    def show_basket(self):
+        """Swap the payment list over to the basket breakdown (the status list keeps the selected event)."""
+        self.enrollpayment.clear()
+        self.enrollpayment.addItem(f"Owner: {self.quotes.owner_name}")
+        self.enrollpayment.addItem(f"Basket: {len(self.basket)} enrollment(s)")
+        self.enrollpayment.addItem("")  # Empty line separator
+        
+        groups = self.quotes.quote_basket(self.basket)
+        for group in groups:
+            event = group['event']
+            self.enrollpayment.addItem(f"{event['name']} ({event['date']} at {event['time']})")
+            for pet, fee in zip(group['pets'], group['fees']):
+                self.enrollpayment.addItem(f"    {pet['name']}: ₱{fee:.2f}")
+        
+        self.enrollpayment.addItem("")  # Empty line separator
+        self.enrollpayment.addItem(f"Total Amount: ₱{sum(group['total'] for group in groups):.2f}")
+    
+    def show_payment(self, event, pet_name, quote):
+        """Fill the payment and participation lists from a quote."""
+        # Add event and enrollment information
+        self.enrollpayment.addItem(f"Event: {event['name']}")
+        self.enrollpayment.addItem(f"Event Date: {event['date']} at {event['time']}")
+        self.enrollpayment.addItem(f"Owner: {self.quotes.owner_name}")
+        self.enrollpayment.addItem(f"Pet: {pet_name}")
+        self.enrollpayment.addItem("")  # Empty line separator
+        
+        self.enrollpayment.addItem(f"Base Registration Fee: ₱{quote['base_fee']:.2f}")
+        if quote['discount']:
+            # Additional pets get discount
+            self.enrollpayment.addItem(f"Extra Pet Discount: -₱{quote['discount']:.2f}")
+        
+        self.enrollpayment.addItem(f"Total Amount: ₱{quote['total']:.2f}")
+        
+        # Participation status - only show participants and available spots
+        self.statuspart.addItem(f"Participants: {quote['participants']}")
+        self.statuspart.addItem(f"Available Spots: {quote['available_spots']}")
+        if quote['already_entered']:
+            self.statuspart.addItem("This pet is already entered")
+
+    def hideEvent(self, event):
+        """Leaving the screen: drop any in-flight queries so they don't land on a hidden table."""
+        self.queries.cancel_all()
+        super().hideEvent(event)
+
+    def selected_pair(self):
+        """The (event, pet) currently picked in the dropdowns, or None after setting an error."""
         if not self.enrollselev.currentText():
             self.petregiserr.setText('Please select an event.')
-            return
+            return None
         
         if not self.selectpetbutt.currentText():
             self.petregiserr.setText('Please select a pet.')
-            return
-        
-        if self.current_owner_id is None:
-            self.petregiserr.setText('No owner found. Please register first.')
-            return
+            return None
         
         event_text = self.enrollselev.currentText()
         pet_text = self.selectpetbutt.currentText()
         
         if event_text not in self.event_dict or pet_text not in self.pet_dict:
             self.petregiserr.setText('Invalid selection.')
+            return None
+        
+        return self.event_dict[event_text], self.pet_dict[pet_text]
+    
+    def add_to_basket(self):
+        """Queue the current pet/event so several can be enrolled with one click."""
+        self.petregiserr.setText('')
+        pair = self.selected_pair()
+        if pair is None:
             return
+        event, pet = pair
         
-        event = self.event_dict[event_text]
-        pet = self.pet_dict[pet_text]
+        if any(e['event_id'] == event['event_id'] and p['pet_id'] == pet['pet_id'] for e, p in self.basket):
+            self.petregiserr.setText(f"{pet['name']} is already in the basket for this event.")
+            return
+        if self.quotes and self.quotes.quote(event, pet['pet_id'])['already_entered']:
+            self.petregiserr.setText('This pet is already registered for this event.')
+            return
         
-        # Check if pet is already registered for this event
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Check for existing registration (only check for active Paid registrations)
-                # This allows re-enrollment after withdrawal since we delete pet_event_entry on withdrawal
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM pet_event_entry pee
-                    JOIN event_registration er ON pee.registration_id = er.registration_id
-                    WHERE pee.pet_id = %s AND pee.event_id = %s AND er.status = 'Paid'
-                """, (pet['pet_id'], event['event_id']))
-                
-                if cursor.fetchone()[0] > 0:
-                    self.petregiserr.setText('This pet is already registered for this event. You can register for other events though!')
-                    conn.close()
-                    return
-                
-                # Check event deadline
-                reg_qdate = self.enrollregdate.date()
-                reg_date_obj = reg_qdate.toPyDate()
-                reg_date = reg_date_obj.strftime("%Y-%m-%d")
-                deadline = event.get('registration_deadline')
-                
-                deadline_date = to_python_date(deadline)
-                if deadline:
-                    # Get deadline from database
-                    cursor.execute("""
-                        SELECT registration_deadline 
-                        FROM events 
-                        WHERE event_id = %s
-                    """, (event['event_id'],))
-                    deadline_result = cursor.fetchone()
-                    if deadline_result and deadline_result[0]:
-                        deadline = deadline_result[0]
-                        deadline_date = to_python_date(deadline)
-                if deadline_date and reg_date_obj > deadline_date:
-                    deadline_text = deadline_date.strftime("%Y-%m-%d")
-                    self.petregiserr.setText(f'Registration deadline ({deadline_text}) has passed.')
-                    conn.close()
-                    return
-                
-                # Get next registration ID
-                cursor.execute("SELECT MAX(registration_id) FROM event_registration")
-                max_reg_id = cursor.fetchone()[0]
-                new_reg_id = (max_reg_id if max_reg_id is not None else 0) + 1
-                
-                # Calculate payment
-                cursor.execute("""
-                    SELECT COUNT(DISTINCT pee.pet_id)
-                    FROM event_registration er
-                    JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                    WHERE er.owner_id = %s AND er.event_id = %s AND er.status = 'Paid'
-                """, (self.current_owner_id, event['event_id']))
-                
-                existing_pets_count = cursor.fetchone()[0] or 0
-                
-                if existing_pets_count == 0:
-                    total_amount = event['base_fee']
-                else:
-                    total_amount = event['base_fee'] - event['extra_pet_discount']
-                
-                # Get current date and time for payment
-                from datetime import datetime
-                now = datetime.now()
-                payment_date = now.strftime("%Y-%m-%d")
-                payment_time = now.strftime("%H:%M:%S")
-                
-                # Insert registration
-                cursor.execute("""
-                    INSERT INTO event_registration 
-                    (registration_id, owner_id, event_id, registration_date, 
-                     total_amount_paid, payment_date, payment_time, status)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (new_reg_id, self.current_owner_id, event['event_id'], reg_date,
-                      total_amount, payment_date, payment_time, 'Paid'))
-                
-                # Get next entry ID
-                cursor.execute("SELECT MAX(entry_id) FROM pet_event_entry")
-                max_entry_id = cursor.fetchone()[0]
-                new_entry_id = (max_entry_id if max_entry_id is not None else 0) + 1
-                
-                # Insert pet event entry
-                cursor.execute("""
-                    INSERT INTO pet_event_entry 
-                    (entry_id, registration_id, pet_id, event_id, attendance_status)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (new_entry_id, new_reg_id, pet['pet_id'], event['event_id'], 'Registered'))
-                
-                # Log to participation_log
-                cursor.execute("SELECT MAX(log_id) FROM participation_log")
-                max_log_id = cursor.fetchone()[0]
-                new_log_id = (max_log_id if max_log_id is not None else 0) + 1
-                
-                action_date = now.strftime("%Y-%m-%d")
-                action_time = now.strftime("%H:%M:%S")
-                
-                cursor.execute("""
-                    INSERT INTO participation_log
-                    (log_id, registration_id, action_type, action_date, action_time,
-                     original_event_id, new_event_id, reason, refund_amount, top_up_amount)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (new_log_id, new_reg_id, 'Paid', action_date, action_time,
-                      event['event_id'], None, 'New registration', 0.00, 0.00))
-                
-                conn.commit()
-                
-                print(f"Successfully enrolled pet {pet['name']} in event {event['name']}")
-                self.gotoeventenroll()
-                
-            except Error as err:
-                print(f"Database INSERT Error (Enrollment): {err}")
-                if conn:
-                    conn.rollback()
-                self.petregiserr.setText('Registration failed: Database Error.')
-            except Exception as e:
-                print(f"Unexpected Error during enrollment: {e}")
-                if conn:
-                    conn.rollback()
-                self.petregiserr.setText('An unexpected error occurred.')
-            finally:
-                if conn:
-                    conn.close()
+        self.basket.append(pair)
+        self.petregiserr.setText(f"Added {pet['name']} to the basket.")
+        self.calculate_payment()
+    
+    def clear_basket(self):
+        """Empty the basket and go back to quoting the current selection."""
+        self.basket = []
+        self.petregiserr.setText('')
+        self.calculate_payment()
+        
+        
+    def enrollevnt(self):
+        """Enroll the basket (or just the current selection) in one transaction."""
+        self.petregiserr.setText('')
+        self.petwarningsize.setText('')
+        
+        if self.current_owner_id is None:
+            self.petregiserr.setText('No owner found. Please register first.')
+            return
+        
+        if self.basket:
+            items = list(self.basket)
         else:
-            self.petregiserr.setText('Database connection failed.')
+            pair = self.selected_pair()
+            if pair is None:
+                return
+            items = [pair]
+        
+        # What the screen showed; enroll_basket refuses if the database now disagrees
+        quoted_total = None
+        if self.quotes:
+            quoted_total = sum(group['total'] for group in self.quotes.quote_basket(items))
+        
+        reg_date_obj = self.enrollregdate.date().toPyDate()
+        try:
+            groups = enroll_basket(self.current_owner_id, items, reg_date_obj, quoted_total)
+        except EnrollmentRejected as rejected:
+            self.petregiserr.setText(str(rejected))
+            if rejected.stale_quote:
+                self.refresh_event_prices()
+                self.load_owner_data()
+            return
+        except EventFullError as full:
+            names = {event['event_id']: event['name'] for event, _ in items}
+            self.petregiserr.setText(f"Sorry, {names.get(full.event_id, 'this event')} is already full.")
+            return
+        except Error as err:
+            print(f"Database INSERT Error (Enrollment): {err}")
+            self.petregiserr.setText('Registration failed: Database Error.')
+            return
+        except Exception as e:
+            print(f"Unexpected Error during enrollment: {e}")
+            self.petregiserr.setText('An unexpected error occurred.')
+            return
+        
+        for group in groups:
+            pet_names = ', '.join(pet['name'] for pet in group['pets'])
+            print(f"Successfully enrolled {pet_names} in event {group['event']['name']}")
+        self.basket = []
+        self.gotoeventenroll()
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
+
+    def refresh_event_prices(self):
+        """A stale quote can mean the fees changed: re-read the events and re-point the basket at them."""
+        invalidate_reference_data('events')
+        try:
+            fresh = {event['event_id']: event for event in get_events()}
+        except Error as err:
+            print(f"Error loading events: {err}")
+            return
+        for name, event in self.event_dict.items():
+            self.event_dict[name] = fresh.get(event['event_id'], event)
+        self.basket = [(fresh.get(event['event_id'], event), pet) for event, pet in self.basket]
 
     def gotoeventenroll(self):
-        eventrolled = evenrolled()
-        widget.addWidget(eventrolled)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(evenrolled)
         
 # --------------------------------------------------------------------------------------------------------------------
 
 class evenrolled(QDialog):
     def __init__(self):
         super(evenrolled, self).__init__()
-        loadUi('./gui/eventenrolled.ui', self)
+        load_ui_form(self, 'eventenrolled.ui')
         self.eventenrolledbutt.clicked.connect(self.gotommenu)
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class editinf(QDialog):
+class editinf(FormScreen):
     def __init__(self, owner_context=None):
         super(editinf, self).__init__()
-        loadUi('./gui/editinfo.ui', self)
+        load_ui_form(self, 'editinfo.ui')
         self.editexitbutt.clicked.connect(self.gotommenu)
         self.saveinfobutt.clicked.connect(self.saveinf)
         self.oweditsavebutt.clicked.connect(self.saveownerinfo)
@@ -3686,9 +6331,7 @@ class editinf(QDialog):
                 
                 if selected_pet_id:
                     # Go to the full edit-pet screen
-                    editpet = editpetscreen(selected_pet_id, self.current_owner_id)
-                    widget.addWidget(editpet)
-                    widget.setCurrentIndex(widget.currentIndex() + 1)
+                    SCREENS.show(editpetscreen, selected_pet_id, self.current_owner_id)
             
         except Error as err:
             print(f"Error loading pets for selection: {err}")
@@ -3832,21 +6475,17 @@ class editinf(QDialog):
             self.editerrormess.setText('Please fix errors before saving.')
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
     def gotoinfoedited(self):    
-        infoedtd = infoedited()
-        widget.addWidget(infoedtd)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(infoedited)
         
 # --------------------------------------------------------------------------------------------------------------------
 
-class editpetscreen(QDialog):
+class editpetscreen(FormScreen):
     def __init__(self, pet_id, owner_id):
         super(editpetscreen, self).__init__()
-        loadUi('./gui/editpet.ui', self)
+        load_ui_form(self, 'editpet.ui')
         
         self.pet_id = pet_id
         self.owner_id = owner_id
@@ -3901,34 +6540,21 @@ class editpetscreen(QDialog):
     
 
     def load_breeds(self):
-        """Grab all breeds from the database and add them to the combo box, plus "Other" option."""
-        conn = get_db_connection()
-        if not conn:
-            return
-        
+        """Add all known breeds (from the reference cache) to the combo box, plus "Other" option."""
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT breed_name 
-                FROM breeds 
-                ORDER BY breed_name
-            """)
-            
-            breeds = cursor.fetchall()
-            self.petbreed.clear()
-            
-            # Add all breeds
-            for breed in breeds:
-                if breed[0]:
-                    self.petbreed.addItem(breed[0])
-            
-            # Add "Other" option at the end
-            self.petbreed.addItem("Other")
+            breeds = get_breed_names()
         except Error as err:
             print(f"Error loading breeds: {err}")
-        finally:
-            if conn:
-                conn.close()
+            return
+        
+        self.petbreed.clear()
+        
+        # Add all breeds
+        for breed_name in breeds:
+            self.petbreed.addItem(breed_name)
+        
+        # Add "Other" option at the end
+        self.petbreed.addItem("Other")
     
     def on_breed_selected(self):
         """Handle when breed selection changes - if "Other" is selected, clear the text so user can type."""
@@ -4040,8 +6666,17 @@ class editpetscreen(QDialog):
         
         muzzle_required = 1 if self.muzzleyes.isChecked() else 0
         
-        size_map = {'Small': 1, 'Medium': 2, 'Large': 3, 'Extra Large': 3}
-        actual_size_id = size_map.get(petsize_name, 3)
+        # Unknown names (e.g. 'Extra Large') fall back to the biggest category, as before
+        actual_size_id = size_id_for(petsize_name, 3)
+        
+        # A breed we haven't seen needs an id, taken before the connection is checked out
+        try:
+            breed_id = cached_breed_id(petbreed)
+            new_breed_id = allocate_id('breeds') if breed_id is None else None
+        except Error as err:
+            print(f"Error reserving breed id: {err}")
+            self.petregiserr.setText('Failed to save pet information.')
+            return
         
         conn = get_db_connection()
         if conn:
@@ -4061,21 +6696,20 @@ class editpetscreen(QDialog):
                 ))
                 
                 # Deal with the breed: reuse if it exists, otherwise make a new one
-                sql_breed_lookup = "SELECT breed_id FROM breeds WHERE breed_name = %s"
-                cursor.execute(sql_breed_lookup, (petbreed,))
-                breed_result = cursor.fetchone()
-                
-                if breed_result:
-                    breed_id = breed_result[0]
-                else:
-                    # No existing breed, so we add it
-                    cursor.execute("SELECT MAX(breed_id) FROM breeds")
-                    max_breed_id = cursor.fetchone()[0]
-                    new_breed_id = max(16, (max_breed_id if max_breed_id is not None else 0) + 1)
+                breed_added = False
+                if breed_id is None:
+                    sql_breed_lookup = "SELECT breed_id FROM breeds WHERE breed_name = %s"
+                    cursor.execute(sql_breed_lookup, (petbreed,))
+                    breed_result = cursor.fetchone()
                     
-                    sql_insert_breed = "INSERT INTO breeds (breed_id, breed_name, size_id) VALUES (%s, %s, %s)"
-                    cursor.execute(sql_insert_breed, (new_breed_id, petbreed, 3))
-                    breed_id = new_breed_id
+                    if breed_result:
+                        breed_id = breed_result[0]
+                    else:
+                        # No existing breed, so we add it
+                        sql_insert_breed = "INSERT INTO breeds (breed_id, breed_name, size_id) VALUES (%s, %s, %s)"
+                        cursor.execute(sql_insert_breed, (new_breed_id, petbreed, 3))
+                        breed_id = new_breed_id
+                    breed_added = True
                 
                 # Reset the breed link for this pet
                 cursor.execute("DELETE FROM pet_breed_junction WHERE pet_id = %s", (self.pet_id,))
@@ -4083,6 +6717,8 @@ class editpetscreen(QDialog):
                              (self.pet_id, breed_id))
                 
                 conn.commit()
+                if breed_added:
+                    invalidate_reference_data('breeds')
                 
                 # Just make sure the update really stuck
                 cursor.execute("SELECT pet_id FROM pets WHERE pet_id = %s AND name = %s",
@@ -4113,155 +6749,126 @@ class editpetscreen(QDialog):
     
     def gotoeditinf(self):
         """Return to the edit info screen."""
-        editin = editinf()
-        widget.addWidget(editin)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(editinf)
         
 # --------------------------------------------------------------------------------------------------------------------
 
 class infoedited(QDialog):
     def __init__(self):
         super(infoedited, self).__init__()
-        loadUi('./gui/infoedited!.ui', self)
+        load_ui_form(self, 'infoedited!.ui')
         self.infoeditedbackbutt.clicked.connect(self.gotommenu)
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class viewevents(QDialog):
     def __init__(self):
         super(viewevents, self).__init__()
-        loadUi('./gui/viewevents.ui', self)
+        load_ui_form(self, 'viewevents.ui')
         self.veventexitbutt.clicked.connect(self.gotommenu)
         
         # Grab the labels we use for quick error messages
         self.owerrormes = self.findChild(QtWidgets.QLabel, 'owerrormes')
         self.editerrormess = self.findChild(QtWidgets.QLabel, 'editerrormess')
+        self.events_model = ColumnTableModel([
+            'ID', 'Name', 'Date', 'Time', 'Location', 'Type', 
+            'Status', 'Max Participants', 'Deadline', 'Base Fee', 
+            'Extra Pet Discount', 'Distance (km)', 'Time Limit (min)', 
+            'Weight Range', 'Size Range'
+        ], parent=self)
+        setup_report_view(self.eventlist, self.events_model, stretch=False)
+        # Set alternating row colors for better readability
+        self.eventlist.setAlternatingRowColors(True)
         
         # Fill the table with events
         self.load_events()
 
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        self.load_events()
+
     def load_events(self):
-        """Pull all events from the DB and show them in the table."""
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Get all events plus their size ranges (if any)
-                cursor.execute("""
-                    SELECT e.event_id, e.name, e.date, e.time, e.location, 
-                           e.type, e.max_participants, e.registration_deadline,
-                           e.status, e.base_registration_fee, e.extra_pet_discount,
-                           e.distance_km, e.time_limit, e.min_weight, e.max_weight,
-                           sc_min.size_name as min_size, sc_max.size_name as max_size
-                    FROM events e
-                    LEFT JOIN size_category sc_min ON e.min_size_id = sc_min.size_id
-                    LEFT JOIN size_category sc_max ON e.max_size_id = sc_max.size_id
-                    ORDER BY e.date, e.time
-                """)
-                
-                events = cursor.fetchall()
-                
-                # Set up table with columns we want to show
-                self.eventlist.setRowCount(len(events))
-                self.eventlist.setColumnCount(15)
-                self.eventlist.setHorizontalHeaderLabels([
-                    'ID', 'Name', 'Date', 'Time', 'Location', 'Type', 
-                    'Status', 'Max Participants', 'Deadline', 'Base Fee', 
-                    'Extra Pet Discount', 'Distance (km)', 'Time Limit (min)', 
-                    'Weight Range', 'Size Range'
-                ])
-                
-                # Populate table
-                for row, event in enumerate(events):
-                    event_id = event[0]
-                    name = event[1] or ''
-                    date_value = event[2]
-                    date_str = format_date_string(date_value)
-                    time_value = event[3]
-                    time_str = str(time_value) if time_value not in (None, '') else ''
-                    location = event[4] or ''
-                    event_type = event[5] or ''
-                    max_participants = int(event[6]) if event[6] is not None else 0
-                    deadline_str = format_date_string(event[7])
-                    status = 'Open' if event[8] == 1 else 'Closed'
-                    base_fee = float(event[9]) if event[9] is not None else 0.0
-                    discount = float(event[10]) if event[10] is not None else 0.0
-                    distance = event[11] if event[11] is not None else 'N/A'
-                    time_limit = event[12] if event[12] is not None else 'N/A'
-                    
-                    # Weight range
-                    min_weight = float(event[13]) if event[13] is not None else None
-                    max_weight = float(event[14]) if event[14] is not None else None
-                    if min_weight is not None or max_weight is not None:
-                        min_weight_text = f"{min_weight:.2f}" if min_weight is not None else 'Any'
-                        max_weight_text = f"{max_weight:.2f}" if max_weight is not None else 'Any'
-                        weight_range = f"{min_weight_text}-{max_weight_text} kg"
-                    else:
-                        weight_range = 'Any'
-                    
-                    # Size range
-                    min_size = event[15] or ''
-                    max_size = event[16] or ''
-                    if min_size or max_size:
-                        size_range = f"{min_size if min_size else 'Any'}-{max_size if max_size else 'Any'}"
-                    else:
-                        size_range = 'Any'
-                    
-                    # Set items in table
-                    self.eventlist.setItem(row, 0, QtWidgets.QTableWidgetItem(str(event_id)))
-                    self.eventlist.setItem(row, 1, QtWidgets.QTableWidgetItem(name))
-                    self.eventlist.setItem(row, 2, QtWidgets.QTableWidgetItem(date_str))
-                    self.eventlist.setItem(row, 3, QtWidgets.QTableWidgetItem(time_str))
-                    self.eventlist.setItem(row, 4, QtWidgets.QTableWidgetItem(location))
-                    self.eventlist.setItem(row, 5, QtWidgets.QTableWidgetItem(event_type))
-                    self.eventlist.setItem(row, 6, QtWidgets.QTableWidgetItem(status))
-                    self.eventlist.setItem(row, 7, QtWidgets.QTableWidgetItem(str(max_participants)))
-                    self.eventlist.setItem(row, 8, QtWidgets.QTableWidgetItem(deadline_str))
-                    self.eventlist.setItem(row, 9, QtWidgets.QTableWidgetItem(f"₱{base_fee:.2f}"))
-                    self.eventlist.setItem(row, 10, QtWidgets.QTableWidgetItem(f"₱{discount:.2f}"))
-                    self.eventlist.setItem(row, 11, QtWidgets.QTableWidgetItem(str(distance)))
-                    self.eventlist.setItem(row, 12, QtWidgets.QTableWidgetItem(str(time_limit)))
-                    self.eventlist.setItem(row, 13, QtWidgets.QTableWidgetItem(weight_range))
-                    self.eventlist.setItem(row, 14, QtWidgets.QTableWidgetItem(size_range))
-                
-                # Resize columns to fit content
-                self.eventlist.resizeColumnsToContents()
+        """Pull all events (from the reference cache) and show them in the table."""
+        try:
+            # All events plus their size ranges (if any)
+            size_names = dict(get_size_categories())
+            events = [
+                (e['event_id'], e['name'], e['date'], e['time'], e['location'],
+                 e['type'], e['max_participants'], e['registration_deadline'],
+                 e['status'], e['base_fee'], e['extra_pet_discount'],
+                 e['distance_km'], e['time_limit'], e['min_weight'], e['max_weight'],
+                 size_names.get(e['min_size_id']), size_names.get(e['max_size_id']))
+                for e in get_events()
+            ]
+            
+            table_rows = []
+            
+            # Populate table
+            for event in events:
+                event_id = event[0]
+                name = event[1] or ''
+                date_value = event[2]
+                date_str = format_date_string(date_value)
+                time_value = event[3]
+                time_str = str(time_value) if time_value not in (None, '') else ''
+                location = event[4] or ''
+                event_type = event[5] or ''
+                max_participants = int(event[6]) if event[6] is not None else 0
+                deadline_str = format_date_string(event[7])
+                status = 'Open' if event[8] == 1 else 'Closed'
+                base_fee = float(event[9]) if event[9] is not None else 0.0
+                discount = float(event[10]) if event[10] is not None else 0.0
+                distance = event[11] if event[11] is not None else 'N/A'
+                time_limit = event[12] if event[12] is not None else 'N/A'
+                
+                # Weight range
+                min_weight = float(event[13]) if event[13] is not None else None
+                max_weight = float(event[14]) if event[14] is not None else None
+                if min_weight is not None or max_weight is not None:
+                    min_weight_text = f"{min_weight:.2f}" if min_weight is not None else 'Any'
+                    max_weight_text = f"{max_weight:.2f}" if max_weight is not None else 'Any'
+                    weight_range = f"{min_weight_text}-{max_weight_text} kg"
+                else:
+                    weight_range = 'Any'
                 
-                # Set alternating row colors for better readability
-                self.eventlist.setAlternatingRowColors(True)
+                # Size range
+                min_size = event[15] or ''
+                max_size = event[16] or ''
+                if min_size or max_size:
+                    size_range = f"{min_size if min_size else 'Any'}-{max_size if max_size else 'Any'}"
+                else:
+                    size_range = 'Any'
                 
-            except Error as err:
-                print(f"Error loading events: {err}")
-                if self.owerrormes:
-                    self.owerrormes.setText('Error loading events.')
-                if self.editerrormess:
-                    self.editerrormess.setText('Error loading events.')
-            finally:
-                if conn:
-                    conn.close()
-        else:
+                table_rows.append((
+                    str(event_id), name, date_str, time_str, location, event_type, status,
+                    str(max_participants), deadline_str, f"₱{base_fee:.2f}", f"₱{discount:.2f}",
+                    str(distance), str(time_limit), weight_range, size_range
+                ))
+            
+            self.events_model.set_rows(table_rows)
+            
+            # Resize columns to fit content
+            self.eventlist.resizeColumnsToContents()
+
+        except Error as err:
+            print(f"Error loading events: {err}")
             if self.owerrormes:
-                self.owerrormes.setText('Database connection failed.')
+                self.owerrormes.setText('Error loading events.')
             if self.editerrormess:
-                self.editerrormess.setText('Database connection failed.')
+                self.editerrormess.setText('Error loading events.')
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class yourstatuss(QDialog):
     def __init__(self, owner_context=None):
         super(yourstatuss, self).__init__()
-        loadUi('./gui/status.ui', self)
+        load_ui_form(self, 'status.ui')
         self.exitbutt.clicked.connect(self.gotommenu)
 
         self.transferbutt = self.findChild(QtWidgets.QPushButton, 'transferbutt')
@@ -4287,6 +6894,11 @@ class yourstatuss(QDialog):
         self.load_owner_data()
         self.populate_status_table()
 
+    def refresh(self):
+        """Called by the screen manager when we come back (e.g. after a transfer or withdrawal)."""
+        self.load_owner_data()
+        self.populate_status_table()
+
     def configure_table(self):
         if not self.status_table:
             return
@@ -4399,154 +7011,780 @@ class yourstatuss(QDialog):
                 self.owerrormes.setText('Database connection failed.')
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
     def gotowithdraw(self):
         """Go to withdraw screen (default view)."""
-        withd = withdraw()
-        widget.addWidget(withd)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(withdraw)
     
     def gototransfer(self):
         """Go to transfer screen (default view)."""
-        trnsfr = transfer()
-        widget.addWidget(trnsfr)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(transfer)
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class entries(QDialog):
     def __init__(self):
         super(entries, self).__init__()
-        loadUi('./gui/entries.ui', self)
+        load_ui_form(self, 'entries.ui')
         self.entriestexitbutt.clicked.connect(self.gotommenu)
         
         # Quick handles for labels we might update
         self.owerrormes = self.findChild(QtWidgets.QLabel, 'owerrormes')
+        self.exports = QueryExecutor(self)
+        self.exportbutt.clicked.connect(self.export_participants)
+        self.participants_model = KeysetTableModel([
+            'Owner First Name', 'Owner Last Name', 'Email', 'Contact',
+            'Pet Name', 'Age', 'Sex', 'Weight (kg)', 'Size',
+            'Registration Date', 'Amount Paid', 'Status'
+        ], on_error=self.show_participants_error, parent=self)
+        setup_report_view(self.eventsparticipants, self.participants_model, stretch=False)
+        # Size columns from the first page (the header only samples a couple hundred rows)
+        self.participants_model.rowsInserted.connect(self.fit_participant_columns)
         
         # When event changes in the dropdown, refresh the details
         self.vieweventsel.currentIndexChanged.connect(self.on_event_selected)
         
         # Initially load all visible events into the dropdown
         self.load_events()
+
+    def refresh(self):
+        """Called by the screen manager when we come back to this screen."""
+        self.on_event_selected()
         
     def load_events(self):
         """Grab all open events and stuff them into the dropdown."""
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT event_id, name, date, time
-                    FROM events 
-                    WHERE status = 1
-                    ORDER BY date, time
-                """)
-                
-                events = cursor.fetchall()
-                self.vieweventsel.clear()
-                self.event_dict = {}
-                
-                for event in events:
-                    event_id = event[0]
-                    event_name = event[1]
-                    display_text = event_name
-                    self.vieweventsel.addItem(display_text)
-                    self.event_dict[display_text] = {
-                        'event_id': event_id,
-                        'name': event[1],
-                        'date': event[2],
-                        'time': event[3]
-                    }
-            except Error as err:
-                print(f"Error loading events: {err}")
-                self.owerrormes.setText('Error loading events.')
-            finally:
-                if conn:
-                    conn.close()
+        try:
+            events = get_events(open_only=True)
+        except Error as err:
+            print(f"Error loading events: {err}")
+            self.owerrormes.setText('Error loading events.')
+            return
+        
+        self.vieweventsel.clear()
+        self.event_dict = {}
+        
+        for event in events:
+            display_text = event['name']
+            self.vieweventsel.addItem(display_text)
+            self.event_dict[display_text] = event
+    
+    def on_event_selected(self):
+        """When you pick an event, show its date and list of participants."""
+        selected_text = self.vieweventsel.currentText()
+        if not selected_text or selected_text not in self.event_dict:
+            self.eventdate.clear()
+            self.participants_model.clear()
+            return
+        
+        event = self.event_dict[selected_text]
+        event_id = event['event_id']
+        
+        # Show the date and time in the small list widget
+        self.eventdate.clear()
+        self.eventdate.addItem(f"Date: {event['date']}")
+        self.eventdate.addItem(f"Time: {event['time']}")
+        
+        # Then load everyone registered for this event
+        self.load_participants(event_id)
+    
+    def load_participants(self, event_id):
+        """Fill the participants table for the chosen event, a page at a time as it scrolls."""
+        # entry_id is fetched (but not shown) so the sort order has a unique tie-breaker
+        self.participants_model.start(KeysetQuery("""
+            SELECT o.first_name, o.last_name, o.email, o.contact_number,
+                   p.name as pet_name, p.age, p.sex, p.weight_kg,
+                   sc.size_name, er.registration_date, er.total_amount_paid,
+                   pee.attendance_status, pee.entry_id
+            FROM event_registration er
+            JOIN owners o ON er.owner_id = o.owner_id
+            JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+            JOIN pets p ON pee.pet_id = p.pet_id
+            LEFT JOIN size_category sc ON p.actual_size_id = sc.size_id
+            WHERE er.event_id = %s AND er.status = 'Paid'
+        """, (event_id,),
+            ['er.registration_date', 'o.last_name', 'o.first_name', 'pee.entry_id'], [9, 1, 0, 12]))
+
+    def export_participants(self):
+        if self.participants_model.query is None:
+            return
+        # The hidden entry_id column is dropped (the export has the same columns as the table)
+        start_report_export(self, self.exports, *self.participants_model.query.full_sql(), self.participants_model,
+                            'event_participants.csv', busy=[self.exportbutt], status_label=self.owerrormes)
+
+    def fit_participant_columns(self, parent, first, last):
+        if first == 0:
+            self.eventsparticipants.resizeColumnsToContents()
+
+    def show_participants_error(self, message):
+        print(f"Error loading participants: {message}")
+        self.owerrormes.setText('Error loading participants.')
+
+    def hideEvent(self, event):
+        """Leaving the screen: stop paging so results don't land on a hidden table."""
+        self.participants_model.cancel()
+        super().hideEvent(event)
+
+    def gotommenu(self):
+        SCREENS.show(mainmenu)
+
+# --------------------------------------------------------------------------------------------------------------------
+# Refund policy
+#
+# Tiers live in refund_policy_tier as (min_days_before, refund_percent) rows, either for one
+# event, for every event of a type, or the default (both NULL); the most specific set wins.
+# Withdrawing N days before the event refunds the percent of the highest tier with
+# min_days_before <= N, and nothing below the lowest tier. Schedules are built once per
+# load and cached with the other reference data.
+
+
+def _refund_amount(amount_paid, percent):
+    return round(float(amount_paid or 0) * percent / 100, 2)
+
+
+class RefundSchedule:
+    """One policy's tiers, sorted so finding the tier for a day count is a bisect."""
+
+    def __init__(self, tiers):
+        tiers = sorted((int(days), float(percent)) for days, percent in tiers)
+        self.days = [days for days, _ in tiers]
+        self.percents = [percent for _, percent in tiers]
+
+    def percent(self, days_until):
+        i = bisect.bisect_right(self.days, days_until) - 1
+        return self.percents[i] if i >= 0 else 0.0
+
+    def evaluate(self, days_until, amount_paid):
+        percent = self.percent(days_until)
+        if self.days and days_until >= self.days[-1]:
+            refund_text = f"{percent:g}% refund ({self.days[-1]}+ days before)"
+        else:
+            refund_text = f"{percent:g}% refund ({days_until} days before)"
+        return {
+            'days_until': days_until,
+            'refund_amount': _refund_amount(amount_paid, percent),
+            'refund_text': refund_text
+        }
+
+
+class RefundPolicy:
+    """Every configured schedule, keyed by event, event type, or the default."""
+
+    def __init__(self, rows):
+        grouped = {}
+        for event_id, event_type, days, percent in rows:
+            if event_id is not None:
+                key = ('event', event_id)
+            elif event_type is not None:
+                key = ('type', event_type)
+            else:
+                key = ('default', None)
+            grouped.setdefault(key, []).append((days, percent))
+        self.schedules = {key: RefundSchedule(tiers) for key, tiers in grouped.items()}
+        self.default = self.schedules.get(('default', None)) or RefundSchedule(DEFAULT_REFUND_TIERS)
+
+    def schedule_for(self, event_id, event_type=None):
+        return (self.schedules.get(('event', event_id))
+                or self.schedules.get(('type', event_type))
+                or self.default)
+
+
+def get_refund_policy():
+    return REFERENCE_DATA.get('refund_policy')
+
+
+def _days_until(event_date, today):
+    return ((to_python_date(event_date) or today) - today).days
+
+
+def calculate_refund(event_id, event_type, event_date, amount_paid, today=None):
+    """Refund owed for withdrawing from one event today: days_until, refund_amount, refund_text."""
+    today = today or date.today()
+    schedule = get_refund_policy().schedule_for(event_id, event_type)
+    return schedule.evaluate(_days_until(event_date, today), amount_paid)
+
+
+def evaluate_refunds(registrations, today=None):
+    """Refunds for many (event_id, event_type, event_date, amount_paid) rows at once, in order.
+
+    The tier is looked up once per event and then applied to every amount in it.
+    """
+    today = today or date.today()
+    policy = get_refund_policy()
+    percents = {}
+    refunds = []
+    for event_id, event_type, event_date, amount_paid in registrations:
+        percent = percents.get(event_id)
+        if percent is None:
+            schedule = policy.schedule_for(event_id, event_type)
+            percent = percents[event_id] = schedule.percent(_days_until(event_date, today))
+        refunds.append(_refund_amount(amount_paid, percent))
+    return refunds
+
+
+def refund_liability(event_ids=None, today=None):
+    """What refunds would cost if every Paid registration cancelled today, per event.
+
+    One grouped query: registrations paying the same amount in the same event get the same
+    refund, so each (event, amount) pair is priced once. Returns
+    {event_id: {'registrations', 'amount_paid', 'refund', 'percent', 'days_until'}}.
+    """
+    today = today or date.today()
+    sql = """
+        SELECT er.event_id, e.type, e.date, er.total_amount_paid, COUNT(*)
+        FROM event_registration er
+        JOIN events e ON er.event_id = e.event_id
+        WHERE er.status = 'Paid'
+    """
+    params = []
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        if not event_ids:
+            return {}
+        sql += f" AND er.event_id IN ({', '.join(['%s'] * len(event_ids))})"
+        params.extend(event_ids)
+    sql += " GROUP BY er.event_id, e.type, e.date, er.total_amount_paid ORDER BY er.event_id"
+    
+    policy = get_refund_policy()
+    liability = {}
+    for event_id, event_type, event_date, amount_paid, count in run_query(sql, params):
+        totals = liability.get(event_id)
+        if totals is None:
+            days_until = _days_until(event_date, today)
+            totals = liability[event_id] = {
+                'registrations': 0, 'amount_paid': 0.0, 'refund': 0.0, 'days_until': days_until,
+                'percent': policy.schedule_for(event_id, event_type).percent(days_until)
+            }
+        totals['registrations'] += count
+        totals['amount_paid'] += float(amount_paid or 0) * count
+        totals['refund'] += _refund_amount(amount_paid, totals['percent']) * count
+    return liability
+
+
+def print_refund_liability():
+    """--refund-liability: the refunds owed per event if everyone cancelled today."""
+    liability = refund_liability()
+    names = {event['event_id']: event['name'] for event in get_events()}
+    for event_id, totals in liability.items():
+        print(f"{names.get(event_id, event_id)}: {totals['registrations']} registration(s), "
+              f"₱{totals['amount_paid']:.2f} paid, {totals['percent']:g}% refund "
+              f"({totals['days_until']} days out) = ₱{totals['refund']:.2f}")
+    print(f"Total refund liability: ₱{sum(t['refund'] for t in liability.values()):.2f}")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# Transfers and withdrawals: quote first, then commit
+#
+# The screens read a quote (no locks, connection back in the pool right away), ask the
+# user to confirm, and only then open a short transaction. That transaction re-checks the
+# registration (same event, still Paid, same amount) instead of holding a lock while the
+# confirmation dialog is up.
+
+# How many times a commit re-reads its quote and tries again before giving up
+QUOTE_COMMIT_RETRIES = 3
+# Deadlock / lock wait timeout: MySQL rolled the transaction back, so it's safe to rerun
+_RETRYABLE_ERRNOS = (1205, 1213)
+
+
+class QuoteChanged(Exception):
+    """The registration (or the price) changed after it was quoted; `quote` is the fresh one, None if it's gone."""
+
+    def __init__(self, quote):
+        super().__init__("The registration changed since it was quoted.")
+        self.quote = quote
+
+
+def _registration_pet_ids(cursor, registration_id, event_id, lock=False):
+    cursor.execute(f"""
+        SELECT DISTINCT pet_id FROM pet_event_entry
+        WHERE registration_id = %s AND event_id = %s
+        ORDER BY pet_id{' FOR UPDATE' if lock else ''}
+    """, (registration_id, event_id))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def quote_transfer(registration_id, to_event_id):
+    """What moving a Paid registration to another open event costs, or None if it can't be moved.
+
+    Read-only: the connection goes back to the pool before this returns.
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT er.event_id, er.status, er.total_amount_paid, e.base_registration_fee, e.extra_pet_discount
+            FROM event_registration er
+            JOIN events e ON e.event_id = %s AND e.status = 1
+            WHERE er.registration_id = %s
+        """, (to_event_id, registration_id))
+        row = cursor.fetchone()
+        if not row or row[1] != 'Paid' or row[0] == to_event_id:
+            return None
+        from_event_id, _, amount_paid, base_fee, extra_pet_discount = row
+        if _registrations_clashing(cursor, [registration_id], to_event_id):
+            return None
+        pet_ids = _registration_pet_ids(cursor, registration_id, from_event_id)
+        new_total = transfer_total(base_fee, extra_pet_discount, len(pet_ids))
+        fee_difference = new_total - amount_paid
+        return {
+            'registration_id': registration_id,
+            'from_event_id': from_event_id,
+            'to_event_id': to_event_id,
+            'amount_paid': amount_paid,
+            'pet_ids': pet_ids,
+            'new_total': new_total,
+            'top_up': fee_difference if fee_difference > 0 else 0,
+            'refund': -fee_difference if fee_difference < 0 else 0,
+        }
+    finally:
+        conn.close()
+
+
+def quote_withdrawal(registration_id, today=None):
+    """Amount paid and the refund for withdrawing a Paid registration today, or None if it can't be withdrawn."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT er.event_id, er.status, er.total_amount_paid, er.registration_date, e.date, e.type
+            FROM event_registration er
+            JOIN events e ON er.event_id = e.event_id
+            WHERE er.registration_id = %s
+        """, (registration_id,))
+        row = cursor.fetchone()
+        if not row or row[1] != 'Paid':
+            return None
+        event_id, _, amount_paid, registration_date, event_date, event_type = row
+        quote = {
+            'registration_id': registration_id,
+            'event_id': event_id,
+            'event_type': event_type,
+            'event_date': event_date,
+            'amount_paid': amount_paid,
+            'registration_date': registration_date,
+            'pet_ids': _registration_pet_ids(cursor, registration_id, event_id),
+        }
+        quote.update(calculate_refund(event_id, event_type, event_date, amount_paid, today))
+        return quote
+    finally:
+        conn.close()
+
+
+def _commit_quoted(commit, quote, requote, terms, retries=QUOTE_COMMIT_RETRIES):
+    """Run commit(quote); when it finds the row changed (returns False) or hits a deadlock, re-quote and retry.
+
+    A fresh quote with the same `terms` (the money the user agreed to) is retried quietly;
+    different terms raise QuoteChanged so the screen can ask again.
+    """
+    for attempt in range(retries + 1):
+        try:
+            if commit(quote):
+                return quote
+        except Error as err:
+            if err.errno not in _RETRYABLE_ERRNOS or attempt == retries:
+                raise
+        fresh = requote()
+        if fresh is None or any(fresh[key] != quote[key] for key in terms):
+            raise QuoteChanged(fresh)
+        quote = fresh
+    raise QuoteChanged(quote)
+
+
+def _registrations_clashing(cursor, registration_ids, to_event_id):
+    """Registrations with a pet that already has an entry in to_event_id (it can't be entered twice)."""
+    marks = ', '.join(['%s'] * len(registration_ids))
+    cursor.execute(f"""
+        SELECT DISTINCT src.registration_id
+        FROM pet_event_entry src
+        JOIN pet_event_entry dst ON dst.pet_id = src.pet_id AND dst.event_id = %s
+                                AND dst.registration_id <> src.registration_id
+        WHERE src.registration_id IN ({marks})
+    """, [to_event_id, *registration_ids])
+    return {row[0] for row in cursor.fetchall()}
+
+
+def _destination_fees(cursor, event_id):
+    """(base fee, extra-pet discount) of an event that is still open, else None."""
+    cursor.execute("""
+        SELECT base_registration_fee, extra_pet_discount FROM events WHERE event_id = %s AND status = 1
+    """, (event_id,))
+    return cursor.fetchone()
+
+
+def transfer_total(base_fee, extra_pet_discount, pet_count):
+    """A registration's total in the destination event for pet_count pets, priced as at enrollment.
+
+    The first pet pays the base fee and every pet after it gets the extra-pet discount.
+    """
+    return base_fee + (base_fee - extra_pet_discount) * (max(pet_count, 1) - 1)
+
+
+def lock_transfer_moves(cursor, registration_ids, to_event_id, base_fee, extra_pet_discount):
+    """Lock the registrations and price moving each of them to to_event_id, in the caller's transaction.
+
+    Returns (moves, skipped). A move has the same keys as a transfer quote, priced for its
+    own pets (see transfer_total); skipped maps registration_id -> why it stays put (not
+    Paid, already there, or a pet already entered). Four queries whatever the number of
+    registrations.
+    """
+    registration_ids = sorted(set(registration_ids))
+    if not registration_ids:
+        return [], {}
+    marks = ', '.join(['%s'] * len(registration_ids))
+    cursor.execute(f"""
+        SELECT registration_id, event_id, total_amount_paid, COALESCE(payment_date, registration_date)
+        FROM event_registration
+        WHERE registration_id IN ({marks}) AND status = 'Paid'
+        ORDER BY registration_id FOR UPDATE
+    """, registration_ids)
+    locked = cursor.fetchall()
+    cursor.execute(f"""
+        SELECT DISTINCT registration_id, pet_id FROM pet_event_entry
+        WHERE registration_id IN ({marks})
+        ORDER BY registration_id, pet_id FOR UPDATE
+    """, registration_ids)
+    pet_ids = {}
+    for registration_id, pet_id in cursor.fetchall():
+        pet_ids.setdefault(registration_id, []).append(pet_id)
+    clashing = _registrations_clashing(cursor, registration_ids, to_event_id)
+    
+    skipped = {registration_id: 'not paid' for registration_id in registration_ids}
+    moves = []
+    for registration_id, from_event_id, amount_paid, payment_day in locked:
+        if from_event_id == to_event_id:
+            skipped[registration_id] = 'already in event'
+            continue
+        if registration_id in clashing:
+            skipped[registration_id] = 'pet already entered'
+            continue
+        del skipped[registration_id]
+        moved_pets = pet_ids.get(registration_id, [])
+        new_total = transfer_total(base_fee, extra_pet_discount, len(moved_pets))
+        fee_difference = new_total - amount_paid
+        moves.append({
+            'registration_id': registration_id,
+            'from_event_id': from_event_id,
+            'to_event_id': to_event_id,
+            'amount_paid': amount_paid,
+            'pet_ids': moved_pets,
+            'new_total': new_total,
+            'top_up': fee_difference if fee_difference > 0 else 0,
+            'refund': -fee_difference if fee_difference < 0 else 0,
+            'payment_day': payment_day,
+        })
+    return moves, skipped
+
+
+def apply_transfer_moves(cursor, moves, to_event_id, reason, log_ids):
+    """Write moves from lock_transfer_moves: one UPDATE per table, log rows with executemany.
+
+    Entries are re-pointed in place (reset to 'Registered', no result) rather than deleted
+    and re-inserted. log_ids (at least one per move) are allocated by the caller before its
+    transaction opens. Raises EventFullError, with nothing written, if they don't all fit.
+    """
+    if not moves:
+        return
+    from_counts = {}
+    for move in moves:
+        from_counts[move['from_event_id']] = from_counts.get(move['from_event_id'], 0) + len(move['pet_ids'])
+    move_event_spots_many(cursor, to_event_id, from_counts)
     
-    def on_event_selected(self):
-        """When you pick an event, show its date and list of participants."""
-        selected_text = self.vieweventsel.currentText()
-        if not selected_text or selected_text not in self.event_dict:
-            self.eventdate.clear()
-            self.eventsparticipants.setRowCount(0)
-            return
+    now = datetime.now()
+    action_date = now.strftime("%Y-%m-%d")
+    action_time = now.strftime("%H:%M:%S")
+    registration_ids = [move['registration_id'] for move in moves]
+    marks = ', '.join(['%s'] * len(registration_ids))
+    
+    # Each registration gets its own new total (it depends on how many pets it holds)
+    totals = ' '.join(['WHEN %s THEN %s'] * len(moves))
+    cursor.execute(f"""
+        UPDATE event_registration
+        SET event_id = %s, total_amount_paid = CASE registration_id {totals} END,
+            payment_date = %s, payment_time = %s
+        WHERE registration_id IN ({marks})
+    """, [to_event_id, *[value for move in moves for value in (move['registration_id'], move['new_total'])],
+          action_date, action_time, *registration_ids])
+    cursor.execute(f"""
+        UPDATE pet_event_entry
+        SET event_id = %s, attendance_status = 'Registered', pet_result = NULL
+        WHERE registration_id IN ({marks})
+    """, [to_event_id, *registration_ids])
+    cursor.executemany("""
+        INSERT INTO participation_log
+        (log_id, registration_id, action_type, action_date, action_time,
+         original_event_id, new_event_id, reason, refund_amount, top_up_amount)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [(log_id, move['registration_id'], 'Transferred', action_date, action_time,
+           move['from_event_id'], to_event_id, reason, move['refund'], move['top_up'])
+          for log_id, move in zip(log_ids, moves)])
+    
+    # Each registration is re-booked from its old event/day to the destination today
+    deltas = []
+    for move in moves:
+        deltas.append((move['from_event_id'], move['payment_day'], -1, -(move['amount_paid'] or 0), 0, 0))
+        deltas.append((to_event_id, action_date, 1, move['new_total'], move['top_up'], 0))
+    post_finance(cursor, deltas)
+
+
+def _commit_transfer(quote):
+    log_ids = allocate_ids('participation_log', 1)
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    to_event_id = quote['to_event_id']
+    try:
+        cursor = conn.cursor()
         
-        event = self.event_dict[selected_text]
-        event_id = event['event_id']
+        fees = _destination_fees(cursor, to_event_id)
+        if fees is None:
+            conn.rollback()
+            return False
         
-        # Show the date and time in the small list widget
-        self.eventdate.clear()
-        self.eventdate.addItem(f"Date: {event['date']}")
-        self.eventdate.addItem(f"Time: {event['time']}")
+        # Locked now; only go ahead if nobody moved, cancelled or repriced it since the quote
+        # (new_total is what the user agreed to pay)
+        moves, _ = lock_transfer_moves(cursor, [quote['registration_id']], to_event_id, *fees)
+        if not moves or any(moves[0][key] != quote[key]
+                            for key in ('from_event_id', 'amount_paid', 'pet_ids', 'new_total')):
+            conn.rollback()
+            return False
         
-        # Then load everyone registered for this event
-        self.load_participants(event_id)
-    
-    def load_participants(self, event_id):
-        """Fill the participants table for the chosen event."""
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT o.first_name, o.last_name, o.email, o.contact_number,
-                           p.name as pet_name, p.age, p.sex, p.weight_kg,
-                           sc.size_name, er.registration_date, er.total_amount_paid,
-                           pee.attendance_status
-                    FROM event_registration er
-                    JOIN owners o ON er.owner_id = o.owner_id
-                    JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
-                    JOIN pets p ON pee.pet_id = p.pet_id
-                    LEFT JOIN size_category sc ON p.actual_size_id = sc.size_id
-                    WHERE er.event_id = %s AND er.status = 'Paid'
-                    ORDER BY er.registration_date, o.last_name, o.first_name
-                """, (event_id,))
-                
-                participants = cursor.fetchall()
-                
-                # Set up table
-                self.eventsparticipants.setRowCount(len(participants))
-                self.eventsparticipants.setColumnCount(12)
-                self.eventsparticipants.setHorizontalHeaderLabels([
-                    'Owner First Name', 'Owner Last Name', 'Email', 'Contact',
-                    'Pet Name', 'Age', 'Sex', 'Weight (kg)', 'Size',
-                    'Registration Date', 'Amount Paid', 'Status'
-                ])
-                
-                # Populate table
-                for row, participant in enumerate(participants):
-                    for col, value in enumerate(participant):
-                        item = QtWidgets.QTableWidgetItem(str(value) if value is not None else '')
-                        self.eventsparticipants.setItem(row, col, item)
-                
-                # Resize columns to fit content
-                self.eventsparticipants.resizeColumnsToContents()
-                
-            except Error as err:
-                print(f"Error loading participants: {err}")
-                self.owerrormes.setText('Error loading participants.')
-            finally:
-                if conn:
-                    conn.close()
-        else:
-            self.owerrormes.setText('Database connection failed.')
+        apply_transfer_moves(cursor, moves, to_event_id, 'Event transfer', log_ids)
+        conn.commit()
+        return True
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def transfer_registration(quote):
+    """Commit a transfer the user confirmed. Raises QuoteChanged if the price moved, EventFullError if it's full."""
+    return _commit_quoted(_commit_transfer, quote,
+                          lambda: quote_transfer(quote['registration_id'], quote['to_event_id']),
+                          ('from_event_id', 'top_up', 'refund'))
+
+
+class RelocationRejected(Exception):
+    """A bulk relocation refused before anything was written; the message is for the user."""
+
+
+def relocate_event_entrants(from_event_id, to_event_id, reason='Event relocated'):
+    """Move every Paid registration of one event into another in a single transaction.
+
+    Registrations that can't move (a pet already entered in the destination) are left
+    behind and reported. The entrants are listed, and their log ids allocated, before the
+    transaction opens; anyone who registers in between stays put until the next run.
+    Raises RelocationRejected or EventFullError with nothing written; returns
+    (moves, skipped) as lock_transfer_moves does.
+    """
+    if from_event_id == to_event_id:
+        raise RelocationRejected('Pick two different events.')
+    registration_ids = [row[0] for row in run_query("""
+        SELECT registration_id FROM event_registration WHERE event_id = %s AND status = 'Paid'
+    """, (from_event_id,))]
+    if not registration_ids:
+        raise RelocationRejected('That event has no paid entrants to move.')
+    log_ids = allocate_ids('participation_log', len(registration_ids))
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        fees = _destination_fees(cursor, to_event_id)
+        if fees is None:
+            raise RelocationRejected('The destination event is not open for registration.')
+        
+        moves, skipped = lock_transfer_moves(cursor, registration_ids, to_event_id, *fees)
+        apply_transfer_moves(cursor, moves, to_event_id, reason, log_ids)
+        conn.commit()
+        return moves, skipped
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _commit_withdrawal(quote):
+    # The refund shrinks as the event gets closer; a quote from yesterday may be stale
+    refund = calculate_refund(quote['event_id'], quote['event_type'], quote['event_date'], quote['amount_paid'])
+    if refund['refund_amount'] != quote['refund_amount']:
+        return False
+    log_id = allocate_id('participation_log')
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    registration_id, event_id = quote['registration_id'], quote['event_id']
+    try:
+        cursor = conn.cursor()
+        now = datetime.now()
+        action_date = now.strftime("%Y-%m-%d")
+        action_time = now.strftime("%H:%M:%S")
+        
+        cursor.execute("""
+            UPDATE event_registration SET status = 'Cancelled', cancellation_date = %s
+            WHERE registration_id = %s AND event_id = %s AND status = 'Paid' AND total_amount_paid = %s
+        """, (action_date, registration_id, event_id, quote['amount_paid']))
+        if cursor.rowcount != 1:
+            conn.rollback()
+            return False
+        pet_ids = _registration_pet_ids(cursor, registration_id, event_id, lock=True)
+        if pet_ids != quote['pet_ids']:
+            conn.rollback()
+            return False
+        
+        # Give the registration's spots back, then drop its entries
+        release_event_spots(cursor, event_id, len(pet_ids))
+        cursor.execute("DELETE FROM pet_event_entry WHERE registration_id = %s", (registration_id,))
+        
+        cursor.execute("""
+            INSERT INTO participation_log 
+            (log_id, registration_id, action_type, action_date, action_time, 
+             original_event_id, new_event_id, reason, refund_amount, top_up_amount)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, (log_id, registration_id, 'Cancelled', action_date, action_time,
+              event_id, None, 'Owner withdrew', quote['refund_amount'], 0.00))
+        post_finance(cursor, [(event_id, action_date, 0, 0, 0, quote['refund_amount'])])
+        
+        conn.commit()
+        return True
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
-    def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
 
-# --------------------------------------------------------------------------------------------------------------------
+def withdraw_registration(quote):
+    """Commit a withdrawal the user confirmed. Raises QuoteChanged if the refund or registration changed."""
+    return _commit_quoted(_commit_withdrawal, quote,
+                          lambda: quote_withdrawal(quote['registration_id']),
+                          ('event_id', 'refund_amount'))
 
 
-class transfer(QDialog):
+# Registrations cancelled per transaction when an event is called off
+EVENT_CANCEL_CHUNK = 500
+
+
+def _cancel_event_chunk(event_id, event_type, event_date, reason, log_ids, totals):
+    """Cancel up to len(log_ids) of the event's Paid registrations in one transaction; returns how many."""
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        now = datetime.now()
+        action_date = now.strftime("%Y-%m-%d")
+        action_time = now.strftime("%H:%M:%S")
+        cursor.execute("""
+            SELECT registration_id, total_amount_paid FROM event_registration
+            WHERE event_id = %s AND status = 'Paid'
+            ORDER BY registration_id
+            LIMIT %s
+            FOR UPDATE
+        """, (event_id, len(log_ids)))
+        registrations = cursor.fetchall()
+        if not registrations:
+            conn.rollback()
+            return 0
+        registration_ids = [registration_id for registration_id, _ in registrations]
+        marks = ', '.join(['%s'] * len(registration_ids))
+        
+        cursor.execute(f"""
+            SELECT COUNT(DISTINCT pet_id) FROM pet_event_entry WHERE registration_id IN ({marks})
+        """, registration_ids)
+        pet_count = cursor.fetchone()[0] or 0
+        release_event_spots(cursor, event_id, pet_count)
+        
+        cursor.execute(f"""
+            UPDATE event_registration SET status = 'Cancelled', cancellation_date = %s
+            WHERE registration_id IN ({marks})
+        """, [action_date, *registration_ids])
+        cursor.execute(f"DELETE FROM pet_event_entry WHERE registration_id IN ({marks})", registration_ids)
+        
+        # The whole chunk is priced in one batch (one tier lookup for the event)
+        refunds = evaluate_refunds([(event_id, event_type, event_date, amount_paid)
+                                    for _, amount_paid in registrations])
+        logs = []
+        for log_id, (registration_id, amount_paid), refund in zip(log_ids, registrations, refunds):
+            logs.append((log_id, registration_id, 'Cancelled', action_date, action_time,
+                         event_id, None, reason, refund, 0.00))
+        cursor.executemany("""
+            INSERT INTO participation_log
+            (log_id, registration_id, action_type, action_date, action_time,
+             original_event_id, new_event_id, reason, refund_amount, top_up_amount)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, logs)
+        post_finance(cursor, [(event_id, action_date, 0, 0, 0, sum(refunds))])
+        conn.commit()
+        
+        totals['registrations'] += len(registrations)
+        totals['pets'] += pet_count
+        totals['amount_paid'] += sum(float(amount_paid or 0) for _, amount_paid in registrations)
+        totals['refunded'] += sum(refunds)
+        return len(registrations)
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def cancel_event(event_id, reason='Event cancelled', chunk_size=EVENT_CANCEL_CHUNK, progress=None):
+    """Close an event and cancel every Paid registration in it, refunding each by the refund policy.
+
+    The event is closed first (its own short transaction) so nothing new can join. Then
+    registrations go chunk_size per transaction: one UPDATE, one DELETE of their entries and
+    one executemany of log rows per chunk, so a big event never holds locks for long. Each
+    chunk's log ids are allocated before its connection is checked out. If it stops part
+    way, running it again carries on. progress(registrations_done) is called after each
+    chunk. Returns totals: registrations, pets, amount_paid, refunded.
+    """
+    conn = get_db_connection()
+    if not conn:
+        raise Error("Database connection failed.")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT date, type FROM events WHERE event_id = %s", (event_id,))
+        row = cursor.fetchone()
+        if not row:
+            raise Error(f"Event {event_id} does not exist.")
+        event_date, event_type = row
+        cursor.execute("UPDATE events SET status = 0 WHERE event_id = %s", (event_id,))
+        conn.commit()
+        # Closed now, so this can only shrink (withdrawals) while the chunks run
+        cursor.execute("""
+            SELECT COUNT(*) FROM event_registration WHERE event_id = %s AND status = 'Paid'
+        """, (event_id,))
+        remaining = cursor.fetchone()[0]
+    except Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    invalidate_reference_data('events')
+    
+    totals = {'registrations': 0, 'pets': 0, 'amount_paid': 0.0, 'refunded': 0.0}
+    while remaining > 0:
+        log_ids = allocate_ids('participation_log', min(chunk_size, remaining))
+        cancelled = _cancel_event_chunk(event_id, event_type, event_date, reason, log_ids, totals)
+        if not cancelled:
+            break
+        remaining -= cancelled
+        if progress:
+            progress(totals['registrations'])
+    return totals
+
+
+class transfer(FormScreen):
     def __init__(self, preselected_event_id=None, owner_context=None):
         super(transfer, self).__init__()
-        loadUi('./gui/transfer.ui', self)
+        load_ui_form(self, 'transfer.ui')
         self.transexit.clicked.connect(self.gotostatus)
         self.tranferconbuut.clicked.connect(self.process_transfer)
         
@@ -4563,6 +7801,7 @@ class transfer(QDialog):
         self.selected_pet_ids = []  # Store all pet IDs for the registration
         self.event_from_dict = {}
         self.event_to_dict = {}
+        self.transfer_quote = None  # read-only quote for the selected destination
         
         # React when user changes either of the dropdowns
         self.eventfrom.currentIndexChanged.connect(self.on_event_from_selected)
@@ -4891,47 +8130,38 @@ class transfer(QDialog):
         
         event_data = self.event_to_dict[selected_text]
         
+        # One read-only quote feeds both the summary and the warning label
+        self.transfer_quote = None
+        quote_error = None
+        if self.selected_registration_id:
+            try:
+                self.transfer_quote = quote_transfer(self.selected_registration_id, event_data['event_id'])
+            except Error as err:
+                print(f"Error calculating payment: {err}")
+                quote_error = err
+        
         # Show the details of the event we're moving to
-        self.display_new_event(event_data)
+        self.display_new_event(event_data, self.transfer_quote)
         
         # See if we need to top up the payment and put a note in the label
-        if self.selected_registration_id:
-            conn = get_db_connection()
-            if conn:
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT total_amount_paid
-                        FROM event_registration
-                        WHERE registration_id = %s
-                    """, (self.selected_registration_id,))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        current_amount = result[0]
-                        new_fee = event_data['base_fee']
-                        
-                        if new_fee > current_amount:
-                            additional = new_fee - current_amount
-                            self.petwarningsize.setText(f"Additional ₱{additional:.2f} to be processed. Do you wish to proceed?")
-                        elif new_fee < current_amount:
-                            difference = current_amount - new_fee
-                            new_total = current_amount - difference
-                            self.petwarningsize.setText(f"Fee reduction: ₱{difference:.2f}. New total: ₱{new_total:.2f}. Do you wish to proceed?")
-                        else:
-                            self.petwarningsize.setText('No additional payment required.')
-                    else:
-                        self.petwarningsize.setText('Could not retrieve current payment amount.')
-                except Error as err:
-                    print(f"Error calculating payment: {err}")
-                    self.petwarningsize.setText(f'Error: {err}')
-                finally:
-                    if conn:
-                        conn.close()
-        else:
+        if not self.selected_registration_id:
             self.petwarningsize.setText('No registration selected.')
+        elif quote_error:
+            self.petwarningsize.setText(f'Error: {quote_error}')
+        else:
+            self.show_transfer_warning(self.transfer_quote)
+    
+    def show_transfer_warning(self, quote):
+        if not quote:
+            self.petwarningsize.setText('Could not retrieve current payment amount.')
+        elif quote['top_up'] > 0:
+            self.petwarningsize.setText(f"Additional ₱{quote['top_up']:.2f} to be processed. Do you wish to proceed?")
+        elif quote['refund'] > 0:
+            self.petwarningsize.setText(f"Fee reduction: ₱{quote['refund']:.2f}. New total: ₱{quote['new_total']:.2f}. Do you wish to proceed?")
+        else:
+            self.petwarningsize.setText('No additional payment required.')
     
-    def display_new_event(self, event_data):
+    def display_new_event(self, event_data, quote=None):
         """Show new event info plus any extra payment we might need."""
         self.newevent.clear()
         
@@ -4944,53 +8174,28 @@ class transfer(QDialog):
         self.newevent.addItem(f"Base Fee: ₱{event_data['base_fee']:.2f}")
         self.newevent.addItem(f"Max Participants: {event_data['max_participants']}")
         
-        # Work out the extra amount if the new event is pricier
-        if self.selected_registration_id:
-            conn = get_db_connection()
-            if conn:
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT total_amount_paid
-                        FROM event_registration
-                        WHERE registration_id = %s
-                    """, (self.selected_registration_id,))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        current_amount = result[0]
-                        new_fee = event_data['base_fee']
-                        
-                        self.newevent.addItem("")  # Empty line
-                        if new_fee > current_amount:
-                            additional = new_fee - current_amount
-                            self.newevent.addItem(f"Additional Payment Required: ₱{additional:.2f}")
-                            self.newevent.addItem(f"New Total: ₱{current_amount + additional:.2f}")
-                        elif new_fee < current_amount:
-                            # New event costs less - subtract the difference
-                            difference = current_amount - new_fee
-                            new_total = current_amount - difference
-                            self.newevent.addItem(f"Fee Reduction: ₱{difference:.2f}")
-                            self.newevent.addItem(f"New Total: ₱{new_total:.2f}")
-                        else:
-                            self.newevent.addItem("No additional payment required")
-                            self.newevent.addItem(f"Total: ₱{current_amount:.2f}")
-                    else:
-                        self.newevent.addItem("")  # Empty line
-                        self.newevent.addItem("Could not retrieve current payment")
-                except Error as err:
-                    print(f"Error calculating additional price: {err}")
-                    self.newevent.addItem("")  # Empty line
-                    self.newevent.addItem(f"Error: {err}")
-                finally:
-                    if conn:
-                        conn.close()
-        else:
-            self.newevent.addItem("")  # Empty line
+        self.newevent.addItem("")  # Empty line
+        if not self.selected_registration_id:
             self.newevent.addItem("No registration selected")
+        elif not quote:
+            self.newevent.addItem("Could not retrieve current payment")
+        elif quote['top_up'] > 0:
+            self.newevent.addItem(f"Additional Payment Required: ₱{quote['top_up']:.2f}")
+            self.newevent.addItem(f"New Total: ₱{quote['new_total']:.2f}")
+        elif quote['refund'] > 0:
+            # New event costs less - subtract the difference
+            self.newevent.addItem(f"Fee Reduction: ₱{quote['refund']:.2f}")
+            self.newevent.addItem(f"New Total: ₱{quote['new_total']:.2f}")
+        else:
+            self.newevent.addItem("No additional payment required")
+            self.newevent.addItem(f"Total: ₱{quote['amount_paid']:.2f}")
     
     def process_transfer(self):
-        """Actually move the registration over to the new event."""
+        """Actually move the registration over to the new event.
+
+        Quote, confirm, commit: no connection is open while the confirmation dialog waits
+        for the user, and the commit refuses if the registration changed in the meantime.
+        """
         self.petregiserr.setText('')
         
         if not self.eventfrom.currentText() or not self.transferto.currentText():
@@ -5004,180 +8209,69 @@ class transfer(QDialog):
             self.petregiserr.setText('Invalid event selection.')
             return
         
-        event_from = self.event_from_dict[event_from_text]
         event_to = self.event_to_dict[event_to_text]
         
-        # Check if additional payment is needed
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Get current amount paid
-                cursor.execute("""
-                    SELECT total_amount_paid
-                    FROM event_registration
-                    WHERE registration_id = %s
-                """, (self.selected_registration_id,))
+        try:
+            quote = quote_transfer(self.selected_registration_id, event_to['event_id'])
+            if not quote:
+                self.petregiserr.setText('Registration not found.')
+                return
+            
+            # Confirm any extra charge (connection already back in the pool)
+            if quote['top_up'] > 0:
+                from PyQt6.QtWidgets import QMessageBox
+                reply = QMessageBox.question(
+                    self, 
+                    'Additional Payment Required',
+                    f"Additional ₱{quote['top_up']:.2f} to be processed. Do you wish to proceed?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
                 
-                result = cursor.fetchone()
-                if not result:
-                    self.petregiserr.setText('Registration not found.')
-                    conn.close()
+                if reply != QMessageBox.StandardButton.Yes:
                     return
-                
-                current_amount = result[0]
-                new_fee = event_to['base_fee']
-                
-                # Calculate the fee difference
-                fee_difference = new_fee - current_amount
-                
-                # Calculate new total amount
-                if fee_difference > 0:
-                    # New event costs more - add the additional fees
-                    new_total_amount = current_amount + fee_difference
-                    additional = fee_difference
-                    # Show confirmation dialog
-                    from PyQt6.QtWidgets import QMessageBox
-                    reply = QMessageBox.question(
-                        self, 
-                        'Additional Payment Required',
-                        f'Additional ₱{additional:.2f} to be processed. Do you wish to proceed?',
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                    )
-                    
-                    if reply != QMessageBox.StandardButton.Yes:
-                        return
-                elif fee_difference < 0:
-                    # New event costs less - subtract the difference
-                    new_total_amount = current_amount + fee_difference  # fee_difference is negative, so this subtracts
-                    additional = 0.00
-                else:
-                    # Same price
-                    new_total_amount = current_amount
-                    additional = 0.00
-                
-                # Update payment with new total amount
-                from datetime import datetime
-                now = datetime.now()
-                payment_date = now.strftime("%Y-%m-%d")
-                payment_time = now.strftime("%H:%M:%S")
-                
-                cursor.execute("""
-                    UPDATE event_registration
-                    SET total_amount_paid = %s, payment_date = %s, payment_time = %s
-                    WHERE registration_id = %s
-                """, (new_total_amount, payment_date, payment_time, self.selected_registration_id))
-                
-                # Update event_registration to new event
-                cursor.execute("""
-                    UPDATE event_registration
-                    SET event_id = %s
-                    WHERE registration_id = %s
-                """, (event_to['event_id'], self.selected_registration_id))
-                
-                # Delete the original pet_event_entry entries (remove previous entry)
-                if hasattr(self, 'selected_pet_ids') and self.selected_pet_ids:
-                    for pet_id in self.selected_pet_ids:
-                        cursor.execute("""
-                            DELETE FROM pet_event_entry
-                            WHERE registration_id = %s AND pet_id = %s AND event_id = %s
-                        """, (self.selected_registration_id, pet_id, event_from['event_id']))
-                else:
-                    # Fallback to single pet
-                    cursor.execute("""
-                        DELETE FROM pet_event_entry
-                        WHERE registration_id = %s AND pet_id = %s AND event_id = %s
-                    """, (self.selected_registration_id, self.selected_pet_id, event_from['event_id']))
-                
-                # Create new pet_event_entry entries for the new event
-                # Get the starting entry ID once
-                cursor.execute("SELECT MAX(entry_id) FROM pet_event_entry")
-                max_entry_id = cursor.fetchone()[0]
-                next_entry_id = (max_entry_id if max_entry_id is not None else 0) + 1
-                
-                if hasattr(self, 'selected_pet_ids') and self.selected_pet_ids:
-                    for idx, pet_id in enumerate(self.selected_pet_ids):
-                        new_entry_id = next_entry_id + idx
-                        
-                        cursor.execute("""
-                            INSERT INTO pet_event_entry
-                            (entry_id, registration_id, pet_id, event_id, attendance_status)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """, (new_entry_id, self.selected_registration_id, pet_id, event_to['event_id'], 'Registered'))
-                else:
-                    # Fallback to single pet
-                    cursor.execute("""
-                        INSERT INTO pet_event_entry
-                        (entry_id, registration_id, pet_id, event_id, attendance_status)
-                        VALUES (%s, %s, %s, %s, %s)
-                    """, (next_entry_id, self.selected_registration_id, self.selected_pet_id, event_to['event_id'], 'Registered'))
-                
-                # Log the transfer
-                cursor.execute("SELECT MAX(log_id) FROM participation_log")
-                max_log_id = cursor.fetchone()[0]
-                new_log_id = (max_log_id if max_log_id is not None else 0) + 1
-                
-                from datetime import datetime
-                now = datetime.now()
-                action_date = now.strftime("%Y-%m-%d")
-                action_time = now.strftime("%H:%M:%S")
-                
-                # Calculate refund and top-up amounts
-                refund_amount = abs(fee_difference) if fee_difference < 0 else 0.00
-                top_up_amount = fee_difference if fee_difference > 0 else 0.00
-                
-                cursor.execute("""
-                    INSERT INTO participation_log
-                    (log_id, registration_id, action_type, action_date, action_time,
-                     original_event_id, new_event_id, reason, refund_amount, top_up_amount)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (new_log_id, self.selected_registration_id, 'Transferred', action_date, action_time,
-                      event_from['event_id'], event_to['event_id'], 'Event transfer', 
-                      refund_amount, top_up_amount))
-                
-                conn.commit()
-                
-                self.petregiserr.setText('Transfer successful!')
-                print(f"Successfully transferred registration {self.selected_registration_id} from event {event_from['event_id']} to {event_to['event_id']}")
-                
-                # Reload enrolled events to reflect the transfer
-                # This allows multiple transfers to work correctly
-                self.load_enrolled_events()
-                
-                # Clear the transfer to selection since event has changed
-                self.transferto.clear()
-                self.newevent.clear()
-                self.petwarningsize.setText('Transfer completed. Please select a new event to transfer to if needed.')
-                
-            except Error as err:
-                print(f"Database UPDATE Error (Transfer): {err}")
-                if conn:
-                    conn.rollback()
-                self.petregiserr.setText('Transfer failed: Database Error.')
-            except Exception as e:
-                print(f"Unexpected Error during transfer: {e}")
-                if conn:
-                    conn.rollback()
-                self.petregiserr.setText('An unexpected error occurred.')
-            finally:
-                if conn:
-                    conn.close()
-        else:
-            self.petregiserr.setText('Database connection failed.')
+            
+            transfer_registration(quote)
+        except QuoteChanged as changed:
+            # Show the new numbers; the user has to confirm again
+            self.display_new_event(event_to, changed.quote)
+            self.show_transfer_warning(changed.quote)
+            self.petregiserr.setText('This registration or its price changed. Please review and try again.'
+                                     if changed.quote else 'This registration can no longer be transferred.')
+            return
+        except EventFullError:
+            self.petregiserr.setText('Sorry, the new event is already full.')
+            return
+        except Error as err:
+            print(f"Database UPDATE Error (Transfer): {err}")
+            self.petregiserr.setText('Transfer failed: Database Error.')
+            return
+        except Exception as e:
+            print(f"Unexpected Error during transfer: {e}")
+            self.petregiserr.setText('An unexpected error occurred.')
+            return
+        
+        self.petregiserr.setText('Transfer successful!')
+        print(f"Successfully transferred registration {quote['registration_id']} from event {quote['from_event_id']} to {quote['to_event_id']}")
+        
+        # Reload enrolled events to reflect the transfer
+        # This allows multiple transfers to work correctly
+        self.load_enrolled_events()
+        
+        # Clear the transfer to selection since event has changed
+        self.transferto.clear()
+        self.newevent.clear()
+        self.petwarningsize.setText('Transfer completed. Please select a new event to transfer to if needed.')
 
     def gotostatus(self):
         """Navigate back to the status screen."""
-        stat = yourstatuss(self.owner_context)
-        widget.addWidget(stat)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(yourstatuss, self.owner_context)
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class withdraw(QDialog):
+class withdraw(FormScreen):
     def __init__(self, preselected_event_id=None, owner_context=None):
         super(withdraw, self).__init__()
-        loadUi('./gui/withdraw.ui', self)
+        load_ui_form(self, 'withdraw.ui')
         
         # Connect buttons
         self.withexit.clicked.connect(self.gotostatus)
@@ -5206,9 +8300,7 @@ class withdraw(QDialog):
 
     def gotostatus(self):
         """Navigate back to the status screen."""
-        stat = yourstatuss(self.owner_context)
-        widget.addWidget(stat)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(yourstatuss, self.owner_context)
 
     def load_owner_data(self):
         """Display the active owner's name."""
@@ -5363,36 +8455,6 @@ class withdraw(QDialog):
             finally:
                 conn.close()
 
-    def calculate_refund(self, event_date, amount_paid):
-        """Calculate refund amount based on days until event."""
-        from datetime import date
-        
-        event_dt = to_python_date(event_date)
-        if not event_dt:
-            event_dt = date.today()
-            
-        today = date.today()
-        days_until = (event_dt - today).days
-        
-        if days_until >= 14:
-            return {
-                'days_until': days_until,
-                'refund_amount': amount_paid,
-                'refund_text': "100% refund (14+ days before)"
-            }
-        elif days_until >= 4:
-            return {
-                'days_until': days_until,
-                'refund_amount': amount_paid * 0.5,
-                'refund_text': f"50% refund ({days_until} days before)"
-            }
-        else:
-            return {
-                'days_until': days_until,
-                'refund_amount': 0.0,
-                'refund_text': f"0% refund ({days_until} days before)"
-            }
-
     def display_current_entry_with_refund(self, data):
         """Show summary and refund calculation in the left list widget."""
         self.currententry.clear()
@@ -5401,47 +8463,40 @@ class withdraw(QDialog):
         base_fee = float(data['base_fee']) if data['base_fee'] is not None else 0.0
         self.currententry.addItem(f"Base Fee: ₱{base_fee:.2f}")
         
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT total_amount_paid, registration_date, payment_date
-                    FROM event_registration
-                    WHERE registration_id = %s
-                """, (self.selected_registration_id,))
-                
-                res = cursor.fetchone()
-                if res:
-                    amount_paid = float(res[0]) if res[0] is not None else 0.0
-                    reg_date = format_date_string(res[1])
-                    
-                    self.currententry.addItem("")
-                    self.currententry.addItem(f"Amount Paid: ₱{amount_paid:.2f}")
-                    self.currententry.addItem(f"Reg Date: {reg_date}")
-                    
-                    # Calculate Refund
-                    refund_info = self.calculate_refund(data['date'], amount_paid)
-                    
-                    self.currententry.addItem("")
-                    self.currententry.addItem("--- Refund Calculation ---")
-                    self.currententry.addItem(f"Days until event: {refund_info['days_until']}")
-                    self.currententry.addItem(f"Policy: {refund_info['refund_text']}")
-                    self.currententry.addItem("")
-                    self.currententry.addItem(f"Refund Amount: ₱{refund_info['refund_amount']:.2f}")
-                    
-                    # Update the yellow warning label
-                    if refund_info['refund_amount'] > 0:
-                        self.warningwithdrawal.setText(f"Refund: ₱{refund_info['refund_amount']:.2f} will be processed.")
-                    else:
-                        self.warningwithdrawal.setText("No refund available.")
-            except Error as err:
-                print(f"Error displaying refund: {err}")
-            finally:
-                conn.close()
+        try:
+            quote = quote_withdrawal(self.selected_registration_id)
+        except Error as err:
+            print(f"Error displaying refund: {err}")
+            return
+        if quote:
+            self.show_refund_quote(quote)
+
+    def show_refund_quote(self, quote):
+        amount_paid = float(quote['amount_paid'] or 0)
+        
+        self.currententry.addItem("")
+        self.currententry.addItem(f"Amount Paid: ₱{amount_paid:.2f}")
+        self.currententry.addItem(f"Reg Date: {format_date_string(quote['registration_date'])}")
+        
+        self.currententry.addItem("")
+        self.currententry.addItem("--- Refund Calculation ---")
+        self.currententry.addItem(f"Days until event: {quote['days_until']}")
+        self.currententry.addItem(f"Policy: {quote['refund_text']}")
+        self.currententry.addItem("")
+        self.currententry.addItem(f"Refund Amount: ₱{quote['refund_amount']:.2f}")
+        
+        # Update the yellow warning label
+        if quote['refund_amount'] > 0:
+            self.warningwithdrawal.setText(f"Refund: ₱{quote['refund_amount']:.2f} will be processed.")
+        else:
+            self.warningwithdrawal.setText("No refund available.")
 
     def process_withdrawal(self):
-        """Execute withdrawal: delete entry, update status, log transaction."""
+        """Quote the refund, confirm it, then cancel the registration in one short transaction.
+
+        Nothing is held open while the confirmation dialog is up; if the registration or the
+        refund changed by the time the user says yes, the new numbers are shown instead.
+        """
         if self.petregiserr: self.petregiserr.setText('')
         
         if not self.withdrawfrom.currentText() or not self.selected_registration_id:
@@ -5452,109 +8507,113 @@ class withdraw(QDialog):
         event_data = self.event_from_dict.get(txt)
         if not event_data: return
 
-        conn = get_db_connection()
-        if conn:
-            try:
-                cursor = conn.cursor()
-                
-                # Re-fetch amount for logging
-                cursor.execute("SELECT total_amount_paid, event_id FROM event_registration WHERE registration_id = %s", (self.selected_registration_id,))
-                res = cursor.fetchone()
-                amount_paid = float(res[0]) if res else 0.0
-                
-                refund_info = self.calculate_refund(event_data['date'], amount_paid)
-                
-                # Confirmation Dialog
-                from PyQt6.QtWidgets import QMessageBox
-                msg = (f"Are you sure you want to withdraw?\n\n"
-                       f"Event: {event_data['name']}\n"
-                       f"Refund: ₱{refund_info['refund_amount']:.2f}\n"
-                       f"({refund_info['refund_text']})")
-                
-                reply = QMessageBox.question(self, 'Confirm Withdrawal', msg, 
-                                           QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                
-                if reply != QMessageBox.StandardButton.Yes:
-                    return
+        try:
+            quote = quote_withdrawal(self.selected_registration_id)
+            if not quote:
+                if self.petregiserr: self.petregiserr.setText('This registration can no longer be withdrawn.')
+                return
+            
+            # Confirmation Dialog
+            from PyQt6.QtWidgets import QMessageBox
+            msg = (f"Are you sure you want to withdraw?\n\n"
+                   f"Event: {event_data['name']}\n"
+                   f"Refund: ₱{quote['refund_amount']:.2f}\n"
+                   f"({quote['refund_text']})")
+            
+            reply = QMessageBox.question(self, 'Confirm Withdrawal', msg, 
+                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            
+            if reply != QMessageBox.StandardButton.Yes:
+                return
 
-                # 1. Delete pet entries
-                if self.selected_pet_ids:
-                    for pet_id in self.selected_pet_ids:
-                        cursor.execute("DELETE FROM pet_event_entry WHERE registration_id = %s AND pet_id = %s", (self.selected_registration_id, pet_id))
-                
-                # 2. Update registration status
-                from datetime import datetime
-                now = datetime.now()
-                cancel_date = now.strftime("%Y-%m-%d")
-                
-                cursor.execute("UPDATE event_registration SET status = 'Cancelled', cancellation_date = %s WHERE registration_id = %s", (cancel_date, self.selected_registration_id))
-                
-                # 3. Log transaction
-                cursor.execute("SELECT MAX(log_id) FROM participation_log")
-                max_log = cursor.fetchone()[0]
-                new_log_id = (max_log if max_log is not None else 0) + 1
-                
-                action_date = now.strftime("%Y-%m-%d")
-                action_time = now.strftime("%H:%M:%S")
-                
-                cursor.execute("""
-                    INSERT INTO participation_log 
-                    (log_id, registration_id, action_type, action_date, action_time, 
-                     original_event_id, new_event_id, reason, refund_amount, top_up_amount)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (new_log_id, self.selected_registration_id, 'Cancelled', action_date, action_time,
-                      event_data['event_id'], None, 'Owner withdrew', refund_info['refund_amount'], 0.00))
-                
-                conn.commit()
-                
-                if self.petregiserr:
-                    self.petregiserr.setText(f"Withdrawal complete. Refund: ₱{refund_info['refund_amount']:.2f}")
-                
-                # Refresh UI
-                self.load_enrolled_events()
-                self.currententry.clear()
-                self.petandowner.clear()
-                self.warningwithdrawal.setText('Withdrawal completed.')
-                
-            except Error as err:
-                print(f"Withdrawal error: {err}")
-                if conn: conn.rollback()
-                if self.petregiserr: self.petregiserr.setText('Withdrawal failed.')
-            finally:
-                conn.close()
-        else:
-            if self.petregiserr: self.petregiserr.setText('Database connection failed.')
+            quote = withdraw_registration(quote)
+        except QuoteChanged as changed:
+            if changed.quote:
+                self.display_current_entry_with_refund(event_data)
+                if self.petregiserr: self.petregiserr.setText('The refund changed. Please review and try again.')
+            elif self.petregiserr:
+                self.petregiserr.setText('This registration can no longer be withdrawn.')
+            return
+        except Error as err:
+            print(f"Withdrawal error: {err}")
+            if self.petregiserr: self.petregiserr.setText('Withdrawal failed.')
+            return
+        
+        if self.petregiserr:
+            self.petregiserr.setText(f"Withdrawal complete. Refund: ₱{quote['refund_amount']:.2f}")
+        
+        # Refresh UI
+        self.load_enrolled_events()
+        self.currententry.clear()
+        self.petandowner.clear()
+        self.warningwithdrawal.setText('Withdrawal completed.')
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class status(QDialog):
     def __init__(self):
         super(status, self).__init__()
-        loadUi('./gui/status.ui', self)
+        load_ui_form(self, 'status.ui')
         self.exitbutt.clicked.connect(self.gotommenu)
 
     def gotommenu(self):
-        mmenu = mainmenu()
-        widget.addWidget(mmenu)
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        SCREENS.show(mainmenu)
 
 # --------------------------------------------------------------------------------------------------------------------
 
 # Main Application Entry Point
 if __name__ == '__main__':
+    # `python main.py --bench-table [rows]` times the report table model on synthetic rows (no DB needed)
+    if '--bench-table' in sys.argv:
+        args = sys.argv[sys.argv.index('--bench-table') + 1:]
+        benchmark_table_model(int(args[0]) if args and args[0].isdigit() else 100000)
+        sys.exit(0)
+
+    # `python main.py --compile-ui` is the build step for gui/compiled (add --force to rebuild everything)
+    if '--compile-ui' in sys.argv:
+        compile_ui_forms(force='--force' in sys.argv)
+        sys.exit(0)
+
     # 1. Ensure the SQLite database and all 10 tables with data are ready
     setup_database() 
+
+    # `python main.py --check-indexes` just EXPLAINs the hot queries and exits
+    if '--check-indexes' in sys.argv:
+        sys.exit(0 if print_index_report() else 1)
+
+    # `python main.py --import-scores EVENT_ID FILE.csv` imports judges' scores and prints the throughput
+    if '--import-scores' in sys.argv:
+        args = sys.argv[sys.argv.index('--import-scores') + 1:]
+        if len(args) < 2 or not args[0].isdigit():
+            print("usage: main.py --import-scores EVENT_ID FILE.csv")
+            sys.exit(2)
+        applied, errors, _ = import_scores(int(args[0]), args[1])
+        for line, message in errors:
+            print(f"line {line}: {message}")
+        sys.exit(1 if errors else 0)
+
+    # `python main.py --reconcile-finance [--fix]` checks the finance rollups against the raw tables
+    if '--reconcile-finance' in sys.argv:
+        sys.exit(0 if print_finance_reconciliation(fix='--fix' in sys.argv) else 1)
+
+    # `python main.py --refund-liability` prints what refunds would cost if everyone cancelled today
+    if '--refund-liability' in sys.argv:
+        print_refund_liability()
+        sys.exit(0)
+
     
     # 2. Run the PyQt application
     app = QApplication(sys.argv)
-    registerscreen = RegisterScreen()
     widget = QStackedWidget()
+    SCREENS = ScreenManager(widget)
 
-    widget.addWidget(registerscreen)
+    SCREENS.show(RegisterScreen)
     widget.setFixedHeight(796)
     widget.setFixedWidth(1246)
     widget.show()
 
+    app.aboutToQuit.connect(close_db_pool)
+
     try:
         sys.exit(app.exec())
     except Exception as e:
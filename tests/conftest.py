@@ -0,0 +1,67 @@
+"""Shared fixtures.
+
+Everything here needs PyQt6 and mysql-connector (main.py imports both). The database tests
+also need a MySQL server: they build a throwaway schema with bootstrap_database() (the
+app's own TEXT-column schema) and skip when the server can't be reached. Point them at a
+server with PETSHOW_TEST_DB_HOST / _USER / _PASSWORD; the schema name is
+PETSHOW_TEST_DATABASE (default pet_show_test) and it is dropped afterwards.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    pytest.importorskip('PyQt6.QtWidgets')
+    pytest.importorskip('mysql.connector')
+    import main
+    return main
+
+
+@pytest.fixture(scope='session')
+def qapp(app_module):
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def _test_db_config(main):
+    config = dict(main.DB_CONFIG)
+    for key in ('host', 'user', 'password'):
+        value = os.environ.get(f'PETSHOW_TEST_DB_{key.upper()}')
+        if value is not None:
+            config[key] = value
+    config['database'] = os.environ.get('PETSHOW_TEST_DATABASE', 'pet_show_test')
+    return config
+
+
+@pytest.fixture
+def db(app_module, monkeypatch):
+    """main, pointed at a freshly bootstrapped test schema (own pool, id allocator and caches)."""
+    main = app_module
+    config = _test_db_config(main)
+    server = {key: value for key, value in config.items() if key != 'database'}
+    try:
+        admin = main.mysql.connector.connect(**server)
+    except main.Error as err:
+        pytest.skip(f"MySQL server not available: {err}")
+    cursor = admin.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{config['database']}`")
+    cursor.execute(f"CREATE DATABASE `{config['database']}`")
+
+    monkeypatch.setattr(main, 'DB_CONFIG', config)
+    monkeypatch.setattr(main, '_DB_POOL', None)
+    monkeypatch.setattr(main, 'ID_ALLOCATOR', main.IdAllocator())
+    main.invalidate_reference_data()
+    main.bootstrap_database()
+    try:
+        yield main
+    finally:
+        main.close_db_pool()
+        main.invalidate_reference_data()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{config['database']}`")
+        admin.close()
@@ -0,0 +1,88 @@
+import threading
+from datetime import date
+
+# A fresh event with fewer spots than there are owners racing for it
+EVENT_ID = 100
+SPOTS = 3
+RACERS = 8
+
+
+def _add_small_event(main):
+    conn = main.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO events
+            (event_id, name, date, time, location, max_participants, registration_deadline,
+             type, status, base_registration_fee, extra_pet_discount)
+            VALUES (%s, 'Tiny Ring', '2025-12-20', '09:00', 'Hall C', %s, '2025-12-10', 'Show', 1, 100, 0)
+        """, (EVENT_ID, SPOTS))
+        conn.commit()
+    finally:
+        conn.close()
+    return {'event_id': EVENT_ID, 'name': 'Tiny Ring', 'base_fee': 100.0, 'extra_pet_discount': 0.0}
+
+
+def _add_owners_with_a_pet(main, count):
+    """One new owner per racer, each with a single pet; returns [(owner_id, pet dict)]."""
+    owner_ids = main.allocate_ids('owners', count)
+    pet_ids = main.allocate_ids('pets', count)
+    conn = main.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO owners (owner_id, first_name, last_name, email, contact_number)
+            VALUES (%s, 'Racer', %s, NULL, NULL)
+        """, [(owner_id, str(owner_id)) for owner_id in owner_ids])
+        cursor.executemany("""
+            INSERT INTO pets (pet_id, owner_id, name, actual_size_id, age, sex, weight_kg, muzzle_required)
+            VALUES (%s, %s, %s, 1, 3, 'F', 5.0, 0)
+        """, [(pet_id, owner_id, f'Pet {pet_id}') for owner_id, pet_id in zip(owner_ids, pet_ids)])
+        conn.commit()
+    finally:
+        conn.close()
+    return [(owner_id, {'pet_id': pet_id, 'name': f'Pet {pet_id}'}) for owner_id, pet_id in zip(owner_ids, pet_ids)]
+
+
+def test_racing_enrollments_never_oversell_an_event(db):
+    main = db
+    event = _add_small_event(main)
+    racers = _add_owners_with_a_pet(main, RACERS)
+
+    start = threading.Barrier(RACERS)
+    lock = threading.Lock()
+    outcomes = {'taken': 0, 'full': 0}
+    failures = []
+
+    def enroll(owner_id, pet):
+        start.wait()
+        try:
+            main.enroll_basket(owner_id, [(event, pet)], date(2025, 11, 1))
+            outcome = 'taken'
+        except main.EventFullError:
+            outcome = 'full'
+        except Exception as err:
+            with lock:
+                failures.append(err)
+            return
+        with lock:
+            outcomes[outcome] += 1
+
+    threads = [threading.Thread(target=enroll, args=racer) for racer in racers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert outcomes == {'taken': SPOTS, 'full': RACERS - SPOTS}
+    [(paid_entries,)] = main.run_query("""
+        SELECT COUNT(DISTINCT pee.pet_id)
+        FROM event_registration er
+        JOIN pet_event_entry pee ON er.registration_id = pee.registration_id
+        WHERE er.event_id = %s AND er.status = 'Paid'
+    """, (EVENT_ID,))
+    [(participants, max_participants)] = main.run_query(
+        "SELECT participants, max_participants FROM event_capacity WHERE event_id = %s", (EVENT_ID,))
+    assert paid_entries == participants
+    assert participants <= max_participants == SPOTS
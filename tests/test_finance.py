@@ -0,0 +1,48 @@
+from datetime import date
+
+
+def test_rollups_reconcile_on_the_bootstrap_text_schema(db):
+    main = db
+    # bootstrap_database() stores payment_date / action_date as TEXT; finance_rollup.day is a DATE
+    assert main.reconcile_finance_rollups() == []
+
+    event = {'event_id': 5, 'name': 'Dog & Owner Look-Alike', 'base_fee': 150.0, 'extra_pet_discount': 20.0}
+    [group] = main.enroll_basket(2, [(event, {'pet_id': 3, 'name': 'Luna'}), (event, {'pet_id': 4, 'name': 'Mochi'})],
+                                 date(2025, 11, 1))
+    main.transfer_registration(main.quote_transfer(group['registration_id'], 11))
+    # The seeded events are in the past; a catch-all tier for event 11 makes the withdrawal refund something
+    conn = main.get_db_connection()
+    try:
+        conn.cursor().execute("""
+            INSERT INTO refund_policy_tier (event_id, event_type, min_days_before, refund_percent)
+            VALUES (11, NULL, -100000, 50.00)
+        """)
+        conn.commit()
+    finally:
+        conn.close()
+    main.invalidate_reference_data('refund_policy')
+    quote = main.quote_withdrawal(group['registration_id'])
+    assert float(quote['refund_amount']) > 0
+    main.withdraw_registration(quote)
+
+    assert main.reconcile_finance_rollups() == []
+    assert main.print_finance_reconciliation() is True
+
+
+def test_reconcile_reports_and_fixes_a_drifted_rollup(db):
+    main = db
+    conn = main.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT event_id, day, revenue FROM finance_rollup ORDER BY event_id, day LIMIT 1")
+        event_id, day, revenue = cursor.fetchone()
+        cursor.execute("UPDATE finance_rollup SET revenue = revenue + 5 WHERE event_id = %s AND day = %s",
+                       (event_id, day))
+        conn.commit()
+    finally:
+        conn.close()
+
+    [(bad_event, bad_day, column, rolled, raw)] = main.reconcile_finance_rollups(fix=True)
+    assert (bad_event, bad_day, column) == (event_id, day, 'revenue')
+    assert float(rolled) == float(revenue) + 5 and float(raw) == float(revenue)
+    assert main.reconcile_finance_rollups() == []
@@ -0,0 +1,56 @@
+import threading
+from datetime import date
+
+
+def test_concurrent_kiosks_insert_without_clashing(db):
+    main = db
+    # One allocator per simulated kiosk, with small blocks so they refill while racing
+    kiosks = [main.IdAllocator(block_size=5) for _ in range(4)]
+    inserts_per_kiosk = 30
+    errors = []
+
+    def add_breeds(kiosk, kiosk_no):
+        try:
+            for n in range(inserts_per_kiosk):
+                breed_id = kiosk.next_id('breeds')
+                conn = main.get_db_connection()
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute("INSERT INTO breeds (breed_id, breed_name, size_id) VALUES (%s, %s, 3)",
+                                   (breed_id, f"Kiosk {kiosk_no} breed {n}"))
+                    conn.commit()
+                finally:
+                    conn.close()
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=add_breeds, args=(kiosk, kiosk_no))
+               for kiosk_no, kiosk in enumerate(kiosks)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    [(rows, distinct_ids)] = main.run_query(
+        "SELECT COUNT(*), COUNT(DISTINCT breed_id) FROM breeds WHERE breed_name LIKE %s", ('Kiosk %',))
+    assert rows == distinct_ids == len(kiosks) * inserts_per_kiosk
+
+
+def test_enroll_refills_ids_without_a_second_connection(db, monkeypatch):
+    main = db
+    # One connection and an empty allocator: a refill from inside the write transaction
+    # would wait on the pool for the whole checkout timeout and then fail
+    main.close_db_pool()
+    monkeypatch.setattr(main, '_DB_POOL', main.ConnectionPool(main.DB_CONFIG, pool_size=1, checkout_timeout=2.0))
+    monkeypatch.setattr(main, 'ID_ALLOCATOR', main.IdAllocator())
+
+    event = {'event_id': 5, 'name': 'Dog & Owner Look-Alike', 'base_fee': 150.0, 'extra_pet_discount': 20.0}
+    pet = {'pet_id': 4, 'name': 'Mochi'}
+    [group] = main.enroll_basket(2, [(event, pet)], date(2025, 11, 1))
+
+    assert main.get_pool_stats()['timeouts'] == 0
+    [(status, amount)] = main.run_query(
+        "SELECT status, total_amount_paid FROM event_registration WHERE registration_id = %s",
+        (group['registration_id'],))
+    assert status == 'Paid' and float(amount) == 150.0
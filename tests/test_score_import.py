@@ -0,0 +1,129 @@
+import csv
+import random
+from datetime import date
+
+EVENT_ID = 100
+PETS = 50
+PLACES = ['1st Place', '2nd Place', '3rd Place']
+# 10k rows: (kind, how many), shuffled together
+ROW_MIX = [('valid', 9000), ('unknown id', 400), ('bad id', 200), ('bad score', 200), ('out of range', 200)]
+
+
+def _add_scored_event(main):
+    """An event with PETS entries (one owner enrolls them all) and unassigned placement awards."""
+    [owner_id] = main.allocate_ids('owners', 1)
+    pet_ids = main.allocate_ids('pets', PETS)
+    award_ids = main.allocate_ids('awards', len(PLACES))
+    conn = main.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO events
+            (event_id, name, date, time, location, max_participants, registration_deadline,
+             type, status, base_registration_fee, extra_pet_discount)
+            VALUES (%s, 'Agility Finals', '2025-12-20', '09:00', 'Main Ring', %s, '2025-12-10', 'Agility', 1, 100, 0)
+        """, (EVENT_ID, PETS))
+        cursor.execute("""
+            INSERT INTO owners (owner_id, first_name, last_name, email, contact_number)
+            VALUES (%s, 'Kennel', 'Club', NULL, NULL)
+        """, (owner_id,))
+        cursor.executemany("""
+            INSERT INTO pets (pet_id, owner_id, name, actual_size_id, age, sex, weight_kg, muzzle_required)
+            VALUES (%s, %s, %s, 1, 3, 'M', 12.0, 0)
+        """, [(pet_id, owner_id, f'Pet {pet_id}') for pet_id in pet_ids])
+        cursor.executemany("""
+            INSERT INTO awards (award_id, pet_id, is_special, award_name, description, date, event_id)
+            VALUES (%s, NULL, 0, %s, NULL, '2025-12-20', %s)
+        """, [(award_id, name, EVENT_ID) for award_id, name in zip(award_ids, PLACES)])
+        conn.commit()
+    finally:
+        conn.close()
+
+    event = {'event_id': EVENT_ID, 'name': 'Agility Finals', 'base_fee': 100.0, 'extra_pet_discount': 0.0}
+    main.enroll_basket(owner_id, [(event, {'pet_id': pet_id, 'name': f'Pet {pet_id}'}) for pet_id in pet_ids],
+                       date(2025, 11, 1))
+    entries = dict(main.run_query("SELECT entry_id, pet_id FROM pet_event_entry WHERE event_id = %s", (EVENT_ID,)))
+    return entries, award_ids
+
+
+def _write_scores(path, entry_ids):
+    """The judges' file; returns ({entry_id: final score}, line numbers of the bad rows)."""
+    rng = random.Random(17)
+    kinds = [kind for kind, count in ROW_MIX for _ in range(count)]
+    rng.shuffle(kinds)
+    final, bad_lines = {}, []
+    with open(path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['entry_id', 'score'])
+        for line, kind in enumerate(kinds, start=2):
+            entry_id = rng.choice(entry_ids)
+            score = f"{rng.uniform(0, 10):.2f}"
+            if kind == 'unknown id':
+                entry_id = 900000 + line
+            elif kind == 'bad id':
+                entry_id = 'ENTRY'
+            elif kind == 'bad score':
+                score = 'DNF'
+            elif kind == 'out of range':
+                score = '12.50'
+            writer.writerow([entry_id, score])
+            if kind == 'valid':
+                final[entry_id] = float(score)   # a later row for the same entry wins
+            else:
+                bad_lines.append(line)
+    return final, bad_lines
+
+
+class _CountingConnection:
+    """Pass-through connection that counts commits."""
+
+    def __init__(self, conn, counts):
+        self._conn = conn
+        self._counts = counts
+
+    def commit(self):
+        self._counts['commits'] += 1
+        self._conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_ten_thousand_row_import(db, tmp_path, monkeypatch, record_property):
+    main = db
+    entries, award_ids = _add_scored_event(main)
+    final, bad_lines = _write_scores(tmp_path / 'scores.csv', sorted(entries))
+    leaderboard = main.load_leaderboard(EVENT_ID)
+
+    counts = {'connections': 0, 'commits': 0, 'placement passes': 0}
+    get_db_connection = main.get_db_connection
+    placement_changes = main.PlacementLeaderboard.placement_changes
+
+    def counting_connection():
+        counts['connections'] += 1
+        return _CountingConnection(get_db_connection(), counts)
+
+    def counting_placement_changes(self):
+        counts['placement passes'] += 1
+        return placement_changes(self)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main, 'get_db_connection', counting_connection)
+        patch.setattr(main.PlacementLeaderboard, 'placement_changes', counting_placement_changes)
+        applied, errors, elapsed = main.import_scores(EVENT_ID, str(tmp_path / 'scores.csv'), leaderboard)
+    record_property('score_import_seconds', round(elapsed, 3))
+    print(f"10k-row score import: {elapsed:.2f} s")
+
+    assert applied == dict(ROW_MIX)['valid']
+    assert [line for line, _ in errors] == bad_lines
+    assert counts == {'connections': 1, 'commits': 1, 'placement passes': 1}
+
+    stored = dict(main.run_query(
+        "SELECT entry_id, pet_result FROM pet_event_entry WHERE event_id = %s AND pet_result IS NOT NULL",
+        (EVENT_ID,)))
+    assert {entry_id: float(score) for entry_id, score in stored.items()} == final
+    # Highest score first, ties to the earlier entry
+    podium = sorted(final, key=lambda entry_id: (-final[entry_id], entry_id))[:len(PLACES)]
+    holders = dict(main.run_query(
+        "SELECT award_id, pet_id FROM awards WHERE event_id = %s", (EVENT_ID,)))
+    assert [holders[award_id] for award_id in award_ids] == [entries[entry_id] for entry_id in podium]
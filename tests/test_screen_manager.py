@@ -0,0 +1,51 @@
+def test_navigation_keeps_the_widget_count_bounded(qapp, app_module):
+    main = app_module
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    from PyQt6.QtWidgets import QApplication, QDialog, QStackedWidget
+
+    menus = [type(f'Menu{n}', (QDialog,), {}) for n in range(6)]
+    forms = [type(f'Form{n}', (main.FormScreen,), {}) for n in range(3)]
+    stack = QStackedWidget()
+    manager = main.ScreenManager(stack, max_cached=4)
+
+    def tour(owner_id):
+        for menu in menus:
+            manager.show(menu)
+            for form in forms:
+                manager.show(form, {'owner_id': owner_id})
+                manager.back()
+        # Evicted screens go through deleteLater(); let Qt actually delete them
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    tour(1)
+    baseline = len(QApplication.allWidgets())
+    for round_no in range(50):
+        tour(round_no % 3)
+        assert stack.count() <= manager.max_cached
+        assert len(QApplication.allWidgets()) <= baseline
+
+    stats = manager.stats()
+    assert stats['cached'] <= manager.max_cached
+    assert stats['reused'] > 0 and stats['evicted'] > 0
+    stack.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def test_form_screens_are_rebuilt_and_menus_reused(qapp, app_module):
+    main = app_module
+    from PyQt6.QtWidgets import QDialog, QStackedWidget
+
+    class Menu(QDialog):
+        pass
+
+    class Form(main.FormScreen):
+        pass
+
+    stack = QStackedWidget()
+    manager = main.ScreenManager(stack)
+    menu = manager.show(Menu)
+    form = manager.show(Form)
+    assert manager.back() is menu
+    assert manager.show(Form) is not form
+    assert manager.show(Menu) is menu
+    stack.deleteLater()
@@ -0,0 +1,70 @@
+from datetime import date
+
+# Seeded event 5 (nobody enrolled yet): (event_id, base fee, extra-pet discount).
+# Transfers below go to event 11 (140 / 20 discount) and event 3 (250 / 40 discount).
+LOOK_ALIKE = (5, 150.0, 20.0)
+
+
+def _event(event_id, base_fee, extra_pet_discount):
+    return {'event_id': event_id, 'name': f'Event {event_id}',
+            'base_fee': base_fee, 'extra_pet_discount': extra_pet_discount}
+
+
+def _enroll(main, owner_id, event, *pet_ids):
+    """One registration holding all the given pets; returns its registration_id."""
+    items = [(_event(*event), {'pet_id': pet_id, 'name': f'Pet {pet_id}'}) for pet_id in pet_ids]
+    [group] = main.enroll_basket(owner_id, items, date(2025, 11, 1))
+    return group['registration_id']
+
+
+def _amount_paid(main, registration_id):
+    [(amount,)] = main.run_query(
+        "SELECT total_amount_paid FROM event_registration WHERE registration_id = %s", (registration_id,))
+    return float(amount)
+
+
+def _rollup_revenue(main, event_id):
+    [(revenue,)] = main.run_query(
+        "SELECT COALESCE(SUM(revenue), 0) FROM finance_rollup WHERE event_id = %s", (event_id,))
+    return float(revenue)
+
+
+def test_two_pet_registration_is_priced_per_pet_on_transfer(db):
+    main = db
+    # Luna and Mochi together: 150 + (150 - 20)
+    registration_id = _enroll(main, 2, LOOK_ALIKE, 3, 4)
+    assert _amount_paid(main, registration_id) == 280.0
+    revenue_from, revenue_to = _rollup_revenue(main, 5), _rollup_revenue(main, 11)
+
+    quote = main.quote_transfer(registration_id, 11)
+    # Photo booth for two pets: 140 + (140 - 20), not a single 140 base fee
+    assert float(quote['new_total']) == 260.0
+    assert float(quote['refund']) == 20.0 and float(quote['top_up']) == 0.0
+    main.transfer_registration(quote)
+
+    assert _amount_paid(main, registration_id) == 260.0
+    [(refund, top_up)] = main.run_query("""
+        SELECT refund_amount, top_up_amount FROM participation_log
+        WHERE registration_id = %s AND action_type = 'Transferred'
+    """, (registration_id,))
+    assert (float(refund), float(top_up)) == (20.0, 0.0)
+    assert _rollup_revenue(main, 5) == revenue_from - 280.0
+    assert _rollup_revenue(main, 11) == revenue_to + 260.0
+
+
+def test_relocation_prices_each_registration_by_its_own_pets(db):
+    main = db
+    pair = _enroll(main, 2, LOOK_ALIKE, 3, 4)   # 280 paid
+    single = _enroll(main, 4, LOOK_ALIKE, 6)    # 150 paid
+
+    moves, skipped = main.relocate_event_entrants(5, 3)
+
+    assert skipped == {}
+    by_registration = {move['registration_id']: move for move in moves}
+    # Obedience: 250 for the first pet, 210 for the second
+    assert float(by_registration[pair]['new_total']) == 460.0
+    assert float(by_registration[pair]['top_up']) == 180.0
+    assert float(by_registration[single]['new_total']) == 250.0
+    assert float(by_registration[single]['top_up']) == 100.0
+    assert _amount_paid(main, pair) == 460.0
+    assert _amount_paid(main, single) == 250.0